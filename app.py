@@ -2,8 +2,8 @@
 import streamlit as st
 import pandas as pd
 import os
-import subprocess
 from components.header import render_header
+from components.job_panel import render_job_panel
 from tools.data_loader import (
     load_data_universal,
     load_franchise_map,
@@ -42,55 +42,16 @@ logos_path = os.path.join(data_dir, "team_logos.json")
 # ----------------------------
 # 🔁 REFRESH DATA BUTTON
 # ----------------------------
+# Both refreshes run as background jobs (tools/jobs.py): one at a time per
+# job type across all sessions, with live progress, log and cancel.
 st.markdown("### 🔄 Data Controls")
-if st.button("Fetch Latest Yahoo Data"):
-    with st.spinner("Fetching data from Yahoo Fantasy API..."):
-        try:
-            subprocess.run(["python3", "fetch_yahoo_data.py"], check=True)
-            st.success("✅ Data refreshed successfully! Please reload the app.")
-        except Exception as e:
-            st.error(f"❌ Error fetching data: {e}")
+render_job_panel("fetch_latest", "Fetch Latest Yahoo Data")
 
 # ----------------------------
 # 🕒 SYNC FULL HISTORY
 # ----------------------------
 st.markdown("### 📚 Historical Sync")
-
-if st.button("🔄 Sync Full Yahoo History"):
-    with st.spinner("Syncing all historical Yahoo data..."):
-        try:
-            # 1) Fetch raw history
-            fetch = subprocess.run(
-                ["python3", "scripts/fetch_historical_data.py"],
-                capture_output=True,
-                text=True
-            )
-
-            # 2) Validate raw history
-            validate = subprocess.run(
-                ["python3", "scripts/validate_historical_data.py"],
-                capture_output=True,
-                text=True
-            )
-
-            # 3) Process into combined tables
-            process = subprocess.run(
-                ["python3", "scripts/process_historical_data.py"],
-                capture_output=True,
-                text=True
-            )
-
-            st.success("✅ Historical sync complete!")
-
-            with st.expander("Fetch Log"):
-                st.code(fetch.stdout + fetch.stderr, language="bash")
-            with st.expander("Validation Log"):
-                st.code(validate.stdout + validate.stderr, language="bash")
-            with st.expander("Processing Log"):
-                st.code(process.stdout + process.stderr, language="bash")
-
-        except Exception as e:
-            st.error(f"❌ Error during historical sync: {e}")
+render_job_panel("sync_history", "🔄 Sync Full Yahoo History")
 
 # ----------------------------
 # 🏈 HEADER
@@ -0,0 +1,31 @@
+import streamlit as st
+
+from tools.data_loader import load_data_universal, load_materialized, load_percentile_index
+from tools.aggregates import team_week_zscores
+from tools.percentile_index import PercentileIndex
+
+ERA_COLS = ["season", "week", "team", "manager", "points_for", "z_week", "z_season",
+            "era_adjusted_pf", "percentile", "one_in"]
+
+
+def era_adjusted_top(n: int):
+    """Top ``n`` team-weeks by z_season with their all-time percentile and 1-in-N rarity."""
+    # team_week_z table from tools/aggregates.py; computed from scores if not materialized
+    z = load_materialized("team_week_z")
+    if z.empty:
+        z = team_week_zscores(load_data_universal()[0])
+    z_index = load_percentile_index("z_season")
+    if not len(z_index):
+        z_index = PercentileIndex.from_table(z, "z_season")
+    return z.nlargest(n, "z_season").assign(
+        percentile=lambda d: (100 * z_index.percentile(d["z_season"])).round(2),
+        one_in=lambda d: z_index.rarity(d["z_season"]).round(0).astype(int),
+    )
+
+
+def render_era_records(n: int, title: str):
+    """Era-adjusted team-week records table, shared by Historical Records and the Record Book."""
+    era = era_adjusted_top(n)
+    st.subheader(title)
+    st.caption("Scores normalized to their season's scoring level; era_adjusted_pf restates them at the all-time average level.")
+    st.dataframe(era[ERA_COLS], hide_index=True, width="stretch")
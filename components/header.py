@@ -1,6 +1,8 @@
 
 import streamlit as st
 
+from components.job_panel import render_job_indicator
+
 def render_header(title: str = "GFN XV"):
     st.markdown(
         f"""
@@ -10,3 +12,5 @@ def render_header(title: str = "GFN XV"):
         </div>
         """, unsafe_allow_html=True
     )
+    # Background refreshes (tools/jobs.py) are visible from every page
+    render_job_indicator()
@@ -0,0 +1,79 @@
+import streamlit as st
+
+from tools import jobs
+
+STATE_ICONS = {
+    "idle": "⚪",
+    "queued": "⏳",
+    "running": "🔄",
+    "cancelling": "⛔",
+    "succeeded": "✅",
+    "failed": "❌",
+    "cancelled": "⛔",
+}
+
+
+def _status_line(status: dict) -> str:
+    icon = STATE_ICONS.get(status.get("state"), "•")
+    line = f"{icon} **{status.get('state', 'idle').title()}**"
+    if status.get("step_name"):
+        line += f" — step {status.get('step')}/{status.get('steps')}: {status['step_name']}"
+    if status.get("finished_at"):
+        line += f" (finished {status['finished_at']})"
+    elif status.get("started_at"):
+        line += f" (started {status['started_at']})"
+    return line
+
+
+@st.fragment(run_every=2)
+def _live_job(job_type: str):
+    # Reruns on its own every 2s without rerunning (or blocking) the rest of the page
+    status = jobs.read_status(job_type)
+    st.markdown(_status_line(status))
+    st.progress(float(status.get("progress") or 0.0))
+    if st.button("Cancel", key=f"cancel_{job_type}", disabled=status.get("state") == "cancelling"):
+        jobs.cancel_job(job_type)
+    st.code(jobs.tail_log(job_type, lines=40) or "(waiting for output)", language="bash")
+    if status.get("state") not in jobs.ACTIVE_STATES:
+        st.rerun()
+
+
+def render_job_panel(job_type: str, button_label: str):
+    """Start button plus live status / log for one background job."""
+    status = jobs.read_status(job_type)
+    running = status.get("state") in jobs.ACTIVE_STATES
+    # e.g. the scheduler's refresh_current holds the pipeline while a full sync is requested
+    busy = jobs.active_in_group(job_type)
+    if busy and not running:
+        st.caption(f"⏳ Waiting for “{jobs.JOBS[busy]['label']}” to finish.")
+
+    if st.button(button_label, key=f"start_{job_type}", disabled=running or bool(busy)):
+        started, status = jobs.start_job(job_type)
+        if not started:
+            st.info("This job is already running (started from another session).")
+        running = status.get("state") in jobs.ACTIVE_STATES and status.get("job") == job_type
+
+    if running:
+        _live_job(job_type)
+    elif status.get("state") != "idle":
+        st.markdown(_status_line(status))
+        if status.get("error"):
+            st.error(status["error"])
+        with st.expander("Last run log"):
+            st.code(jobs.tail_log(job_type) or "(no output)", language="bash")
+
+
+@st.fragment(run_every=5)
+def _job_indicator():
+    for job_type, spec in jobs.JOBS.items():
+        status = jobs.read_status(job_type)
+        if status.get("state") in jobs.ACTIVE_STATES:
+            st.caption(f"{STATE_ICONS[status['state']]} {spec['label']}: "
+                       f"step {status.get('step') or 0}/{status.get('steps')}")
+            st.progress(float(status.get("progress") or 0.0))
+
+
+def render_job_indicator():
+    """Sidebar note for any running job, so every page shows refresh progress."""
+    with st.sidebar:
+        _job_indicator()
@@ -2,8 +2,9 @@ import streamlit as st
 import pandas as pd
 import json
 import os
-from tools.data_loader import load_data_universal
-from tools.fetch_nfl_matchups import should_refresh, fetch_nfl_matchups
+from tools.data_loader import load_data_universal, load_materialized, load_projection_error_sd
+from tools.standings import standings_as_of
+from tools.win_probability import win_probabilities
 
 # -------------------------------
 # Page Config
@@ -29,12 +30,15 @@ if os.path.exists(TEAM_LOGOS_FILE):
     with open(TEAM_LOGOS_FILE, "r") as f:
         TEAM_LOGOS = json.load(f)
 
-# Refresh NFL data if needed
-if should_refresh(NFL_FILE, days=3):
-    fetch_nfl_matchups()
-
-with open(NFL_FILE, "r") as f:
-    nfl_matchups = json.load(f)
+# NFL matchups are kept fresh by scripts/refresh_scheduler.py; the page only reads them
+# (an unreadable or half-written file just shows the "no schedule" hint below)
+try:
+    with open(NFL_FILE, "r") as f:
+        nfl_matchups = json.load(f)
+except (OSError, ValueError):
+    nfl_matchups = []
+if not isinstance(nfl_matchups, list):
+    nfl_matchups = []
 
 
 # -------------------------------
@@ -127,7 +131,29 @@ def calculate_standings(scores_df: pd.DataFrame):
     return df_out
 
 
-standings_df = calculate_standings(df_scores)
+# Prefer the precomputed as-of standings cube (scripts/materialize_aggregates.py)
+cube = load_materialized("standings_cube", data_dir=DATA_DIR)
+if not cube.empty:
+    cube_season = int(cube["season"].max())
+    cube_weeks = sorted(cube.loc[cube["season"] == cube_season, "week"].unique().tolist())
+    as_of_week = st.sidebar.select_slider("Standings as of week", options=cube_weeks, value=cube_weeks[-1])
+    as_of = standings_as_of(cube, cube_season, as_of_week)
+    standings_df = pd.DataFrame({
+        "Logo": as_of["team"].map(TEAM_LOGOS).fillna(""),
+        "Team": as_of["team"],
+        "W": as_of["wins"],
+        "L": as_of["losses"],
+        "PF": as_of["pf"].round(2),
+        "PA": as_of["pa"].round(2),
+        "Streak": as_of["streak"],
+    })
+    # EWMA scoring form from the momentum table (tools/momentum.py)
+    mom = load_materialized("momentum", data_dir=DATA_DIR)
+    if not mom.empty:
+        form = mom[(mom["season"] == cube_season) & (mom["week"] == as_of["week"].max())]
+        standings_df["Form"] = as_of["team_key"].map(form.set_index("team_key")["pf_ewm"]).round(1)
+else:
+    standings_df = calculate_standings(df_scores)
 
 
 # -------------------------------
@@ -203,6 +229,19 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# --- Live Win Probability (tools/win_probability.py; recomputed on every refresh) ---
+live = win_probabilities(df_scores, sigma=load_projection_error_sd(DATA_DIR)) if "team_key" in df_scores.columns else pd.DataFrame()
+if not live.empty:
+    st.markdown(f"### 📡 Week {int(live['week'].iloc[0])} Win Probability")
+    games = live[live["team_key"].astype(str) < live["opponent_key"].astype(str)] if "opponent_key" in live.columns else live
+    cols = st.columns(min(len(games), 3) or 1)
+    for i, (_, g) in enumerate(games.iterrows()):
+        with cols[i % len(cols)]:
+            p = float(g["win_prob"])
+            st.markdown(f"**{g['team']}** {g['points_for']:.1f} · proj {g['projected_points']:.1f}  \n"
+                        f"**{g['opponent']}** — {100 * (1 - p):.0f}%")
+            st.progress(p, text=f"{g['team']} {100 * p:.0f}%")
+
 # --- Layout: Standings + NFL Matchups ---
 col1, col2 = st.columns([0.68, 0.32], gap="large")
 
@@ -222,6 +261,8 @@ with col1:
 
 with col2:
     st.markdown("### 🏈 NFL Week Matchups")
+    if not nfl_matchups:
+        st.info("No NFL schedule yet. Start scripts/refresh_scheduler.py to keep it updated.")
     for game in nfl_matchups:
         st.markdown(
             f"""
@@ -1,21 +1,26 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from tools.data_loader import load_player_stats, seasons_available
+import json
+import os
+from tools.data_loader import load_roster_composition, load_rosters, load_team_names
+from tools.roster_composition import team_week, position_trends
 
-# Load latest available player stats automatically
-DATA_DIR = "data"
-years = seasons_available(DATA_DIR)
-latest_year = max(years) if years else 2025
-ps_latest = load_player_stats(DATA_DIR, latest_year)
+TEAM_LOGOS_FILE = os.path.join("data", "team_logos.json")
 
-if ps_latest is None or ps_latest.empty:
-    st.error(f"⚠️ No player stats found in {DATA_DIR}. Please run fetch_yahoo_data.py or check your data folder.")
-else:
-    latest_week = ps_latest["week"].max()
-    ps_latest = ps_latest[ps_latest["week"] == latest_week]
+# Team name -> Yahoo logo URL
+TEAM_LOGOS = {}
+if os.path.exists(TEAM_LOGOS_FILE):
+    with open(TEAM_LOGOS_FILE, "r") as f:
+        TEAM_LOGOS = json.load(f)
+
+# (season, week, team, position, slot) cube precomputed by materialize_aggregates.py
+cube = load_roster_composition()
 
-    teams = sorted(ps_latest["team_name"].dropna().unique())
+if cube is None or cube.empty:
+    st.error("⚠️ No roster data found. Please run scripts/process_historical_data.py or check your data folder.")
+else:
+    names = load_team_names()
 
     color_map = {
         "QB": "#F4A261",
@@ -24,9 +29,21 @@ else:
         "TE": "#F9C74F",
         "FLEX": "#90BE6D",
         "K": "#577590",
-        "DEF": "#B5838D"
+        "DEF": "#B5838D",
+        "Other": "#ADB5BD",
     }
-    order = ["QB", "RB", "WR", "TE", "FLEX", "K", "DEF"]
+    order = ["QB", "RB", "WR", "TE", "FLEX", "K", "DEF", "Other"]
+
+    seasons = sorted(cube["season"].unique().tolist())
+    c1, c2 = st.columns(2)
+    season = c1.selectbox("Season", seasons, index=len(seasons) - 1)
+    weeks = sorted(cube.loc[cube["season"] == season, "week"].unique().tolist())
+    week = c2.selectbox("Week", weeks, index=len(weeks) - 1)
+
+    # One slice of the cube for every card; player rows are filtered once for the week
+    comp_by_team = team_week(cube, season, week).reindex(columns=order, fill_value=0)
+    roster_week = load_rosters(season, week)
+    teams = sorted(comp_by_team.index, key=lambda k: str(names["team"].get(k, k)) if not names.empty else k)
 
     # Iterate over teams in pairs for two cards per row
     for i in range(0, len(teams), 2):
@@ -35,19 +52,12 @@ else:
             idx = i + j
             if idx >= len(teams):
                 break
-            team = teams[idx]
-            g = ps_latest[ps_latest["team_name"] == team].copy()
-
-            logo = g["team_logo"].iloc[0] if "team_logo" in g.columns and pd.notna(g["team_logo"].iloc[0]) else ""
-            manager_name = g["manager_name"].iloc[0] if "manager_name" in g.columns and pd.notna(g["manager_name"].iloc[0]) else None
-
-            # Compute roster composition
-            comp = (
-                g["position"]
-                .replace({"D/ST": "DEF", "DST": "DEF"})
-                .value_counts()
-                .reindex(order, fill_value=0)
-            )
+            team_key = teams[idx]
+            team = names["team"].get(team_key, team_key) if not names.empty else team_key
+            manager_name = names["manager"].get(team_key) if not names.empty else None
+            logo = TEAM_LOGOS.get(team, "")
+
+            comp = comp_by_team.loc[team_key]
             comp = comp[comp > 0]
 
             fig = px.pie(
@@ -82,9 +92,9 @@ else:
                         backdrop-filter: blur(6px);
                         margin-bottom: 12px;
                     ">
-                        {"<img src='" + logo + "' style='width:60px; height:auto; border-radius:8px; object-fit:cover; border:1px solid #e5e5e5; margin-bottom:6px;'/>" if isinstance(logo,str) and logo.startswith("http") else "<div style='font-size:48px; margin-bottom:6px;'>🏈</div>"}
+                        {"<img src='" + logo + "' style='width:60px; height:auto; border-radius:8px; object-fit:cover; border:1px solid #e5e5e5; margin-bottom:6px;'/>" if isinstance(logo, str) and logo.startswith("http") else "<div style='font-size:48px; margin-bottom:6px;'>🏈</div>"}
                         <div style="font-weight:700; font-size:18px; margin-bottom:2px;">{team}</div>
-                        <div style="font-size:12px; color:#555; margin-bottom:8px;">{manager_name if manager_name else ''}</div>
+                        <div style="font-size:12px; color:#555; margin-bottom:8px;">{manager_name if isinstance(manager_name, str) else ''}</div>
                     </div>
                 """, unsafe_allow_html=True)
 
@@ -92,16 +102,27 @@ else:
                     fig,
                     width="stretch",
                     config={"displayModeBar": False, "responsive": True},
-                    key=f"{team}_{idx}_chart"
+                    key=f"{team_key}_{idx}_chart"
                 )
 
-                display_df = g[["player_name", "position", "nfl_team"]].rename(
+                g = roster_week[roster_week["team_key"] == team_key]
+                display_df = g[["player_name", "position", "selected_position", "nfl_team"]].rename(
                     columns={
                         "player_name": "Player",
                         "position": "Position",
+                        "selected_position": "Slot",
                         "nfl_team": "NFL Team",
                     }
                 ).sort_values(by=["Position", "Player"])
 
                 # Small transparent table styling
-                st.dataframe(display_df, hide_index=True, width="stretch", height=180, column_order=None)
\ No newline at end of file
+                st.dataframe(display_df, hide_index=True, width="stretch", height=180, column_order=None)
+
+    # Roster construction across every season, straight from the cube
+    st.subheader("Roster Construction Trends")
+    trends = position_trends(cube)
+    fig = px.line(trends, x="season", y="rostered_per_team", color="position", markers=True,
+                  color_discrete_map=color_map, title="Players rostered per team-week by position")
+    st.plotly_chart(fig, width="stretch", key="composition_trends")
+    st.dataframe(trends.pivot_table(index="season", columns="position", values="rostered_per_team"),
+                 width="stretch")
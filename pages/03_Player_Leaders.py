@@ -6,7 +6,8 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_player_points, load_player_index,
 )
 from components.header import render_header
 
@@ -15,12 +16,38 @@ render_header("Goodell For Nothing XV")
 
 st.title("🏅 Player Leaders")
 
-seasons = seasons_available("data", pattern="player_stats_*.csv")
+# Career index keyed by player_id (tools/player_index.py)
+index = load_player_index()
+if index is not None and len(index):
+    players = index.players
+    st.subheader("Career Leaders (All Seasons)")
+    metric = "points" if players["points"].notna().any() else "weeks_started"
+    st.dataframe(players.nlargest(25, metric)[["name","position","first_season","last_season","seasons",
+                                             "teams","weeks","weeks_started","weeks_benched","points"]],
+                 hide_index=True, width="stretch")
+
+    st.subheader("Player Lookup")
+    players = players.sort_values(["name","player_id"])
+    labels = dict(zip(players["player_id"], players["name"] + " (" + players["first_season"].astype(str)
+                                               + "–" + players["last_season"].astype(str) + ")"))
+    pid = st.selectbox("Player", list(labels), format_func=labels.get)
+    row = players[players["player_id"]==pid].iloc[0]
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Seasons", int(row["seasons"]))
+    m2.metric("Fantasy teams", int(row["teams"]))
+    m3.metric("Started / benched", f"{int(row['weeks_started'])} / {int(row['weeks_benched'])}")
+    m4.metric("Points", "—" if pd.isna(row["points"]) else f"{row['points']:,.1f}")
+    st.dataframe(index.seasons(pid), hide_index=True, width="stretch")
+
+# Weekly player points from scripts/fetch_player_points.py, else player_stats_<YEAR>.csv
+points = load_player_points()
+seasons = (sorted(points["season"].unique().tolist()) if not points.empty
+           else seasons_available("data", pattern="player_stats_*.csv"))
 if not seasons:
     st.info("Add player_stats_<YEAR>.csv to /data."); st.stop()
 
 season = st.selectbox("Season", sorted(seasons), index=len(seasons)-1)
-ps = load_player_stats(season=season)
+ps = points[points["season"]==season] if not points.empty else load_player_stats(season=season)
 if ps.empty:
     st.warning("No player stats found."); st.stop()
 
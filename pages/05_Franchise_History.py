@@ -6,8 +6,11 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized, load_elo_state,
 )
+from tools.elo import build_elo, current_ratings, rating_history
+from tools.franchise_timeline import franchise_legacy, franchise_timeline
 from components.header import render_header
 
 st.set_page_config(page_title="📊 Franchise History", layout="wide")
@@ -16,58 +19,55 @@ import plotly.express as px
 
 st.title("📊 Franchise Power Index — Multi-Year")
 
-scores = load_scores_all()
-if scores.empty:
-    st.info("No combined scores found."); st.stop()
+# Franchise timeline precomputed by scripts/materialize_aggregates.py (tools/franchise_timeline.py)
+timeline = load_materialized("franchise_timeline")
+legacy = load_materialized("franchise_legacy")
+if timeline.empty or legacy.empty:
+    scores = load_scores_all()
+    if scores.empty:
+        st.info("No combined scores found."); st.stop()
 
-frmap = load_franchise_map()
-scores = attach_franchise(scores, frmap)
-
-required_cols = {"points_for", "points_against", "week", "season", "team", "manager"}
-missing = required_cols - set(scores.columns)
-if missing:
-    st.error(
-        f"Missing columns {missing} in combined scores; this usually means one of the scores_*.csv files is empty or malformed. "
-        "Try re-running your data sync or temporarily removing the bad file."
-    )
-    st.stop()
-
-scores["win"] = (scores["points_for"] > scores["points_against"]).astype(int)
-summary = (scores.groupby(["season","team","manager"], dropna=False)
-                 .agg(games=("week","count"),
-                      wins=("win","sum"),
-                      pf=("points_for","sum"),
-                      pa=("points_against","sum"),
-                      avg_pf=("points_for","mean"))
-                 .reset_index())
-summary["win_pct"] = summary["wins"]/summary["games"]
-max_season = summary["season"].max()
-summary["recency_weight"] = summary["season"].apply(lambda s: 0.9**(max_season - s))
-summary["power"] = summary["avg_pf"]*0.6 + summary["win_pct"]*60 + 0.4*(summary["pf"]-summary["pa"])/summary["games"]
+    required_cols = {"points_for", "points_against", "week", "season", "team", "manager"}
+    missing = required_cols - set(scores.columns)
+    if missing:
+        st.error(
+            f"Missing columns {missing} in combined scores; this usually means one of the scores_*.csv files is empty or malformed. "
+            "Try re-running your data sync or temporarily removing the bad file."
+        )
+        st.stop()
+    timeline = franchise_timeline(scores)
+    legacy = franchise_legacy(scores, timeline)
 
 st.subheader("Power over time")
-teams = (
-    summary["team"]
-    .dropna()
-    .astype(str)
-    .unique()
-    .tolist()
-)
-team = st.selectbox("Team (optional)", ["All"] + sorted(teams))
+franchises = sorted(timeline["franchise"].dropna().astype(str).unique().tolist())
+franchise = st.selectbox("Franchise (optional)", ["All"] + franchises)
 metric = st.selectbox("Metric", ["power","win_pct","avg_pf"])
 
-data = summary if team=="All" else summary[summary["team"]==team]
-fig = px.line(data, x="season", y=metric, color=None if team!="All" else "team", markers=True)
+data = timeline if franchise=="All" else timeline[timeline["franchise"]==franchise]
+fig = px.line(data, x="season", y=metric, color=None if franchise!="All" else "franchise", markers=True,
+              hover_data=["team","manager"])
 st.plotly_chart(
     fig,
     width="stretch",
     key="franchise_power_chart",
 )
 
-legacy = (summary.groupby(["team","manager"], dropna=False)
-          .apply(lambda x: np.average(x["power"], weights=x["recency_weight"]))
-          .reset_index(name="legacy_index")
-         ).sort_values("legacy_index", ascending=False).reset_index(drop=True)
-legacy["rank"] = np.arange(1, len(legacy)+1)
 st.subheader("🏛️ Legacy Index (recency-weighted)")
-st.dataframe(legacy[["rank","team","manager","legacy_index"]].round(2), hide_index=True, width="stretch")
+st.dataframe(legacy[["rank","franchise","team","manager","seasons","legacy_index"]].round(2), hide_index=True, width="stretch")
+
+# Elo ratings maintained at ingest (tools/elo.py)
+st.subheader("📈 Elo Rating History")
+elo_state = load_elo_state()
+if elo_state is None:
+    scores = load_scores_all()
+    elo_state = build_elo(scores) if not scores.empty else None
+history = rating_history(elo_state, None if franchise == "All" else franchise)
+if history.empty:
+    st.info("No Elo history yet.")
+else:
+    history = history.assign(t=history["season"] + (history["week"] - 1) / 20)
+    fig = px.line(history, x="t", y="rating", color="franchise" if franchise == "All" else None,
+                  hover_data=["season","week","team","opponent_franchise","delta","felo_score"],
+                  labels={"t": "season"})
+    st.plotly_chart(fig, width="stretch", key="franchise_elo_chart")
+    st.dataframe(current_ratings(elo_state), hide_index=True, width="stretch")
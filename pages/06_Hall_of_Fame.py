@@ -6,8 +6,10 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized,
 )
+from tools.aggregates import season_team_summary
 from components.header import render_header
 
 st.set_page_config(page_title="🏛️ Hall of Fame", layout="wide")
@@ -15,13 +17,17 @@ render_header("Goodell For Nothing XV")
 
 st.title("🏛️ Hall of Fame")
 
-scores = load_scores_all()
-if scores.empty:
-    st.info("Add multiple seasons of scores_<YEAR>.csv to populate."); st.stop()
+# Season × team summary precomputed by scripts/materialize_aggregates.py
+summary = load_materialized("season_team_summary")
+if summary.empty:
+    scores = load_scores_all()
+    if scores.empty:
+        st.info("Add multiple seasons of scores_<YEAR>.csv to populate."); st.stop()
+    summary = season_team_summary(scores)
 
-scores["win_val"] = (scores["points_for"] > scores["points_against"]).map(lambda x: 1.0 if x else 0.0)
-champs = (scores.groupby(["season","team"], as_index=False)["win_val"].sum()
-               .sort_values(["season","win_val"], ascending=[True, False])
-               .groupby("season", as_index=False).head(1))
+champs = (summary.groupby(["season","team"], as_index=False)["wins"].sum()
+                 .rename(columns={"wins": "win_val"})
+                 .sort_values(["season","win_val"], ascending=[True, False])
+                 .groupby("season", as_index=False).head(1))
 st.subheader("Season Champions (by wins proxy)")
 st.dataframe(champs, hide_index=True, width="stretch")
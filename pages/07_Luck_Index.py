@@ -6,8 +6,10 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized, load_schedule_swap,
 )
+from tools.schedule_luck import schedule_luck
 from components.header import render_header
 
 st.set_page_config(page_title="🍀 Luck Index", layout="wide")
@@ -51,3 +53,22 @@ st.plotly_chart(
     width="stretch",
     key="luck_index_scatter",
 )
+
+# Schedule-swap luck precomputed by scripts/materialize_aggregates.py (tools/schedule_luck.py)
+st.subheader("📅 Strength of Schedule Luck")
+sos = load_materialized("schedule_luck")
+sos = sos[sos["season"]==season] if not sos.empty else schedule_luck(df.assign(season=season))
+st.caption("Wins each team would have had with every other team's schedule. "
+           "sos_luck = actual wins − average over the other schedules; schedule_ease > 0 means "
+           "other teams win more with this team's schedule.")
+st.dataframe(sos[["team","manager","actual_wins","expected_wins","best_wins","worst_wins",
+                  "pct_schedules_worse","sos_luck","schedule_ease"]].sort_values("sos_luck", ascending=False),
+             hide_index=True, width="stretch")
+
+# Built from the same played regular-season weeks as the table above, cached per ingest
+wins = load_schedule_swap(season)
+if len(wins) > 1:
+    fig = px.imshow(wins, text_auto=True, color_continuous_scale="RdYlGn",
+                    labels={"x": "with this team's schedule", "y": "team", "color": "wins"},
+                    title=f"Schedule Swap Wins — {season}")
+    st.plotly_chart(fig, width="stretch", key="schedule_swap_heatmap")
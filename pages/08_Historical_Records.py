@@ -6,25 +6,40 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_record_leaderboards,
 )
+from tools.leaderboards import build_leaderboards, leaderboard_frame
 from components.header import render_header
+from components.era_records import render_era_records
 
 st.set_page_config(page_title="📚 Historical Records", layout="wide")
 render_header("Goodell For Nothing XV")
 
 st.title("📚 Historical Records")
 
-scores = load_scores_all()
-if scores.empty: st.info("No scores found."); st.stop()
+# All-time leaderboards maintained at ingest (tools/leaderboards.py)
+boards = load_record_leaderboards()
+if boards is None:
+    scores = load_scores_all()
+    if scores.empty: st.info("No scores found."); st.stop()
+    boards = build_leaderboards(scores)
 
-best = scores.sort_values("points_for", ascending=False).head(10)
-worst = scores.sort_values("points_for", ascending=True).head(10)
-margin = (scores.assign(margin=scores["points_for"]-scores["points_against"])
-                .sort_values("margin", ascending=False).head(10))
+best = leaderboard_frame(boards, "highest_team_week", 10)
+worst = leaderboard_frame(boards, "lowest_team_week", 10)
+margin = leaderboard_frame(boards, "biggest_blowout", 10)
+closest = leaderboard_frame(boards, "closest_game", 10)
+combined = leaderboard_frame(boards, "highest_combined", 10)
 st.subheader("Top 10 Team Weeks (Points)")
 st.dataframe(best[["season","week","team","manager","points_for","opponent"]], hide_index=True, width="stretch")
 st.subheader("Lowest 10 Team Weeks (Points)")
 st.dataframe(worst[["season","week","team","manager","points_for","opponent"]], hide_index=True, width="stretch")
 st.subheader("Largest 10 Blowouts (Margin)")
 st.dataframe(margin[["season","week","team","manager","margin","opponent"]], hide_index=True, width="stretch")
+st.subheader("Closest 10 Games (Margin)")
+st.dataframe(closest[["season","week","team","manager","margin","opponent"]], hide_index=True, width="stretch")
+st.subheader("Highest 10 Combined Scores")
+st.dataframe(combined[["season","week","team","points_for","opponent","points_against","combined"]], hide_index=True, width="stretch")
+
+# Era-adjusted records from the team_week_z table (components/era_records.py)
+render_era_records(10, "Top 10 Team Weeks (Era-Adjusted)")
@@ -6,7 +6,8 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_player_points,
 )
 from components.header import render_header
 
@@ -15,10 +16,13 @@ render_header("Goodell For Nothing XV")
 
 st.title("🌟 Top Performers (Players)")
 
-seasons = seasons_available("data", pattern="player_stats_*.csv")
+# Weekly player points from scripts/fetch_player_points.py, else player_stats_<YEAR>.csv
+points = load_player_points()
+seasons = (sorted(points["season"].unique().tolist()) if not points.empty
+           else seasons_available("data", pattern="player_stats_*.csv"))
 if not seasons: st.info("Add player_stats files."); st.stop()
 season = st.selectbox("Season", sorted(seasons), index=len(seasons)-1)
-ps = load_player_stats(season=season)
+ps = points[points["season"]==season] if not points.empty else load_player_stats(season=season)
 if ps.empty: st.warning("No player stats."); st.stop()
 
 if "actual_points" not in ps.columns:
@@ -6,8 +6,10 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized,
 )
+from tools.aggregates import season_team_summary
 from components.header import render_header
 
 st.set_page_config(page_title="📊 Advanced Analytics", layout="wide")
@@ -46,17 +48,19 @@ if season_choice:
 if team_choice:
     scores = scores[scores["team"].isin(team_choice)]
 
-summary = (
-    scores.dropna(subset=["points_for"])
-          .groupby(["season","team"], dropna=False)
-          .agg(games=("week","nunique"),
-               avg_points=("points_for","mean"),
-               avg_luck=("luck","mean"),
-               eff=("efficiency","mean"),
-               consistency=("points_for","std"))
-          .reset_index()
+# Season × team summary precomputed by scripts/materialize_aggregates.py
+summary = load_materialized("season_team_summary")
+if summary.empty:
+    summary = season_team_summary(scores.dropna(subset=["points_for"]))
+else:
+    if season_choice:
+        summary = summary[summary["season"].isin(season_choice)]
+    if team_choice:
+        summary = summary[summary["team"].isin(team_choice)]
+# avg_luck / eff only exist when projected points were available
+summary = summary.rename(columns={"avg_pf": "avg_points", "std_pf": "consistency"}).reindex(
+    columns=["season", "team", "games", "avg_points", "avg_luck", "eff", "consistency"]
 )
-summary["consistency"] = summary["consistency"].fillna(0.0)
 summary["power"] = summary["avg_points"]*0.6 + summary["eff"].fillna(0)*30 + summary["avg_luck"].fillna(0)*0.3 - summary["consistency"]*0.1
 
 c1,c2 = st.columns(2)
@@ -6,8 +6,10 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized,
 )
+from tools.aggregates import season_team_summary
 from components.header import render_header
 
 st.set_page_config(page_title="🆚 Season Comparison", layout="wide")
@@ -26,13 +28,20 @@ with c1:
 with c2:
     b = st.selectbox("Season B", sorted(seasons), index=1)
 
+# Season × team summary precomputed by scripts/materialize_aggregates.py
+summary_all = load_materialized("season_team_summary")
+
 def build(year):
-    sc = load_scores_year(year)
-    if sc.empty: return pd.DataFrame()
-    sc["win_val"] = (sc["points_for"] > sc["points_against"]).map(lambda x: 1.0 if x else 0.0)
-    winp = sc.groupby("team", as_index=False)["win_val"].mean().rename(columns={"win_val":"winp"})
-    pts = sc.groupby("team", as_index=False)["points_for"].sum().rename(columns={"points_for":"total_points"})
-    return winp.merge(pts, on="team", how="left")
+    if not summary_all.empty:
+        sm = summary_all[summary_all["season"] == year]
+    else:
+        sc = load_scores_year(year)
+        if sc.empty: return pd.DataFrame()
+        sm = season_team_summary(sc)
+    if sm.empty: return pd.DataFrame()
+    return (sm.groupby("team", as_index=False)
+              .agg(wins=("wins","sum"), games=("games","sum"), total_points=("pf","sum"))
+              .assign(winp=lambda x: x["wins"]/x["games"])[["team","winp","total_points"]])
 
 A, B = build(a), build(b)
 if A.empty or B.empty:
@@ -6,23 +6,49 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized, load_record_leaderboards,
 )
+from tools.leaderboards import build_leaderboards, leaderboard_frame
+from tools.momentum import streak_records
 from components.header import render_header
+from components.era_records import render_era_records
 
 st.set_page_config(page_title="📓 Record Book", layout="wide")
 render_header("Goodell For Nothing XV")
 
 st.title("📓 Record Book — All Time")
 
-scores = load_scores_all()
-if scores.empty: st.info("No scores."); st.stop()
+# All-time leaderboards maintained at ingest (tools/leaderboards.py)
+boards = load_record_leaderboards()
+scores = None
+if boards is None:
+    scores = load_scores_all()
+    if scores.empty: st.info("No scores."); st.stop()
+    boards = build_leaderboards(scores)
 
-scores["margin"] = scores["points_for"] - scores["points_against"]
 st.subheader("Highest Team Weeks")
-st.dataframe(scores.sort_values("points_for", ascending=False).head(25)[["season","week","team","manager","points_for","opponent"]],
+st.dataframe(leaderboard_frame(boards, "highest_team_week", 25)[["season","week","team","manager","points_for","opponent"]],
              hide_index=True, width="stretch")
 
 st.subheader("Biggest Blowouts (Margin)")
-st.dataframe(scores.sort_values("margin", ascending=False).head(25)[["season","week","team","manager","margin","opponent"]],
+st.dataframe(leaderboard_frame(boards, "biggest_blowout", 25)[["season","week","team","manager","margin","opponent"]],
              hide_index=True, width="stretch")
+
+# Longest streaks precomputed by scripts/materialize_aggregates.py (tools/momentum.py)
+streaks = load_materialized("streak_records")
+if streaks.empty:
+    streaks = streak_records(scores if scores is not None else load_scores_all())
+all_time = streaks[streaks["scope"]=="all_time"]
+st.subheader("Longest Streaks (All Time)")
+c1, c2, c3 = st.columns(3)
+for col, metric, label in [(c1, "longest_win_streak", "Wins"),
+                           (c2, "longest_loss_streak", "Losses"),
+                           (c3, "longest_scoring_streak", "Weeks above league median")]:
+    with col:
+        st.caption(label)
+        st.dataframe(all_time.sort_values(metric, ascending=False).head(10)[["team","manager",metric]],
+                     hide_index=True, width="stretch")
+
+# Era-adjusted records from the team_week_z table (components/era_records.py)
+render_era_records(25, "Highest Team Weeks (Era-Adjusted)")
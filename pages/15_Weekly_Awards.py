@@ -6,7 +6,8 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized,
 )
 from components.header import render_header
 
@@ -35,10 +36,20 @@ week = st.selectbox("Week", sorted(df["week"].unique()), index=0)
 wk = df[df["week"]==week].copy()
 wk["margin"] = wk["points_for"] - wk["points_against"]
 
-awards = {
-    "High Score": wk.loc[wk["points_for"].idxmax()][["team","manager","points_for"]].to_dict(),
-    "Low Score": wk.loc[wk["points_for"].idxmin()][["team","manager","points_for"]].to_dict(),
-    "Biggest Blowout": wk.loc[wk["margin"].idxmax()][["team","manager","margin"]].to_dict()
-}
+# Weekly award winners precomputed by scripts/materialize_aggregates.py
+awards_all = load_materialized("weekly_awards")
+if not awards_all.empty:
+    wk_awards = awards_all[(awards_all["season"] == season) & (awards_all["week"] == week)]
+    value_cols = {"High Score": "points_for", "Low Score": "points_for", "Biggest Blowout": "margin"}
+    awards = {
+        r["award"]: {"team": r["team"], "manager": r["manager"], value_cols[r["award"]]: r["value"]}
+        for _, r in wk_awards.iterrows()
+    }
+else:
+    awards = {
+        "High Score": wk.loc[wk["points_for"].idxmax()][["team","manager","points_for"]].to_dict(),
+        "Low Score": wk.loc[wk["points_for"].idxmin()][["team","manager","points_for"]].to_dict(),
+        "Biggest Blowout": wk.loc[wk["margin"].idxmax()][["team","manager","margin"]].to_dict()
+    }
 for name, vals in awards.items():
     st.write(f"**{name}** — {vals}")
@@ -6,8 +6,10 @@ import streamlit as st
 # Shared helpers expected to exist in your repo
 from tools.data_loader import (
     load_scores_all, load_scores_year, load_player_stats,
-    load_franchise_map, attach_franchise, seasons_available
+    load_franchise_map, attach_franchise, seasons_available,
+    load_materialized,
 )
+from tools.momentum import momentum
 from components.header import render_header
 
 st.set_page_config(page_title="📅 Matchup Summary", layout="wide")
@@ -40,8 +42,12 @@ st.subheader(f"Week {week} — All Matchups")
 st.dataframe(wk[["team","manager","opponent","points_for","points_against","margin"]].sort_values("points_for", ascending=False),
              hide_index=True, width="stretch")
 
-df = df.sort_values(["team","week"])
-df["pf_ma3"] = df.groupby("team")["points_for"].transform(lambda s: s.rolling(3, min_periods=1).mean())
-wk_mom = df[df["week"]==week][["team","pf_ma3"]].sort_values("pf_ma3", ascending=False)
+# Momentum precomputed by scripts/materialize_aggregates.py (tools/momentum.py)
+mom = load_materialized("momentum")
+if mom.empty:
+    mom = momentum(df.assign(season=season))
+wk_mom = (mom[(mom["season"]==season) & (mom["week"]==week)]
+          [["team","pf_ma3","pf_ewm","win_streak","scoring_streak"]]
+          .sort_values("pf_ma3", ascending=False))
 st.subheader("🔥 Momentum (3-week avg points)")
 st.dataframe(wk_mom, hide_index=True, width="stretch")
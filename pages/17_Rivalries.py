@@ -0,0 +1,58 @@
+import os
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Shared helpers expected to exist in your repo
+from tools.data_loader import load_scores_all, load_head_to_head_matrix
+from tools.head_to_head import build_head_to_head, pair_record, rivalry_table
+from components.header import render_header
+
+st.set_page_config(page_title="⚔️ Rivalries", layout="wide")
+render_header("Goodell For Nothing XV")
+
+st.title("⚔️ Rivalries — All-Time Head to Head")
+
+# Franchise × franchise matrix maintained at ingest (tools/head_to_head.py)
+h2h = load_head_to_head_matrix()
+if h2h is None:
+    scores = load_scores_all()
+    if scores.empty: st.info("No scores."); st.stop()
+    h2h = build_head_to_head(scores)
+
+franchises = sorted(h2h["franchises"])
+if len(franchises) < 2:
+    st.info("Not enough franchises for a rivalry."); st.stop()
+
+c1, c2 = st.columns(2)
+a = c1.selectbox("Franchise", franchises, index=0)
+b = c2.selectbox("Opponent", [f for f in franchises if f != a], index=0)
+
+rec = pair_record(h2h, a, b)
+if rec["games"] == 0:
+    st.info(f"{a} and {b} have never met.")
+else:
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Record", f"{rec['wins']}-{rec['losses']}" + (f"-{rec['ties']}" if rec["ties"] else ""))
+    m2.metric("Meetings", rec["games"])
+    m3.metric("Playoff meetings", rec["playoff_meetings"])
+    m4.metric("Avg margin", f"{(rec['points_for'] - rec['points_against']) / rec['games']:+.1f}")
+
+st.subheader(f"{a} vs. the League")
+table = rivalry_table(h2h, a)
+if table.empty:
+    st.info("No games found.")
+else:
+    table = table.assign(
+        avg_pf=(table["points_for"] / table["games"]).round(1),
+        avg_pa=(table["points_against"] / table["games"]).round(1),
+        win_pct=table["win_pct"].round(3),
+    )
+    st.dataframe(table[["opponent","games","wins","losses","ties","win_pct","avg_pf","avg_pa","playoff_meetings"]],
+                 hide_index=True, width="stretch")
+
+st.subheader("Win % Matrix")
+games = h2h["games"]
+with np.errstate(invalid="ignore", divide="ignore"):
+    pct = np.where(games > 0, (h2h["wins"] + 0.5 * h2h["ties"]) / games, np.nan)
+st.dataframe(pd.DataFrame(pct, index=h2h["franchises"], columns=h2h["franchises"]).round(2), width="stretch")
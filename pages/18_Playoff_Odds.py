@@ -0,0 +1,44 @@
+import os
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Shared helpers expected to exist in your repo
+from tools.data_loader import live_season, load_playoff_odds
+from tools.playoff_odds import N_SIMS, load_playoff_settings
+from components.header import render_header
+
+st.set_page_config(page_title="🎯 Playoff Odds", layout="wide")
+render_header("Goodell For Nothing XV")
+import plotly.express as px
+
+st.title("🎯 Playoff Odds — Live Season")
+
+# Only the league's current season is simulated: the settings describe its format, and
+# finished seasons already have their real standings and bracket results
+season = live_season("data")
+if season is None:
+    st.info("No season in progress — playoff odds return once the next season starts. "
+            "Final standings and bracket results are on the history pages.")
+    st.stop()
+
+settings = load_playoff_settings("data")
+st.caption(f"{season} · {N_SIMS:,} simulations of the remaining schedule · {settings['num_playoff_teams']} playoff teams, "
+           f"{settings['num_byes']} byes, playoffs start week {settings['playoff_start_week']}")
+
+# Simulated once per scores file version (tools/playoff_odds.py); a sync invalidates it
+with st.spinner("⏳ Simulating the rest of the season…"):
+    odds = load_playoff_odds(season)
+if odds.empty:
+    st.warning("No data."); st.stop()
+
+pct_cols = ["playoffs_pct","bye_pct","final_pct","title_pct"]
+show = odds[["team","manager","current_wins","proj_wins","avg_seed"] + pct_cols].copy()
+show[pct_cols] = (show[pct_cols] * 100).round(1)
+st.dataframe(show, hide_index=True, width="stretch",
+             column_config={c: st.column_config.ProgressColumn(c.replace("_pct"," %"), min_value=0, max_value=100, format="%.1f%%")
+                            for c in pct_cols})
+
+fig = px.bar(show.melt(id_vars="team", value_vars=pct_cols, var_name="outcome", value_name="pct"),
+             x="team", y="pct", color="outcome", barmode="group", title=f"Odds — {season}")
+st.plotly_chart(fig, width="stretch", key="playoff_odds_bar")
@@ -0,0 +1,37 @@
+import os
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Shared helpers expected to exist in your repo
+from tools.data_loader import load_optimal_lineups
+from tools.lineups import lineup_efficiency
+from components.header import render_header
+
+st.set_page_config(page_title="🧠 Lineup Efficiency", layout="wide")
+render_header("Goodell For Nothing XV")
+import plotly.express as px
+
+st.title("🧠 Lineup Efficiency — Points Left on the Bench")
+
+# Optimal lineups solved for every team-week (tools/lineups.py)
+lineups = load_optimal_lineups()
+if lineups.empty:
+    st.info("Needs player points: run scripts/process_historical_data.py, then scripts/fetch_player_points.py."); st.stop()
+
+seasons = sorted(lineups["season"].unique().tolist())
+season = st.selectbox("Season", seasons, index=len(seasons)-1)
+season_df = lineups[lineups["season"]==season]
+
+eff = lineup_efficiency(season_df)
+st.subheader(f"Manager Efficiency — {season}")
+st.dataframe(eff[["team","manager","weeks","actual_points","optimal_points","points_left","perfect_weeks","efficiency"]].round(2),
+             hide_index=True, width="stretch")
+
+fig = px.bar(eff.sort_values("points_left"), x="team", y="points_left", hover_data=["manager","efficiency"],
+             title="Total points left on the bench")
+st.plotly_chart(fig, width="stretch", key="lineup_points_left")
+
+st.subheader("Worst Lineup Decisions (All Time)")
+st.dataframe(lineups.nlargest(15, "points_left")[["season","week","team","manager","actual_points","optimal_points","points_left"]],
+             hide_index=True, width="stretch")
@@ -0,0 +1,46 @@
+import os
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Shared helpers expected to exist in your repo
+from tools.data_loader import load_stat_matrix, load_rescored_season
+from tools.alt_scoring import PRESETS, load_stat_modifiers, load_stat_names
+from components.header import render_header
+
+st.set_page_config(page_title="🧪 What-If Scoring", layout="wide")
+render_header("Goodell For Nothing XV")
+
+st.title("🧪 What-If Scoring")
+
+# Stat lines packed by scripts/fetch_player_points.py (tools/alt_scoring.py)
+matrix = load_stat_matrix()
+if matrix is None:
+    st.info("Needs player stat lines: run scripts/fetch_player_points.py."); st.stop()
+
+seasons = sorted(np.unique(matrix["year"]).tolist())
+season = st.selectbox("Season", seasons, index=len(seasons)-1)
+
+preset = st.selectbox("Scoring", list(PRESETS.keys()))
+
+base = load_stat_modifiers("data")
+names = load_stat_names("data")
+modifiers = {**base, **PRESETS[preset]}
+with st.expander("Adjust individual stat values"):
+    for sid in [int(s) for s in matrix["stat_ids"] if int(s) in base]:
+        modifiers[sid] = st.number_input(names.get(sid, f"stat {sid}"), value=float(modifiers[sid]), step=0.5, key=f"mod_{sid}")
+
+# Cached per (season, modifiers, input file versions): the league baseline is computed once
+actual = load_rescored_season(season, base)
+alt = load_rescored_season(season, modifiers)
+if actual is None or alt is None:
+    st.info("Needs rosters and scores: run scripts/run_pipeline.py."); st.stop()
+actual, alt = actual["standings"], alt["standings"]
+
+cmp = alt[["team","manager","wins","losses","pf"]].merge(
+    actual[["team","wins","pf"]].rename(columns={"wins":"wins_league","pf":"pf_league"}), on="team", how="left")
+cmp["win_change"] = cmp["wins"] - cmp["wins_league"]
+cmp = cmp.sort_values(["wins","pf"], ascending=False).reset_index(drop=True)
+cmp.insert(0, "rank", np.arange(1, len(cmp) + 1))
+st.subheader(f"Regular-season standings under “{preset}” — {season}")
+st.dataframe(cmp.round(2), hide_index=True, width="stretch")
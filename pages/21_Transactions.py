@@ -0,0 +1,63 @@
+import os
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Shared helpers expected to exist in your repo
+from tools.data_loader import load_roster_events, load_tenure_spans, load_team_names
+from components.header import render_header
+
+st.set_page_config(page_title="🔁 Transactions", layout="wide")
+render_header("Goodell For Nothing XV")
+import plotly.express as px
+
+st.title("🔁 Transactions & Tenure")
+
+# Events inferred at ingest by diffing consecutive roster weeks (tools/roster_transactions.py)
+events = load_roster_events()
+tenure = load_tenure_spans()
+if events.empty and tenure.empty:
+    st.info("No roster data: run scripts/process_historical_data.py."); st.stop()
+
+names = load_team_names()
+for df in (events, tenure):
+    if not names.empty and not df.empty:
+        df["team"] = df["team_key"].map(names["team"])
+        df["manager"] = df["team_key"].map(names["manager"])
+if not names.empty and "counterparty" in events.columns:
+    events["counterparty_team"] = events["counterparty"].map(names["team"])
+
+seasons = sorted(set(events["season"].unique().tolist()) | set(tenure["season"].unique().tolist()))
+season = st.selectbox("Season", seasons, index=len(seasons)-1)
+season_events = events[events["season"]==season]
+
+st.subheader(f"Activity by Team — {season}")
+activity = (season_events.assign(kind=season_events["event"].str.replace("_in|_out", "", regex=True))
+            .pivot_table(index=["team","manager"], columns="kind", values="player_id", aggfunc="count", fill_value=0)
+            .reset_index())
+if activity.empty:
+    st.info("No roster moves recorded for this season.")
+else:
+    if "trade" in activity.columns:
+        activity["trade"] = activity["trade"] // 2
+    st.dataframe(activity, hide_index=True, width="stretch")
+    fig = px.bar(season_events, x="week", color="event", title="Moves per week")
+    st.plotly_chart(fig, width="stretch", key="transactions_per_week")
+
+trades = season_events[season_events["event"]=="trade_in"]
+if not trades.empty:
+    st.subheader("Trades")
+    st.dataframe(trades[["week","team","player_name","counterparty_team"]].rename(
+        columns={"team":"received_by","counterparty_team":"from"}), hide_index=True, width="stretch")
+
+st.subheader(f"Longest Stints — {season}")
+season_tenure = tenure[tenure["season"]==season]
+st.dataframe(season_tenure.nlargest(25, ["weeks","weeks_started"])[
+    ["team","player_name","start_week","end_week","weeks","weeks_started","acquired"]],
+    hide_index=True, width="stretch")
+
+st.subheader("Most Productive Pickups (All Time)")
+pickups = tenure[tenure["acquired"]=="in-season"]
+st.dataframe(pickups.nlargest(15, "weeks_started")[
+    ["season","team","manager","player_name","start_week","end_week","weeks_started"]],
+    hide_index=True, width="stretch")
@@ -1,9 +1,16 @@
 import json
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.franchise_resolution import build_resolution_table
+from tools.leaderboards import update_leaderboards
+from tools.head_to_head import update_head_to_head
+from tools.elo import update_elo
+
 
 RAW_BASE = Path("data/raw/api")
 DATA_DIR = Path("data")
@@ -47,6 +54,12 @@ def _parse_team_block(team_block: Dict[str, Any]) -> Dict[str, Any]:
     except (TypeError, ValueError):
         points_for = 0.0
 
+    projected = stats.get("team_projected_points", {}).get("total")
+    try:
+        projected_points = float(projected) if projected is not None else None
+    except (TypeError, ValueError):
+        projected_points = None
+
     return {
         "team_key": team_key,
         "team_id": team_id,
@@ -55,6 +68,7 @@ def _parse_team_block(team_block: Dict[str, Any]) -> Dict[str, Any]:
         "felo_tier": felo_tier,
         "felo_score": felo_score,
         "points_for": points_for,
+        "projected_points": projected_points,
     }
 
 
@@ -95,6 +109,7 @@ def parse_scoreboard_file(path: Path) -> List[Dict[str, Any]]:
         m_week = int(matchup.get("week", scoreboard_week))
         is_playoffs = bool(int(matchup.get("is_playoffs", "0")))
         is_consolation = bool(int(matchup.get("is_consolation", "0")))
+        matchup_status = matchup.get("status")
 
         teams_block = matchup.get("0", {}).get("teams", {})
         team_rows = []
@@ -112,6 +127,7 @@ def parse_scoreboard_file(path: Path) -> List[Dict[str, Any]]:
                     "week": m_week,
                     "is_playoffs": is_playoffs,
                     "is_consolation": is_consolation,
+                    "matchup_status": matchup_status,
                 }
             )
             team_rows.append(parsed)
@@ -179,6 +195,8 @@ def build_all_scores_from_raw() -> None:
             "opponent_key",
             "points_for",
             "points_against",
+            "projected_points",
+            "matchup_status",
             "is_playoffs",
             "is_consolation",
             "felo_tier",
@@ -209,6 +227,18 @@ def build_all_scores_from_raw() -> None:
     combined_df.to_csv(combined_path, index=False)
     print(f"✅ Wrote combined scores: {len(combined_df)} rows → {combined_path}")
 
+    # Resolve franchise_id once per new Yahoo team (full rebuild only when the map changes)
+    build_resolution_table(combined_df, data_dir=str(DATA_DIR))
+
+    # Merge newly ingested weeks into the all-time record leaderboards
+    update_leaderboards(combined_df)
+
+    # Add newly ingested weeks to the all-time franchise head-to-head matrix
+    update_head_to_head(combined_df, data_dir=str(DATA_DIR))
+
+    # Apply newly ingested weeks to the persisted Elo ratings
+    update_elo(combined_df, data_dir=str(DATA_DIR))
+
 
 if __name__ == "__main__":
     build_all_scores_from_raw()
\ No newline at end of file
@@ -1,12 +1,17 @@
 # scripts/fetch_historical_data.py
 
+import argparse
 import json
+import sys
 import time
 from pathlib import Path
 
 from yahoo_oauth import OAuth2
 import yahoo_fantasy_api as yfa
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.roster_store import save_team_weeks
+
 GAME_CODE = "nfl"
 
 # 🔧 Fill this in from scripts/discover_leagues.py output
@@ -49,7 +54,8 @@ def dump_json(path: Path, data):
         json.dump(data, f, indent=2)
 
 
-def fetch_season(gm: yfa.Game, year: int, league_id: str, base_dir: Path):
+def fetch_season(gm: yfa.Game, year: int, league_id: str, base_dir: Path, recent_only: bool = False):
+    """Fetch one season; ``recent_only`` limits scoreboards/rosters to last week and the current week."""
     print(f"\n=== Fetching {year} (league_id={league_id}) ===")
 
     lg = gm.to_league(league_id)
@@ -68,7 +74,14 @@ def fetch_season(gm: yfa.Game, year: int, league_id: str, base_dir: Path):
     end_week = lg.end_week()
     print(f"  Season has {end_week} weeks")
 
-    for week in range(1, end_week + 1):
+    # Incremental refresh: last week (stat corrections) and the live week only
+    first_week, last_week = 1, end_week
+    if recent_only:
+        current = min(int(lg.current_week()), end_week)
+        first_week, last_week = max(1, current - 1), current
+        print(f"  Refreshing weeks {first_week}–{last_week} only")
+
+    for week in range(first_week, last_week + 1):
         print(f"    Week {week} – scoreboard")
         try:
             scoreboard_raw = lg.matchups(week=week)
@@ -95,7 +108,9 @@ def fetch_season(gm: yfa.Game, year: int, league_id: str, base_dir: Path):
         team_dir = rosters_dir / team_key.replace(".", "_")
         ensure_dir(team_dir)
 
-        for week in range(1, end_week + 1):
+        # One delta-encoded store per team-season (tools/roster_store.py)
+        weeks = {}
+        for week in range(first_week, last_week + 1):
             try:
                 roster = tm.roster(week)
             except Exception as e:
@@ -106,12 +121,20 @@ def fetch_season(gm: yfa.Game, year: int, league_id: str, base_dir: Path):
                     print(f"      Week {week}: error getting roster -> {e}")
                     continue
 
-            dump_json(team_dir / f"week_{week}.json", roster)
+            weeks[week] = roster
             # Small delay to avoid hammering the API
             time.sleep(0.2)
 
+        if weeks:
+            save_team_weeks(team_dir, weeks)
+
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--current", action="store_true",
+                        help="Only the latest season, and only its last and current weeks")
+    args = parser.parse_args()
+
     if not TARGET_LEAGUE_IDS:
         raise RuntimeError(
             "Fill in TARGET_LEAGUE_IDS in fetch_historical_data.py using scripts/discover_leagues.py"
@@ -123,9 +146,13 @@ def main():
     base_dir = Path("data/raw/api")
     ensure_dir(base_dir)
 
-    for year, league_id in sorted(TARGET_LEAGUE_IDS.items()):
+    targets = sorted(TARGET_LEAGUE_IDS.items())
+    if args.current:
+        targets = targets[-1:]
+
+    for year, league_id in targets:
         try:
-            fetch_season(gm, year, league_id, base_dir)
+            fetch_season(gm, year, league_id, base_dir, recent_only=args.current)
         except RuntimeError as e:
             if "Request denied" in str(e):
                 print(f"\nSkipping {year} due to Yahoo 'Request denied' (likely rate limiting or access restriction). You can rerun later with just this year in TARGET_LEAGUE_IDS if needed.")
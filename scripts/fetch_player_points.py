@@ -0,0 +1,203 @@
+# scripts/fetch_player_points.py
+"""
+Player weekly points ingestion — run after scripts/process_historical_data.py.
+
+Reads data/combined/all_rosters.csv, deduplicates (league, week, player)
+across teams, and requests league-scored weekly stats through the Yahoo
+players collection, 25 player keys per call:
+
+    league/<league_key>/players;player_keys=<k1,...,k25>/stats;type=week;week=<N>
+
+Raw responses are saved under data/raw/api/<year>/player_points/ and the
+parsed points are appended to data/combined/all_player_points.csv after
+every call, so an interrupted run (rate limits) resumes where it stopped.
+Each row records whether its week was final (every matchup "postevent" in
+all_scores.csv); live or partial weeks are fetched again on the next run
+and the newer rows win.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.alt_scoring import build_stat_matrix
+from tools.player_index import build_player_index
+
+GAME_CODE = "nfl"
+BATCH_SIZE = 25
+
+RAW_BASE = Path("data/raw/api")
+COMBINED_DIR = Path("data/combined")
+ROSTERS_PATH = COMBINED_DIR / "all_rosters.csv"
+POINTS_PATH = COMBINED_DIR / "all_player_points.csv"
+SCORES_PATH = COMBINED_DIR / "all_scores.csv"
+
+POINT_COLS = ["year", "week", "league_key", "player_key", "player_id", "points", "final"]
+
+
+def league_key_of(team_key: str) -> str:
+    """'390.l.650144.t.5' -> '390.l.650144'."""
+    return team_key.split(".t.")[0]
+
+
+def player_key_of(league_key: str, player_id) -> str:
+    """Player keys are game-scoped: '<game_id>.p.<player_id>'."""
+    return f"{league_key.split('.')[0]}.p.{int(player_id)}"
+
+
+def load_points(path: Path = POINTS_PATH) -> pd.DataFrame:
+    if not path.exists():
+        return pd.DataFrame(columns=POINT_COLS)
+    df = pd.read_csv(path).drop_duplicates(["year", "week", "player_key"], keep="last")
+    # Rows written before the flag existed came from finished seasons
+    df["final"] = df["final"].fillna(True).astype(bool) if "final" in df.columns else True
+    return df
+
+
+def unfinished_weeks(scores: pd.DataFrame) -> set:
+    """(year, week) pairs with a matchup that is not "postevent" yet (none without matchup_status)."""
+    if scores.empty or "matchup_status" not in scores.columns:
+        return set()
+    live = scores[scores["matchup_status"].fillna("") != "postevent"]
+    return set(zip(live["season"].astype(int), live["week"].astype(int)))
+
+
+def pending_player_weeks(rosters: pd.DataFrame, done: pd.DataFrame) -> pd.DataFrame:
+    """Unique (year, week, league, player) combinations without final points yet."""
+    df = rosters.dropna(subset=["player_id", "week"]).copy()
+    df["league_key"] = df["team_key"].astype(str).map(league_key_of)
+    df["player_key"] = [player_key_of(lk, pid) for lk, pid in zip(df["league_key"], df["player_id"])]
+    df = df.drop_duplicates(["year", "week", "player_key"])[["year", "week", "league_key", "player_key"]]
+
+    if not done.empty:
+        seen = done.loc[done["final"], ["year", "week", "player_key"]].assign(_done=True)
+        df = df.merge(seen, on=["year", "week", "player_key"], how="left")
+        df = df[df["_done"].isna()].drop(columns="_done")
+    return df.sort_values(["year", "week", "player_key"]).reset_index(drop=True)
+
+
+def batches(pending: pd.DataFrame, size: int = BATCH_SIZE) -> Iterator[Tuple[int, str, int, List[str]]]:
+    for (year, league_key, week), g in pending.groupby(["year", "league_key", "week"], sort=True):
+        keys = g["player_key"].tolist()
+        for i in range(0, len(keys), size):
+            yield int(year), league_key, int(week), keys[i:i + size]
+
+
+def parse_players_response(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """player_key, player_id and week points from a league players;.../stats response."""
+    rows = []
+    league = data.get("fantasy_content", {}).get("league", [])
+    players = league[1].get("players", {}) if len(league) > 1 and isinstance(league[1], dict) else {}
+
+    for k, v in players.items():
+        if k == "count" or not isinstance(v, dict):
+            continue
+        blocks = v.get("player", [])
+        if not blocks:
+            continue
+
+        meta: Dict[str, Any] = {}
+        for item in blocks[0]:
+            if isinstance(item, dict):
+                meta.update(item)
+
+        points = None
+        for block in blocks[1:]:
+            if isinstance(block, dict) and "player_points" in block:
+                points = block["player_points"].get("total")
+        try:
+            points = float(points)
+        except (TypeError, ValueError):
+            points = 0.0
+
+        rows.append({"player_key": meta.get("player_key"), "player_id": meta.get("player_id"), "points": points})
+    return rows
+
+
+def _append(rows: List[Dict[str, Any]], path: Path = POINTS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists() and "final" not in pd.read_csv(path, nrows=0).columns:
+        # One-time upgrade of a file written before the final flag
+        load_points(path).reindex(columns=POINT_COLS).to_csv(path, index=False)
+    pd.DataFrame(rows, columns=POINT_COLS).to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def fetch_player_points(limit: int = None, dry_run: bool = False, delay: float = 0.2) -> bool:
+    """Fetch every pending player-week; False if the API cut the run short."""
+    if not ROSTERS_PATH.exists():
+        raise FileNotFoundError(
+            f"Rosters not found: {ROSTERS_PATH} (run scripts/process_historical_data.py first)"
+        )
+
+    rosters = pd.read_csv(ROSTERS_PATH)
+    scores = pd.read_csv(SCORES_PATH) if SCORES_PATH.exists() else pd.DataFrame()
+    live = unfinished_weeks(scores)
+    pending = pending_player_weeks(rosters, load_points())
+    calls = list(batches(pending))
+    print(f"📋 {len(rosters):,} roster rows → {len(pending):,} player-weeks to fetch in {len(calls):,} calls")
+    if dry_run or not calls:
+        return True
+
+    from yahoo_oauth import OAuth2
+    import yahoo_fantasy_api as yfa
+
+    sc = OAuth2(None, None, from_file="oauth2.json")
+    gm = yfa.Game(sc, GAME_CODE)
+    leagues = {}
+    fetched = 0
+    denied = False
+
+    for n, (year, league_key, week, keys) in enumerate(calls[:limit] if limit else calls, start=1):
+        lg = leagues.get(league_key) or leagues.setdefault(league_key, gm.to_league(league_key))
+        uri = f"league/{league_key}/players;player_keys={','.join(keys)}/stats;type=week;week={week}"
+        try:
+            data = lg.yhandler.get(uri)
+        except Exception as e:
+            if "Request denied" in str(e):
+                print(f"  ⛔ Request denied after {n - 1} calls (likely rate limit); rerun to resume.")
+                denied = True
+                break
+            print(f"  ⚠️ {year} week {week}: error fetching batch -> {e}")
+            continue
+
+        out_dir = RAW_BASE / str(year) / "player_points"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with (out_dir / f"week_{week}_{keys[0].split('.')[-1]}.json").open("w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        final = (year, week) not in live
+        rows = [dict(r, year=year, week=week, league_key=league_key, final=final)
+                for r in parse_players_response(data)]
+        _append(rows)
+        fetched += len(rows)
+        if n % 50 == 0:
+            print(f"  • {n:,}/{len(calls):,} calls, {fetched:,} player-weeks")
+        time.sleep(delay)
+
+    print(f"✅ Stored {fetched:,} player-weeks → {POINTS_PATH}")
+
+    # Repack raw stat lines for the alternative-scoring engine; refresh career points
+    if fetched:
+        build_stat_matrix(str(RAW_BASE))
+        build_player_index(str(COMBINED_DIR.parent))
+    return not denied
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many API calls")
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many calls are needed")
+    args = parser.parse_args()
+    # Non-zero exit when rate limited, so the pipeline reruns this stage next time
+    if not fetch_player_points(limit=args.limit, dry_run=args.dry_run):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
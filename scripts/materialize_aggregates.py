@@ -0,0 +1,83 @@
+# scripts/materialize_aggregates.py
+"""
+Materialize stage — run after scripts/build_scores_from_raw.py.
+
+Reads data/combined/all_scores.csv (plus franchise_resolution.csv for the
+franchise tables, and all_rosters.csv for the roster tables) and writes
+versioned aggregate tables to data/materialized/ (see
+tools/materialized.py). Tables whose source and schema are unchanged are
+skipped unless --force is given.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.tables import BUILDERS, FRANCHISE_TABLES, ROSTER_BUILDERS, SCHEMA_VERSIONS
+from tools.materialized import MATERIALIZED_DIR, is_fresh, source_fingerprint, write_table
+from tools.franchise_resolution import RESOLUTION_PATH, franchise_map_paths
+
+SCORES_PATH = Path("data/combined/all_scores.csv")
+ROSTERS_PATH = Path("data/combined/all_rosters.csv")
+
+
+def materialize(force: bool = False, out_dir: str = MATERIALIZED_DIR) -> None:
+    if not SCORES_PATH.exists():
+        raise FileNotFoundError(
+            f"Combined scores not found: {SCORES_PATH} (run scripts/build_scores_from_raw.py first)"
+        )
+
+    scores_source = source_fingerprint([str(SCORES_PATH)])
+    # attach_franchise_ids reads the resolution table, which is only valid for the map it was built from
+    resolution = [RESOLUTION_PATH, os.path.splitext(RESOLUTION_PATH)[0] + ".json", *franchise_map_paths()]
+    franchise_source = source_fingerprint([str(SCORES_PATH), *resolution])
+    scores = None
+
+    for name, build in BUILDERS.items():
+        schema = SCHEMA_VERSIONS[name]
+        source = franchise_source if name in FRANCHISE_TABLES else scores_source
+        if not force and is_fresh(name, schema, source, out_dir):
+            print(f"  ⏭️ {name} is up to date")
+            continue
+
+        if scores is None:
+            scores = pd.read_csv(SCORES_PATH)
+
+        table = build(scores)
+        version = write_table(name, table, schema, source, out_dir)
+        print(f"  ✅ {name} v{version}: {len(table)} rows")
+
+    if not ROSTERS_PATH.exists():
+        print(f"  ⚠️ No rosters at {ROSTERS_PATH}; skipping roster tables")
+        return
+
+    source = source_fingerprint([str(ROSTERS_PATH)])
+    rosters = None
+
+    for name, build in ROSTER_BUILDERS.items():
+        schema = SCHEMA_VERSIONS[name]
+        if not force and is_fresh(name, schema, source, out_dir):
+            print(f"  ⏭️ {name} is up to date")
+            continue
+
+        if rosters is None:
+            rosters = pd.read_csv(ROSTERS_PATH)
+
+        table = build(rosters)
+        version = write_table(name, table, schema, source, out_dir)
+        print(f"  ✅ {name} v{version}: {len(table)} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Rebuild every table even if up to date")
+    args = parser.parse_args()
+    materialize(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
 # scripts/process_historical_data.py
 
-import json
+import sys
 from pathlib import Path
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.player_index import build_player_index
+from tools.roster_codes import eligible_mask
+from tools.roster_store import load_team_weeks
+from tools.roster_transactions import update_roster_events
+
 
 RAW_BASE = Path("data/raw/api")
 COMBINED_DIR = Path("data/combined")
@@ -12,7 +18,8 @@ COMBINED_DIR.mkdir(parents=True, exist_ok=True)
 
 def iter_roster_rows():
     """
-    Walks data/raw/api/<year>/rosters/*/week_*.json and yields flat rows.
+    Walks data/raw/api/<year>/rosters/*/ (roster_store.json plus any loose
+    week_*.json files) and yields flat rows.
 
     Output columns:
       - year
@@ -23,6 +30,8 @@ def iter_roster_rows():
       - team_name (NFL team, if available)
       - display_position
       - selected_position (fantasy position slot)
+      - status (injury / availability designation, e.g. Q, IR, NA)
+      - eligible_mask (bitmask of slots the player can fill, see tools/roster_codes.py)
     """
     if not RAW_BASE.exists():
         return
@@ -42,19 +51,7 @@ def iter_roster_rows():
             # team_dir name is like "390_l_650144_t_5"
             team_key = team_dir.name.replace("_", ".")  # convert back to Yahoo-style key
 
-            for week_file in sorted(team_dir.glob("week_*.json")):
-                try:
-                    week_str = week_file.stem.split("_")[-1]
-                    week = int(week_str)
-                except Exception:
-                    week = None
-
-                with week_file.open("r", encoding="utf-8") as f:
-                    players = json.load(f)
-
-                if not isinstance(players, list):
-                    continue
-
+            for week, players in load_team_weeks(team_dir).items():
                 for p in players:
                     # Defensive extraction of common fields from yahoo_fantasy_api roster structure
                     player_id = p.get("player_id")
@@ -81,6 +78,10 @@ def iter_roster_rows():
                     else:
                         selected_pos = sel_pos
 
+                    eligible = p.get("eligible_positions") or []
+                    if isinstance(eligible, str):
+                        eligible = [eligible]
+
                     yield {
                         "year": year,
                         "week": week,
@@ -90,6 +91,8 @@ def iter_roster_rows():
                         "nfl_team": team_name,
                         "display_position": display_pos,
                         "selected_position": selected_pos,
+                        "status": p.get("status") or None,
+                        "eligible_mask": eligible_mask(eligible),
                     }
 
 
@@ -104,6 +107,10 @@ def process_rosters():
     df.to_csv(out_path, index=False)
     print(f"Wrote {len(df):,} roster rows to {out_path}")
 
+    # Diff only the roster weeks not seen by the previous run
+    update_roster_events(df, str(COMBINED_DIR / "roster_events.csv"))
+    build_player_index(str(COMBINED_DIR.parent))
+
 
 def main():
     process_rosters()
@@ -0,0 +1,180 @@
+# scripts/refresh_scheduler.py
+"""
+Game-window-aware refresh daemon.
+
+Keeps the current season fresh without any page having to fetch. Kickoff
+times come from the ESPN schedule saved by tools/fetch_nfl_matchups.py
+(re-fetched here once a day, or once every listed game is over — at most
+every SCHEDULE_RETRY, since ESPN can take days to post the next week).
+While a game window is open — kickoff minus 30 minutes to kickoff plus
+4 hours, i.e. the Thursday / Sunday / Monday slates — the current season is
+refreshed every FAST_INTERVAL; otherwise every SLOW_INTERVAL. If no schedule
+is available the usual Thu/Sun/Mon evening slots are assumed.
+
+A refresh is the ``refresh_current`` background job (tools/jobs.py):
+run_pipeline.py --current-season, which only fetches the latest season's
+last and current weeks and rebuilds just the stages whose inputs changed.
+Pipeline jobs are single-flight as a group (tools/jobs.py), so a refresh is
+skipped while a full sync started from the app is still running, and vice
+versa. Scheduler state is written to data/jobs/scheduler.json.
+
+    python scripts/refresh_scheduler.py          # run forever
+    python scripts/refresh_scheduler.py --once   # one tick, then exit
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from tools import jobs
+from tools.fetch_nfl_matchups import OUTPUT_FILE as NFL_FILE, fetch_nfl_matchups, should_refresh
+
+JOB = "refresh_current"
+STATE_PATH = Path(jobs.JOBS_DIR) / "scheduler.json"
+
+FAST_INTERVAL = timedelta(minutes=10)
+SLOW_INTERVAL = timedelta(hours=6)
+WINDOW_BEFORE = timedelta(minutes=30)
+WINDOW_AFTER = timedelta(hours=4)
+SCHEDULE_MAX_AGE_DAYS = 1
+SCHEDULE_RETRY = timedelta(hours=1)
+MAX_SLEEP = 60
+
+# Fallback slots when there is no schedule: local weekday -> hour the window opens
+FALLBACK_WINDOWS = {3: 19, 6: 12, 0: 19}   # Thu, Sun, Mon
+
+
+def load_kickoffs(path: str = NFL_FILE) -> List[datetime]:
+    """Kickoff times (UTC) of the games in the saved NFL schedule."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            games = json.load(f)
+    except (OSError, ValueError):
+        return []
+    kickoffs = []
+    for game in games:
+        try:
+            # ESPN dates look like "2025-10-19T17:00Z"
+            kickoffs.append(datetime.fromisoformat(game["date"].replace("Z", "+00:00")))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return sorted(k if k.tzinfo else k.replace(tzinfo=timezone.utc) for k in kickoffs)
+
+
+def in_game_window(now: datetime, kickoffs: List[datetime]) -> bool:
+    """True while any game is about to start or could still be in progress."""
+    if kickoffs:
+        return any(k - WINDOW_BEFORE <= now <= k + WINDOW_AFTER for k in kickoffs)
+    local = now.astimezone()
+    start = FALLBACK_WINDOWS.get(local.weekday())
+    return start is not None and local.hour >= start
+
+
+def _schedule_stale(kickoffs: List[datetime], now: datetime) -> bool:
+    if should_refresh(NFL_FILE, days=SCHEDULE_MAX_AGE_DAYS):
+        return True
+    # Every game on file is finished: ESPN has moved on to the next week
+    return bool(kickoffs) and max(kickoffs) + WINDOW_AFTER < now
+
+
+def load_state(path: Path = STATE_PATH) -> dict:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: dict, path: Path = STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _parse(ts: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(ts) if ts else None
+    except ValueError:
+        return None
+
+
+def tick(state: dict, now: Optional[datetime] = None) -> float:
+    """Refresh whatever is due; returns seconds until the next check."""
+    now = now or datetime.now(timezone.utc)
+
+    kickoffs = load_kickoffs()
+    last_fetch = _parse(state.get("last_schedule_fetch"))
+    if _schedule_stale(kickoffs, now) and (last_fetch is None or now - last_fetch >= SCHEDULE_RETRY):
+        # Recorded before fetching, so failures (and an off-season with nothing new) are retried hourly
+        state["last_schedule_fetch"] = now.isoformat(timespec="seconds")
+        try:
+            fetch_nfl_matchups()
+        except Exception as e:
+            print(f"⚠️ Could not refresh NFL schedule: {e}")
+        kickoffs = load_kickoffs()
+
+    mode = "game_window" if in_game_window(now, kickoffs) else "idle"
+    interval = FAST_INTERVAL if mode == "game_window" else SLOW_INTERVAL
+    last = _parse(state.get("last_refresh"))
+    # Derived from the last refresh, so entering a window pulls the next one in
+    due = (last + interval) if last else now
+
+    if now >= due:
+        started, status = jobs.start_job(JOB)
+        if started:
+            print(f"🔄 {now.astimezone():%a %H:%M} [{mode}] started {JOB} (pid {status.get('pid')})")
+        else:
+            print(f"⏳ {now.astimezone():%a %H:%M} [{mode}] {status.get('job', JOB)} "
+                  f"already {status.get('state')} — skipping")
+        state["last_refresh"] = now.isoformat(timespec="seconds")
+        state["last_started"] = started
+        due = now + interval
+
+    upcoming = [k for k in kickoffs if k > now]
+    state.update({
+        "pid": os.getpid(),
+        "mode": mode,
+        "checked_at": now.isoformat(timespec="seconds"),
+        "next_refresh": due.isoformat(timespec="seconds"),
+        "next_kickoff": upcoming[0].isoformat(timespec="seconds") if upcoming else None,
+        "last_job_state": jobs.read_status(JOB).get("state"),
+    })
+    _save_state(state)
+
+    # Wake early for the next window opening so the fast cadence starts on time
+    wake = due
+    if upcoming and mode == "idle":
+        wake = min(wake, upcoming[0] - WINDOW_BEFORE)
+    return max(1.0, min(MAX_SLEEP, (wake - now).total_seconds()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh the current season on an NFL-aware schedule")
+    parser.add_argument("--once", action="store_true", help="Run a single check and exit")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = load_state()
+    print(f"🕒 Refresh scheduler started (every {FAST_INTERVAL} in game windows, {SLOW_INTERVAL} otherwise)")
+    while True:
+        sleep_for = tick(state)
+        if args.once:
+            break
+        try:
+            time.sleep(sleep_for)
+        except KeyboardInterrupt:
+            print("👋 Scheduler stopped")
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# scripts/run_pipeline.py
+"""
+Incremental pipeline orchestrator — the whole refresh in one process.
+
+Stages form a small DAG:
+
+    fetch → validate ─┬→ process_rosters ──────────────┬→ materialize
+                      └→ build_scores → combine_seasons ┴→ player_points
+
+Each stage is the existing script, executed in this interpreter with
+runpy, so pandas / yahoo_fantasy_api are imported once. Every stage lists
+its input and output files; after a successful run their content
+fingerprints are saved to data/combined/pipeline_state.json, and the next
+run skips a stage whose inputs and outputs still match. fetch has no local
+inputs and always runs unless --no-fetch is given, which also disables
+player_points (weekly player points from the Yahoo API, needed by the
+optimal-lineup, alt-scoring and player pages). Ready stages run in
+parallel (process_rosters alongside the score build), output lines are
+prefixed with the stage name, and a timing report is printed at the end.
+Only one run at a time: a second one (another job, a manual run) exits
+while data/jobs/pipeline.lock is held.
+"""
+
+import argparse
+import glob
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, rely on the job runner's single-flight
+    fcntl = None
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from tools.materialized import source_fingerprint
+
+STATE_PATH = Path("data/combined/pipeline_state.json")
+LOCK_PATH = Path("data/jobs/pipeline.lock")
+
+RAW_JSON = "data/raw/api/**/*.json"
+FRANCHISE_MAP = "data/franchise_map.*"   # .csv or .yaml / .yml
+
+# name -> script, upstream stages, input globs, output globs; "network" stages call Yahoo
+STAGES: Dict[str, dict] = {
+    "fetch": {
+        "script": "scripts/fetch_historical_data.py",
+        "deps": [],
+        "inputs": [],
+        "outputs": [RAW_JSON],
+        "always": True,
+        "network": True,
+    },
+    "validate": {
+        "script": "scripts/validate_historical_data.py",
+        "deps": ["fetch"],
+        "inputs": [RAW_JSON],
+        "outputs": [],
+    },
+    "process_rosters": {
+        "script": "scripts/process_historical_data.py",
+        "deps": ["validate"],
+        "inputs": ["data/raw/api/*/rosters/**/*.json"],
+        "outputs": ["data/combined/all_rosters.csv", "data/combined/roster_events.csv"],
+    },
+    "build_scores": {
+        "script": "scripts/build_scores_from_raw.py",
+        "deps": ["validate"],
+        # build_resolution_table runs here, so a franchise map edit must rerun it
+        "inputs": ["data/raw/api/*/scoreboard_week_*.json", FRANCHISE_MAP],
+        # all_scores.csv is rewritten by combine_seasons, so it is not tracked here
+        "outputs": ["data/scores_*.csv", "data/combined/franchise_resolution.csv",
+                    "data/combined/leaderboards.json", "data/combined/head_to_head.npz",
+                    "data/combined/elo.json"],
+    },
+    "combine_seasons": {
+        "script": "tools/combine_all_seasons.py",
+        "deps": ["build_scores"],
+        "inputs": ["data/scores_*.csv", "data/player_stats_*.csv", FRANCHISE_MAP],
+        "outputs": ["data/combined/all_scores.csv", "data/combined/all_player_stats.csv"],
+    },
+    "materialize": {
+        "script": "scripts/materialize_aggregates.py",
+        "deps": ["combine_seasons", "process_rosters"],
+        "inputs": ["data/combined/all_scores.csv", "data/combined/all_rosters.csv",
+                   "data/combined/franchise_resolution.csv"],
+        "outputs": ["data/materialized/manifest.json"],
+    },
+    "player_points": {
+        "script": "scripts/fetch_player_points.py",
+        # all_scores.csv decides which weeks are final and must be fetched again later
+        "deps": ["process_rosters", "combine_seasons"],
+        "inputs": ["data/combined/all_rosters.csv", "data/combined/all_scores.csv"],
+        # player_index.npz is rebuilt from rosters + points, so it belongs to this stage
+        "outputs": ["data/combined/all_player_points.csv", "data/combined/player_stat_matrix.npz",
+                    "data/combined/player_index.npz"],
+        "network": True,
+    },
+}
+
+
+class _StageOutput:
+    """sys.stdout stand-in that prefixes each line with the writing thread's stage."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        buf = getattr(self.local, "buf", "") + text
+        *lines, self.local.buf = buf.split("\n")
+        stage = getattr(self.local, "stage", None)
+        with self.lock:
+            for line in lines:
+                self.stream.write(f"[{stage}] {line}\n" if stage else line + "\n")
+            self.stream.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        rest = getattr(self.local, "buf", "")
+        if rest:
+            self.local.buf = ""
+            self.write(rest + "\n")
+        self.stream.flush()
+
+
+def _files(patterns: List[str]) -> List[str]:
+    out = set()
+    for pattern in patterns:
+        out.update(glob.glob(pattern, recursive=True))
+    return sorted(out)
+
+
+def _fingerprint(patterns: List[str]) -> str:
+    return source_fingerprint(_files(patterns)) if patterns else ""
+
+
+def load_state(path: Path = STATE_PATH) -> Dict[str, dict]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: Dict[str, dict], path: Path = STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def is_up_to_date(name: str, state: Dict[str, dict]) -> bool:
+    spec, prev = STAGES[name], state.get(name)
+    if spec.get("always") or not prev:
+        return False
+    if spec["outputs"] and not _files(spec["outputs"]):
+        return False
+    return prev.get("inputs") == _fingerprint(spec["inputs"]) and \
+        prev.get("outputs") == _fingerprint(spec["outputs"])
+
+
+def _run_stage(name: str, out: _StageOutput, args: List[str]) -> None:
+    out.local.stage = name
+    if args:
+        # Only fetch takes arguments, and nothing runs alongside it
+        sys.argv = [STAGES[name]["script"], *args]
+    try:
+        runpy.run_path(str(ROOT / STAGES[name]["script"]), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"{name} exited with code {e.code}")
+    finally:
+        out.flush()
+        out.local.stage = None
+
+
+def _lock_pipeline():
+    """Open file holding an exclusive lock (released when the process exits), or None if busy."""
+    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    f = LOCK_PATH.open("w")
+    if fcntl is not None:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return None
+    return f
+
+
+def run_pipeline(force: bool = False, no_fetch: bool = False, workers: int = 2,
+                 current_season: bool = False) -> Dict[str, dict]:
+    """Run every stage that is out of date; returns {stage: {"status", "seconds"}}.
+
+    ``current_season`` makes fetch incremental (latest season, recent weeks only).
+    """
+    os.chdir(ROOT)
+    lock = _lock_pipeline()
+    if lock is None:
+        print("⚠️ Another pipeline run is in progress; not starting a second one.")
+        return {}
+    state = {} if force else load_state()
+    report: Dict[str, dict] = {}
+    pending = dict(STAGES)
+    running = {}
+    real_stdout, real_argv = sys.stdout, sys.argv
+    out = _StageOutput(real_stdout)
+    sys.stdout = out
+    sys.argv = sys.argv[:1]   # stage scripts parse their own (default) arguments
+    t_start = time.time()
+
+    def finish(name: str, status: str, seconds: float = 0.0) -> None:
+        report[name] = {"status": status, "seconds": round(seconds, 2)}
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                for name, spec in list(pending.items()):
+                    if any(report.get(d, {}).get("status") in ("failed", "blocked") for d in spec["deps"]):
+                        finish(name, "blocked")
+                        del pending[name]
+                    elif all(d in report for d in spec["deps"]):
+                        del pending[name]
+                        if spec.get("network") and no_fetch:
+                            finish(name, "disabled")
+                        elif not force and is_up_to_date(name, state):
+                            finish(name, "skipped")
+                        else:
+                            args = ["--current"] if name == "fetch" and current_season else []
+                            running[pool.submit(_run_stage, name, out, args)] = (name, time.time())
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name, t0 = running.pop(fut)
+                    sys.argv = real_argv[:1]
+                    try:
+                        fut.result()
+                    except Exception as e:
+                        print(f"❌ {name} failed: {e}", file=real_stdout)
+                        finish(name, "failed", time.time() - t0)
+                        continue
+                    finish(name, "ran", time.time() - t0)
+                    spec = STAGES[name]
+                    state[name] = {
+                        "inputs": _fingerprint(spec["inputs"]),
+                        "outputs": _fingerprint(spec["outputs"]),
+                        "finished_at": datetime.now().isoformat(timespec="seconds"),
+                    }
+                    _save_state(state)
+    finally:
+        out.flush()
+        sys.stdout, sys.argv = real_stdout, real_argv
+        lock.close()
+
+    print("\n⏱️ Pipeline timing")
+    for name in STAGES:
+        r = report.get(name, {"status": "not run", "seconds": 0.0})
+        print(f"  {name:<16} {r['status']:<9} {r['seconds']:>8.2f}s")
+    print(f"  {'total':<16} {'':<9} {time.time() - t_start:>8.2f}s")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Run every stage even if up to date")
+    parser.add_argument("--no-fetch", action="store_true",
+                        help="Skip the Yahoo fetches; rebuild from local raw data")
+    parser.add_argument("--workers", type=int, default=2, help="Stages allowed to run at once")
+    parser.add_argument("--current-season", action="store_true",
+                        help="Incremental fetch: latest season, last and current week only")
+    args = parser.parse_args()
+    report = run_pipeline(force=args.force, no_fetch=args.no_fetch, workers=args.workers,
+                          current_season=args.current_season)
+    if not report or any(r["status"] in ("failed", "blocked") for r in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@
 
 import json
 from pathlib import Path
+import sys
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.roster_store import load_team_weeks
+
 BASE_DIR = Path("data/raw/api")
 
 
@@ -50,15 +54,14 @@ def validate_year(year_dir: Path):
         for team_dir in rosters_dir.iterdir():
             if not team_dir.is_dir():
                 continue
-            week_files = list(team_dir.glob("week_*.json"))
-            roster_counts_by_team[team_dir.name] = len(week_files)
+            roster_counts_by_team[team_dir.name] = len(load_team_weeks(team_dir))
 
         if roster_counts_by_team:
             print("  Rosters:")
             for team_name, count in sorted(roster_counts_by_team.items()):
-                print(f"    {team_name}: {count} week file(s)")
+                print(f"    {team_name}: {count} week(s)")
         else:
-            issues.append("rosters dir exists but no week_*.json files found")
+            issues.append("rosters dir exists but no stored roster weeks found")
     else:
         issues.append("missing rosters directory")
 
@@ -0,0 +1,145 @@
+"""
+Aggregate tables materialized by scripts/materialize_aggregates.py.
+
+Each builder takes the raw team-week scores frame (one row per team per
+week, as written to data/combined/all_scores.csv) and returns a small
+table the pages can read instead of grouping the raw frame on every rerun.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Bump when a table's columns or meaning change; readers ignore old builds.
+SCHEMA_VERSIONS = {
+    "season_team_summary": 1,
+    "week_league_stats": 1,
+    "weekly_awards": 1,
+    "team_week_z": 1,
+}
+
+
+def played_weeks(scores: pd.DataFrame) -> pd.DataFrame:
+    """Keep finished team-weeks: not still 0.0–0.0 and, when matchup_status is known, "postevent".
+
+    Live refreshes store in-progress weeks; their partial scores must not
+    reach records or standings until the matchup is over.
+    """
+    df = scores.copy()
+    df["points_for"] = pd.to_numeric(df["points_for"], errors="coerce").fillna(0.0)
+    df["points_against"] = pd.to_numeric(df["points_against"], errors="coerce").fillna(0.0)
+    played = (df["points_for"] > 0) | (df["points_against"] > 0)
+    if "matchup_status" in df.columns:
+        # Rows from older ingests have no status; they are historical and final
+        played &= df["matchup_status"].fillna("postevent") == "postevent"
+    return df[played]
+
+
+def season_team_summary(scores: pd.DataFrame) -> pd.DataFrame:
+    """Season × team summary: games, W/L/T, PF, PA, averages, win% and std of PF."""
+    df = played_weeks(scores)
+    df["win"] = (df["points_for"] > df["points_against"]).astype(int)
+    df["loss"] = (df["points_for"] < df["points_against"]).astype(int)
+    df["tie"] = (df["points_for"] == df["points_against"]).astype(int)
+
+    has_proj = "projected_points" in df.columns
+    if has_proj:
+        df["projected_points"] = pd.to_numeric(df["projected_points"], errors="coerce")
+        df["luck"] = df["points_for"] - df["projected_points"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df["efficiency"] = df["points_for"] / df["projected_points"]
+
+    aggs = dict(
+        games=("week", "count"),
+        wins=("win", "sum"),
+        losses=("loss", "sum"),
+        ties=("tie", "sum"),
+        pf=("points_for", "sum"),
+        pa=("points_against", "sum"),
+        avg_pf=("points_for", "mean"),
+        avg_pa=("points_against", "mean"),
+        std_pf=("points_for", "std"),
+    )
+    if "team_key" in df.columns:
+        aggs["team_key"] = ("team_key", "last")
+    if has_proj:
+        aggs.update(avg_projected=("projected_points", "mean"),
+                    avg_luck=("luck", "mean"),
+                    eff=("efficiency", "mean"))
+
+    summary = (
+        df.groupby(["season", "team", "manager"], dropna=False)
+          .agg(**aggs)
+          .reset_index()
+    )
+    summary["win_pct"] = summary["wins"] / summary["games"]
+    summary["std_pf"] = summary["std_pf"].fillna(0.0)
+    return summary.sort_values(["season", "team"]).reset_index(drop=True)
+
+
+def week_league_stats(scores: pd.DataFrame) -> pd.DataFrame:
+    """League-wide scoring distribution for every (season, week)."""
+    df = played_weeks(scores)
+    g = df.groupby(["season", "week"])["points_for"]
+    stats = g.agg(teams="count", total="sum", mean="mean", std="std", min="min", max="max").reset_index()
+    q = g.quantile([0.25, 0.5, 0.75]).unstack()
+    q.columns = ["q25", "median", "q75"]
+    stats = stats.merge(q.reset_index(), on=["season", "week"], how="left")
+    stats["std"] = stats["std"].fillna(0.0)
+    return stats.sort_values(["season", "week"]).reset_index(drop=True)
+
+
+def team_week_zscores(scores: pd.DataFrame) -> pd.DataFrame:
+    """Era-adjusted scores for every team-week.
+
+    z_week is relative to that week's league scores (week_league_stats),
+    z_season to every team-week of the same season. era_adjusted_pf maps
+    z_season back onto the all-time scoring level so 2011 and 2025 weeks
+    can share one leaderboard.
+    """
+    df = played_weeks(scores)
+    week = week_league_stats(df)[["season", "week", "mean", "std"]]
+    df = df.merge(week.rename(columns={"mean": "week_mean", "std": "week_std"}), on=["season", "week"], how="left")
+
+    season = df.groupby("season")["points_for"]
+    df["season_mean"] = season.transform("mean")
+    df["season_std"] = season.transform("std")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df["z_week"] = ((df["points_for"] - df["week_mean"]) / df["week_std"]).replace([np.inf, -np.inf], np.nan)
+        df["z_season"] = ((df["points_for"] - df["season_mean"]) / df["season_std"]).replace([np.inf, -np.inf], np.nan)
+    df["era_adjusted_pf"] = df["points_for"].mean() + df["z_season"] * df["points_for"].std()
+
+    cols = [c for c in ["season", "week", "team_key", "team", "manager", "opponent", "points_for",
+                        "points_against", "week_mean", "week_std", "z_week", "z_season", "era_adjusted_pf"]
+            if c in df.columns]
+    out = df[cols].copy()
+    out[["z_week", "z_season"]] = out[["z_week", "z_season"]].round(4)
+    out["era_adjusted_pf"] = out["era_adjusted_pf"].round(2)
+    return out.sort_values(["season", "week", "team"]).reset_index(drop=True)
+
+
+def weekly_awards(scores: pd.DataFrame) -> pd.DataFrame:
+    """High score, low score and biggest blowout winners for every (season, week)."""
+    df = played_weeks(scores).reset_index(drop=True)
+    df["margin"] = df["points_for"] - df["points_against"]
+    g = df.groupby(["season", "week"])
+
+    parts = []
+    for award, idx, value_col in [
+        ("High Score", g["points_for"].idxmax(), "points_for"),
+        ("Low Score", g["points_for"].idxmin(), "points_for"),
+        ("Biggest Blowout", g["margin"].idxmax(), "margin"),
+    ]:
+        rows = df.loc[idx.values, ["season", "week", "team", "manager", "opponent", value_col]]
+        parts.append(rows.rename(columns={value_col: "value"}).assign(award=award))
+
+    awards = pd.concat(parts, ignore_index=True)
+    cols = ["season", "week", "award", "team", "manager", "opponent", "value"]
+    return awards[cols].sort_values(["season", "week", "award"]).reset_index(drop=True)
+
+
+BUILDERS = {
+    "season_team_summary": season_team_summary,
+    "week_league_stats": week_league_stats,
+    "weekly_awards": weekly_awards,
+    "team_week_z": team_week_zscores,
+}
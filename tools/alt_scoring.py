@@ -0,0 +1,178 @@
+"""
+Alternative-scoring engine ("what if we had used PPR?").
+
+Raw weekly stat lines saved by scripts/fetch_player_points.py are packed
+into a columnar matrix: one row per player-week, one float32 column per
+Yahoo stat_id, persisted to data/combined/player_stat_matrix.npz. Fantasy
+points under any scoring settings are then a single matrix-vector product
+``values @ modifiers``; starters (selected_position in all_rosters.csv)
+are summed per team-week and re-paired with the real schedule to give
+rescored team scores and standings.
+
+Only linear per-stat modifiers are applied; Yahoo yardage bonuses are not
+part of the stat_modifiers payload this league uses.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import season_team_summary
+from tools.standings import is_flag
+
+DATA_DIR = "data"
+MATRIX_PATH = os.path.join(DATA_DIR, "combined", "player_stat_matrix.npz")
+
+# Yahoo stat ids
+STAT_PASS_TD = 5
+STAT_RECEPTIONS = 11
+
+PRESETS = {
+    "League settings": {},
+    "Standard (no PPR)": {STAT_RECEPTIONS: 0.0},
+    "Full PPR": {STAT_RECEPTIONS: 1.0},
+    "6-pt passing TD": {STAT_PASS_TD: 6.0},
+    "Full PPR + 6-pt passing TD": {STAT_RECEPTIONS: 1.0, STAT_PASS_TD: 6.0},
+}
+
+BENCH_SLOTS = {"BN", "IR", "IR+", "NA"}
+
+
+def _league_settings(data_dir: str) -> dict:
+    with open(os.path.join(data_dir, "debug_settings.json"), "r", encoding="utf-8") as f:
+        return json.load(f)["fantasy_content"]["league"][1]["settings"][0]
+
+
+def load_stat_modifiers(data_dir: str = DATA_DIR) -> Dict[int, float]:
+    """stat_id -> points per unit from the league settings."""
+    try:
+        stats = _league_settings(data_dir)["stat_modifiers"]["stats"]
+        return {int(s["stat"]["stat_id"]): float(s["stat"]["value"]) for s in stats}
+    except Exception as e:
+        print(f"⚠️ Could not read stat modifiers: {e}")
+        return {}
+
+
+def load_stat_names(data_dir: str = DATA_DIR) -> Dict[int, str]:
+    """stat_id -> display name from the league settings."""
+    try:
+        stats = _league_settings(data_dir)["stat_categories"]["stats"]
+        return {int(s["stat"]["stat_id"]): s["stat"].get("display_name") or s["stat"].get("name") for s in stats}
+    except Exception:
+        return {}
+
+
+def _iter_stat_lines(raw_base: Path):
+    """(year, week, player_key, {stat_id: value}) for every saved players/stats response."""
+    for year_dir in sorted(raw_base.iterdir()):
+        pp_dir = year_dir / "player_points"
+        if not year_dir.name.isdigit() or not pp_dir.exists():
+            continue
+        # Oldest first, so a re-fetched (live → final) week's newer lines win the dedupe below
+        for path in sorted(pp_dir.glob("week_*.json"), key=lambda p: (p.stat().st_mtime, p.name)):
+            week = int(path.stem.split("_")[1])
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            league = data.get("fantasy_content", {}).get("league", [])
+            players = league[1].get("players", {}) if len(league) > 1 and isinstance(league[1], dict) else {}
+            for k, v in players.items():
+                if k == "count" or not isinstance(v, dict) or not v.get("player"):
+                    continue
+                blocks = v["player"]
+                meta = {}
+                for item in blocks[0]:
+                    if isinstance(item, dict):
+                        meta.update(item)
+                line = {}
+                for block in blocks[1:]:
+                    if isinstance(block, dict) and "player_stats" in block:
+                        for s in block["player_stats"].get("stats", []):
+                            try:
+                                line[int(s["stat"]["stat_id"])] = float(s["stat"]["value"])
+                            except (KeyError, TypeError, ValueError):
+                                continue
+                yield int(year_dir.name), week, meta.get("player_key"), line
+
+
+def build_stat_matrix(raw_base: str = os.path.join(DATA_DIR, "raw", "api"), path: str = MATRIX_PATH) -> dict:
+    """Pack every saved stat line into the columnar matrix and persist it."""
+    keys, lines = [], []
+    for year, week, player_key, line in _iter_stat_lines(Path(raw_base)):
+        keys.append((year, week, player_key))
+        lines.append(line)
+
+    stat_ids = np.array(sorted({s for line in lines for s in line}), dtype=np.int32)
+    col = {s: i for i, s in enumerate(stat_ids.tolist())}
+    values = np.zeros((len(lines), len(stat_ids)), dtype=np.float32)
+    for r, line in enumerate(lines):
+        for s, v in line.items():
+            values[r, col[s]] = v
+
+    index = pd.DataFrame(keys, columns=["year", "week", "player_key"]).drop_duplicates(keep="last")
+    matrix = {
+        "year": index["year"].to_numpy(np.int32),
+        "week": index["week"].to_numpy(np.int32),
+        "player_key": index["player_key"].astype(str).to_numpy(dtype=str),
+        "stat_ids": stat_ids,
+        "values": values[index.index.to_numpy()],
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp, **matrix)
+    os.replace(tmp, path)
+    print(f"✅ Stat matrix: {len(index):,} player-weeks × {len(stat_ids)} stats → {path}")
+    return matrix
+
+
+def load_stat_matrix(path: str = MATRIX_PATH) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as z:
+        return {k: z[k] for k in z.files}
+
+
+def modifier_vector(matrix: dict, modifiers: Dict[int, float]) -> np.ndarray:
+    """Modifiers aligned to the matrix's stat columns (0 for unscored stats)."""
+    return np.array([modifiers.get(int(s), 0.0) for s in matrix["stat_ids"]], dtype=np.float32)
+
+
+def player_points(matrix: dict, modifiers: Dict[int, float]) -> pd.DataFrame:
+    """Fantasy points for every player-week under ``modifiers`` (one mat-vec product)."""
+    pts = matrix["values"] @ modifier_vector(matrix, modifiers)
+    return pd.DataFrame({
+        "year": matrix["year"],
+        "week": matrix["week"],
+        "player_key": matrix["player_key"],
+        "points": pts.astype(float).round(2),
+    })
+
+
+def rescore_season(season: int, matrix: dict, modifiers: Dict[int, float],
+                   rosters: pd.DataFrame, scores: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Team scores and standings for ``season`` under ``modifiers``.
+
+    ``rosters`` is all_rosters.csv, ``scores`` the season's team-week scores
+    (for the schedule). Returns {"scores": ..., "standings": ...}.
+    """
+    in_season = matrix["year"] == season
+    sub = {k: (v[in_season] if k != "stat_ids" else v) for k, v in matrix.items()}
+    pts = player_points(sub, modifiers)
+
+    r = rosters[(rosters["year"] == season) & ~rosters["selected_position"].isin(BENCH_SLOTS)].copy()
+    r["player_key"] = r["team_key"].astype(str).str.split(".").str[0] + ".p." + r["player_id"].astype(int).astype(str)
+    r = r.merge(pts, on=["year", "week", "player_key"], how="left")
+    totals = r.groupby(["week", "team_key"])["points"].sum()
+
+    s = scores[scores["season"] == season].copy()
+    s = s[(s["points_for"] > 0) | (s["points_against"] > 0)]
+    s["actual_points_for"] = s["points_for"]
+    s["points_for"] = pd.MultiIndex.from_arrays([s["week"], s["team_key"]]).map(totals).fillna(0.0).round(2)
+    s["points_against"] = pd.MultiIndex.from_arrays([s["week"], s["opponent_key"]]).map(totals).fillna(0.0).round(2)
+
+    reg = s[~is_flag(s["is_playoffs"])] if "is_playoffs" in s.columns else s
+    standings = season_team_summary(reg)
+    return {"scores": s, "standings": standings}
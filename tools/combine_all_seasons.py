@@ -4,7 +4,11 @@ and attach franchise IDs from data/franchise_map.csv
 """
 
 import pandas as pd
-import os, glob
+import os, glob, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.franchise_resolution import attach_franchise_ids, load_resolution_table
+from tools.franchise_resolver import FranchiseResolver
 
 DATA_DIR = "data"
 OUTPUT_DIR = "data/combined"
@@ -20,19 +24,17 @@ else:
     print("⚠️ No franchise_map.csv found — proceeding without ID mapping.")
     franchise_df = pd.DataFrame(columns=["franchise_id", "manager_name", "aliases"])
 
-# --- Helper function to find franchise ID ---
-def find_franchise(row):
-    team = str(row.get("team", "")).lower()
-    manager = str(row.get("manager", "")).lower()
-
-    for _, f in franchise_df.iterrows():
-        if f["manager_name"] and f["manager_name"] in manager:
-            return f["franchise_id"]
+# --- Compile the franchise map once (exact dicts + substring automaton) ---
+resolver = FranchiseResolver.from_frame(franchise_df)
+resolution = load_resolution_table(data_dir=DATA_DIR)
 
-        aliases = [a.strip().lower() for a in f["aliases"].split(";") if a.strip()]
-        if any(a in team for a in aliases):
-            return f["franchise_id"]
-    return "UNMATCHED"
+def find_franchise(df):
+    """Join the ingest-time resolution table; resolve only rows it does not cover."""
+    out = attach_franchise_ids(df, resolution)
+    pending = out["match_rule"].isna()
+    if pending.any():
+        out.loc[pending, "franchise_id"] = resolver.resolve_frame(df[pending])["franchise_id"]
+    return out["franchise_id"].fillna("UNMATCHED")
 
 # --- Combine all scores ---
 score_files = sorted(glob.glob(os.path.join(DATA_DIR, "scores_*.csv")))
@@ -40,7 +42,7 @@ all_scores = []
 for f in score_files:
     df = pd.read_csv(f)
     df["source_file"] = os.path.basename(f)
-    df["franchise_id"] = df.apply(find_franchise, axis=1)
+    df["franchise_id"] = find_franchise(df)
     all_scores.append(df)
 
 if all_scores:
@@ -56,7 +58,7 @@ all_stats = []
 for f in stat_files:
     df = pd.read_csv(f)
     df["source_file"] = os.path.basename(f)
-    df["franchise_id"] = df.apply(find_franchise, axis=1)
+    df["franchise_id"] = find_franchise(df)
     all_stats.append(df)
 
 if all_stats:
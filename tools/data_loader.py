@@ -9,6 +9,21 @@ try:
 except Exception:
     DATA_DIR = "data"
 
+# Franchise attribution is shared with the plain loaders (tools/loaders.py);
+# attach_franchise accepts the dict returned by load_franchise_map below.
+from tools.loaders import attach_franchise  # noqa: F401
+from tools.loaders import load_player_points_all, load_rosters_all
+from tools.tables import SCHEMA_VERSIONS
+from tools.materialized import read_table, table_version
+from tools.percentile_index import PercentileIndex
+from tools.player_index import PlayerIndex
+from tools import leaderboards, head_to_head, elo, playoff_odds, win_probability, lineups, alt_scoring, roster_transactions, roster_composition, schedule_luck
+
+# Cached readers below take a source file's mtime (or a materialized table's
+# version) as an argument they never use: it is only part of the cache key, so
+# a new ingest, fetch or rebuild invalidates the entry. The public load_*
+# wrappers look it up on every call and pass it in.
+
 
 # --- Franchise map loader supporting YAML and CSV ---
 @st.cache_data(show_spinner=False)
@@ -170,4 +185,311 @@ def load_data_universal(data_dir: str = DATA_DIR):
         seasons_players = sorted(set(seasons_players))
         print(f"📆 Loaded player stats seasons: {seasons_players}")
 
-    return scores_df, players_df
\ No newline at end of file
+    return scores_df, players_df
+
+# --- Materialized tables (built by scripts/materialize_aggregates.py) ---
+@st.cache_data(show_spinner=False)
+def _read_materialized(name: str, version: int, schema_version, out_dir: str):
+    return read_table(name, schema_version=schema_version, out_dir=out_dir)
+
+
+def load_materialized(name: str, data_dir: str = DATA_DIR):
+    """Load a precomputed table from <data_dir>/materialized.
+
+    Returns an empty DataFrame when the table has not been built (or was
+    built with an older schema); callers fall back to computing from scores.
+    """
+    out_dir = os.path.join(data_dir, "materialized")
+    return _read_materialized(
+        name,
+        table_version(name, out_dir),
+        SCHEMA_VERSIONS.get(name),
+        out_dir,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _percentile_index(column: str, version: int, out_dir: str):
+    table = read_table("team_week_z", schema_version=SCHEMA_VERSIONS.get("team_week_z"), out_dir=out_dir)
+    return PercentileIndex.from_table(table, column)
+
+
+def load_percentile_index(column: str = "points_for", data_dir: str = DATA_DIR) -> PercentileIndex:
+    """Sorted-array percentile index over every team-week's ``column`` from the team_week_z table."""
+    out_dir = os.path.join(data_dir, "materialized")
+    return _percentile_index(column, table_version("team_week_z", out_dir), out_dir)
+
+
+# --- All-time record leaderboards (maintained at ingest by build_scores_from_raw.py) ---
+@st.cache_data(show_spinner=False)
+def _read_leaderboards(path: str, mtime: float):
+    return leaderboards.load_leaderboards(path)
+
+
+def load_record_leaderboards(data_dir: str = DATA_DIR):
+    """Persisted top-K leaderboards, or None if they have not been built yet."""
+    path = os.path.join(data_dir, "combined", "leaderboards.json")
+    if not os.path.exists(path):
+        return None
+    return _read_leaderboards(path, os.path.getmtime(path))
+
+
+# --- All-time franchise head-to-head matrix (maintained at ingest by build_scores_from_raw.py) ---
+@st.cache_data(show_spinner=False)
+def _read_head_to_head(path: str, mtime: float):
+    return head_to_head.load_head_to_head(path)
+
+
+def load_head_to_head_matrix(data_dir: str = DATA_DIR):
+    """Persisted franchise × franchise head-to-head arrays, or None if not built yet."""
+    path = os.path.join(data_dir, "combined", "head_to_head.npz")
+    if not os.path.exists(path):
+        return None
+    return _read_head_to_head(path, os.path.getmtime(path))
+
+
+# --- Elo ratings (maintained at ingest by build_scores_from_raw.py) ---
+@st.cache_data(show_spinner=False)
+def _read_elo(path: str, mtime: float):
+    return elo.load_elo(path)
+
+
+def load_elo_state(data_dir: str = DATA_DIR):
+    """Persisted Elo state, or None if it has not been built yet."""
+    path = os.path.join(data_dir, "combined", "elo.json")
+    if not os.path.exists(path):
+        return None
+    return _read_elo(path, os.path.getmtime(path))
+
+
+# --- Live-season playoff odds ---
+@st.cache_data(show_spinner=False)
+def _live_season(path: str, mtime: float, settings_mtime: float, data_dir: str):
+    settings = playoff_odds.load_playoff_settings(data_dir)
+    return playoff_odds.season_in_progress(pd.read_csv(path), settings)
+
+
+def live_season(data_dir: str = DATA_DIR):
+    """The league's current season while it is still being played, else None."""
+    settings_path = os.path.join(data_dir, "debug_settings.json")
+    season = playoff_odds.load_playoff_settings(data_dir)["season"] if os.path.exists(settings_path) else None
+    path = os.path.join(data_dir, f"scores_{season}.csv")
+    if season is None or not os.path.exists(path):
+        return None
+    in_progress = _live_season(path, os.path.getmtime(path), os.path.getmtime(settings_path), data_dir)
+    return season if in_progress else None
+
+
+@st.cache_data(show_spinner=False)
+def _playoff_odds(path: str, mtime: float, data_dir: str, n_sims: int, workers: int):
+    # A failed run raises and is not cached, so the next rerun simply retries
+    settings = playoff_odds.load_playoff_settings(data_dir)
+    return playoff_odds.simulate_playoff_odds(pd.read_csv(path), settings, n_sims, workers)
+
+
+def load_playoff_odds(season: int, data_dir: str = DATA_DIR, n_sims: int = playoff_odds.N_SIMS,
+                      workers: int = 1):
+    """Playoff odds for ``season``, simulated once per version of its scores file."""
+    path = os.path.join(data_dir, f"scores_{season}.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return _playoff_odds(path, os.path.getmtime(path), data_dir, n_sims, workers)
+
+
+# --- Historical projection error for the live win-probability model ---
+@st.cache_data(show_spinner=False)
+def _projection_error_sd(path: str, mtime: float) -> float:
+    return win_probability.projection_error_sd(pd.read_csv(path))
+
+
+def load_projection_error_sd(data_dir: str = DATA_DIR) -> float:
+    """Sd of final score around the projection across all seasons (default if no history yet)."""
+    path = os.path.join(data_dir, "combined", "all_scores.csv")
+    if not os.path.exists(path):
+        return win_probability.DEFAULT_SIGMA
+    return _projection_error_sd(path, os.path.getmtime(path))
+
+
+# --- Player weekly points (scripts/fetch_player_points.py) joined onto rosters ---
+@st.cache_data(show_spinner=False)
+def _read_player_points(mtime: float):
+    return load_player_points_all()
+
+
+def load_player_points(season=None, data_dir: str = DATA_DIR):
+    """Player-weeks with actual_points for ``season`` (all seasons if None); empty until fetched."""
+    path = os.path.join(data_dir, "combined", "all_player_points.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    df = _read_player_points(os.path.getmtime(path))
+    return df if season is None or df.empty else df[df["season"] == int(season)]
+
+
+# --- Optimal lineups / bench points (tools/lineups.py) over the player points ---
+@st.cache_data(show_spinner=False)
+def _optimal_lineups(mtime: float):
+    points = load_player_points_all()
+    if points.empty or not {"eligible_mask", "eligible_positions"} & set(points.columns):
+        return pd.DataFrame()
+    return lineups.optimal_lineups(points)
+
+
+def load_optimal_lineups(data_dir: str = DATA_DIR):
+    """Per team-week actual/optimal/bench points; empty until player points are fetched."""
+    path = os.path.join(data_dir, "combined", "all_player_points.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return _optimal_lineups(os.path.getmtime(path))
+
+
+# --- Columnar stat x player-week matrix for the alternative-scoring engine ---
+@st.cache_resource(show_spinner=False)
+def _read_stat_matrix(path: str, mtime: float):
+    return alt_scoring.load_stat_matrix(path)
+
+
+def load_stat_matrix(data_dir: str = DATA_DIR):
+    """Persisted stat matrix, or None until scripts/fetch_player_points.py has run."""
+    path = os.path.join(data_dir, "combined", "player_stat_matrix.npz")
+    if not os.path.exists(path):
+        return None
+    return _read_stat_matrix(path, os.path.getmtime(path))
+
+
+# --- What-if rescoring (tools/alt_scoring.py) ---
+@st.cache_data(show_spinner=False)
+def _read_scores(path: str, mtime: float):
+    return pd.read_csv(path)
+
+
+def load_scores(season=None, data_dir: str = DATA_DIR):
+    """Team-week scores for every season from data/combined/all_scores.csv, optionally one season."""
+    path = os.path.join(data_dir, "combined", "all_scores.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    df = _read_scores(path, os.path.getmtime(path))
+    return df[df["season"] == int(season)] if season is not None else df
+
+
+@st.cache_data(show_spinner=False)
+def _rescore_season(season: int, modifiers: tuple, matrix_mtime: float, rosters_mtime: float,
+                    scores_mtime: float, data_dir: str):
+    return alt_scoring.rescore_season(season, load_stat_matrix(data_dir), dict(modifiers),
+                                      load_rosters(season, data_dir=data_dir), load_scores(season, data_dir))
+
+
+def load_rescored_season(season: int, modifiers: dict, data_dir: str = DATA_DIR):
+    """rescore_season under ``modifiers``, computed once per (season, modifiers, input versions)."""
+    paths = [os.path.join(data_dir, "combined", f)
+             for f in ("player_stat_matrix.npz", "all_rosters.csv", "all_scores.csv")]
+    if not all(os.path.exists(p) for p in paths):
+        return None
+    mtimes = [os.path.getmtime(p) for p in paths]
+    return _rescore_season(int(season), tuple(sorted(modifiers.items())), *mtimes, data_dir)
+
+
+# --- Inferred roster transactions and tenure (maintained by process_historical_data.py) ---
+@st.cache_data(show_spinner=False)
+def _read_roster_events(path: str, mtime: float):
+    return roster_transactions.load_roster_events(path)
+
+
+def load_roster_events(data_dir: str = DATA_DIR):
+    """Add / drop / trade events inferred from consecutive roster weeks."""
+    path = os.path.join(data_dir, "combined", "roster_events.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=roster_transactions.EVENT_COLS)
+    return _read_roster_events(path, os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False)
+def _tenure_spans(path: str, mtime: float):
+    return roster_transactions.tenure_spans(pd.read_csv(path))
+
+
+def load_tenure_spans(data_dir: str = DATA_DIR):
+    """Consecutive-week stints of each player on each team."""
+    path = os.path.join(data_dir, "combined", "all_rosters.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return _tenure_spans(path, os.path.getmtime(path))
+
+
+# --- Player dimension / career index (rebuilt at ingest, see tools/player_index.py) ---
+@st.cache_resource(show_spinner=False)
+def _read_player_index(path: str, mtime: float):
+    return PlayerIndex.load(path)
+
+
+def load_player_index(data_dir: str = DATA_DIR):
+    """Persisted PlayerIndex, or None until scripts/process_historical_data.py has run."""
+    path = os.path.join(data_dir, "combined", "player_index.npz")
+    if not os.path.exists(path):
+        return None
+    return _read_player_index(path, os.path.getmtime(path))
+
+
+# --- Weekly rosters and the roster composition cube ---
+@st.cache_data(show_spinner=False)
+def _read_rosters(mtime: float):
+    df = load_rosters_all()
+    if not df.empty:
+        df["position"] = roster_composition.player_positions(df)
+    return df
+
+
+def load_rosters(season=None, week=None, data_dir: str = DATA_DIR):
+    """all_rosters.csv rows (compact dtypes plus primary position), optionally one season / week."""
+    path = os.path.join(data_dir, "combined", "all_rosters.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    df = _read_rosters(os.path.getmtime(path))
+    if season is not None:
+        df = df[df["year"] == int(season)]
+    if week is not None:
+        df = df[df["week"] == int(week)]
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _roster_composition(mtime: float):
+    return roster_composition.composition_cube(load_rosters_all())
+
+
+def load_roster_composition(data_dir: str = DATA_DIR):
+    """(season, week, team_key, position, slot) cube; computed from rosters if not materialized."""
+    cube = load_materialized("roster_composition", data_dir=data_dir)
+    if not cube.empty:
+        return cube
+    path = os.path.join(data_dir, "combined", "all_rosters.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return _roster_composition(os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False)
+def _team_names(path: str, mtime: float):
+    df = pd.read_csv(path, usecols=["team_key", "team", "manager"])
+    return df.drop_duplicates("team_key", keep="last").set_index("team_key")
+
+
+def load_team_names(data_dir: str = DATA_DIR):
+    """team_key -> team / manager for every season, from data/combined/all_scores.csv."""
+    path = os.path.join(data_dir, "combined", "all_scores.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["team", "manager"])
+    return _team_names(path, os.path.getmtime(path))
+
+
+# --- Schedule-swap matrix (same played regular-season weeks as schedule_luck) ---
+@st.cache_data(show_spinner=False)
+def _schedule_swap(path: str, mtime: float, season: int):
+    return schedule_luck.season_swap_wins(pd.read_csv(path), season)
+
+
+def load_schedule_swap(season: int, data_dir: str = DATA_DIR):
+    """Team × schedule wins for ``season`` from data/combined/all_scores.csv (empty if unavailable)."""
+    path = os.path.join(data_dir, "combined", "all_scores.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return _schedule_swap(path, os.path.getmtime(path), int(season))
@@ -0,0 +1,172 @@
+"""
+Incremental Elo rating engine across every season.
+
+Matchups are replayed in (season, week) order; all games within a week are
+updated together as one vectorized step. Playoff games move ratings more
+than regular-season games and consolation games less. At the start of each
+season every rating regresses part of the way back to the base.
+
+State is persisted to data/combined/elo.json after every ingest:
+  ratings   current rating per franchise
+  weeks     checksum per applied week
+  history   one row per franchise-week (rating before/after, Yahoo felo_score)
+Only weeks not yet applied are replayed; if an applied week changes, or a
+new week sorts before the last applied one, the whole history is rebuilt.
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.franchise_resolution import franchise_map_fingerprint
+from tools.head_to_head import matchup_rows
+from tools.standings import is_flag
+
+DATA_DIR = "data"
+ELO_PATH = os.path.join(DATA_DIR, "combined", "elo.json")
+
+BASE_RATING = 1500.0
+K_REGULAR = 20.0
+K_PLAYOFF = 32.0
+K_CONSOLATION = 8.0
+SEASON_REGRESSION = 0.25
+
+HISTORY_COLS = ["season", "week", "franchise", "team", "manager", "opponent_franchise",
+                "rating_before", "rating", "delta", "expected", "result", "felo_score"]
+
+
+def _params() -> dict:
+    return {"base": BASE_RATING, "k_regular": K_REGULAR, "k_playoff": K_PLAYOFF,
+            "k_consolation": K_CONSOLATION, "season_regression": SEASON_REGRESSION}
+
+
+def _games(scores: pd.DataFrame) -> pd.DataFrame:
+    """Team-weeks with both franchise keys, K factor and actual result."""
+    df = matchup_rows(scores)
+    consolation = is_flag(df["is_consolation"]) if "is_consolation" in df.columns else False
+    df["k"] = np.where(df["playoff"], K_PLAYOFF, np.where(consolation, K_CONSOLATION, K_REGULAR))
+    pf = df["points_for"].to_numpy(dtype=float)
+    pa = df["points_against"].to_numpy(dtype=float)
+    df["result"] = np.select([pf > pa, pf < pa], [1.0, 0.0], 0.5)
+    if "felo_score" not in df.columns:
+        df["felo_score"] = np.nan
+    return df.sort_values(["season", "week", "franchise"]).reset_index(drop=True)
+
+
+def _week_sums(df: pd.DataFrame) -> Dict[str, float]:
+    sums = df.groupby("week_key")[["points_for", "points_against"]].sum().sum(axis=1)
+    return {k: round(float(v), 2) for k, v in sums.items()}
+
+
+def _empty_state(data_dir: str) -> dict:
+    return {"params": _params(), "map_fingerprint": franchise_map_fingerprint(data_dir),
+            "season": None, "last_week": None, "weeks": {}, "ratings": {}, "history": []}
+
+
+def _apply(state: dict, games: pd.DataFrame) -> None:
+    """Replay ``games`` (already sorted) on top of ``state``, one week at a time."""
+    ratings = state["ratings"]
+    history = state["history"]
+
+    for (season, week), wk in games.groupby(["season", "week"], sort=True):
+        season, week = int(season), int(week)
+        if state["season"] is not None and season != state["season"]:
+            for f, r in ratings.items():
+                ratings[f] = r + SEASON_REGRESSION * (BASE_RATING - r)
+
+        own = np.array([ratings.get(f, BASE_RATING) for f in wk["franchise"]])
+        opp = np.array([ratings.get(f, BASE_RATING) for f in wk["opp_franchise"]])
+        expected = 1.0 / (1.0 + np.power(10.0, (opp - own) / 400.0))
+        delta = wk["k"].to_numpy() * (wk["result"].to_numpy() - expected)
+        after = own + delta
+
+        ratings.update(zip(wk["franchise"], after.tolist()))
+        felo = wk["felo_score"].astype(float)
+        history.extend(
+            {"season": season, "week": week, "franchise": f, "team": t, "manager": m,
+             "opponent_franchise": o, "rating_before": round(b, 2), "rating": round(a, 2),
+             "delta": round(d, 2), "expected": round(e, 4), "result": r,
+             "felo_score": None if pd.isna(fs) else fs}
+            for f, t, m, o, b, a, d, e, r, fs in zip(
+                wk["franchise"], wk["team"], wk["manager"], wk["opp_franchise"],
+                own.tolist(), after.tolist(), delta.tolist(), expected.tolist(),
+                wk["result"].tolist(), felo.tolist())
+        )
+        state["season"], state["last_week"] = season, week
+
+
+def build_elo(scores: pd.DataFrame, data_dir: str = DATA_DIR) -> dict:
+    games = _games(scores)
+    state = _empty_state(data_dir)
+    _apply(state, games)
+    state["weeks"] = _week_sums(games)
+    return state
+
+
+def load_elo(path: str = ELO_PATH) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Unreadable Elo state {path}: {e}")
+        return None
+
+
+def update_elo(scores: pd.DataFrame, path: str = ELO_PATH, data_dir: str = DATA_DIR) -> dict:
+    """Apply weeks not yet rated to the persisted state (full replay if history would change)."""
+    games = _games(scores)
+    sums = _week_sums(games)
+    state = load_elo(path)
+
+    if (state is None or state.get("params") != _params()
+            or state.get("map_fingerprint") != franchise_map_fingerprint(data_dir)):
+        state, reason = build_elo(scores, data_dir), "built"
+    else:
+        seen = state["weeks"]
+        changed = [w for w, v in sums.items() if w in seen and abs(seen[w] - v) > 1e-6]
+        new_weeks = [w for w in sums if w not in seen]
+        last = (state["season"], state["last_week"])
+        out_of_order = any(tuple(map(int, w.split("-"))) <= last for w in new_weeks)
+        if changed or out_of_order:
+            state, reason = build_elo(scores, data_dir), f"rebuilt ({len(changed)} changed weeks)"
+        elif new_weeks:
+            _apply(state, games[games["week_key"].isin(new_weeks)])
+            seen.update({w: sums[w] for w in new_weeks})
+            reason = f"applied {len(new_weeks)} new weeks"
+        else:
+            print(f"✅ Elo ratings up to date ({len(seen)} weeks)")
+            return state
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+    print(f"✅ Elo ratings {reason}: {len(state['ratings'])} franchises → {path}")
+    return state
+
+
+def rating_history(state: Optional[dict], franchise: Optional[str] = None) -> pd.DataFrame:
+    """Rating history as a DataFrame, optionally for a single franchise."""
+    if not state:
+        return pd.DataFrame(columns=HISTORY_COLS)
+    df = pd.DataFrame(state["history"], columns=HISTORY_COLS)
+    return df if franchise is None else df[df["franchise"] == franchise].reset_index(drop=True)
+
+
+def current_ratings(state: Optional[dict]) -> pd.DataFrame:
+    """Latest rating per franchise, best first."""
+    hist = rating_history(state)
+    if hist.empty:
+        return pd.DataFrame(columns=["rank", "franchise", "team", "manager", "rating", "peak", "games"])
+    latest = hist.groupby("franchise").agg(team=("team", "last"), manager=("manager", "last"),
+                                           peak=("rating", "max"), games=("week", "count"))
+    latest["rating"] = pd.Series(state["ratings"]).round(2)
+    latest = latest.reset_index().sort_values("rating", ascending=False).reset_index(drop=True)
+    latest["rank"] = np.arange(1, len(latest) + 1)
+    return latest[["rank", "franchise", "team", "manager", "rating", "peak", "games"]]
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 DATA_DIR = "data"
 os.makedirs(DATA_DIR, exist_ok=True)
 OUTPUT_FILE = os.path.join(DATA_DIR, "nfl_weekly_matchups.json")
+REQUEST_TIMEOUT = 20  # seconds; the refresh scheduler must never hang on ESPN
 
 def fetch_nfl_matchups():
     """
@@ -14,7 +15,11 @@ def fetch_nfl_matchups():
     print("🏈 Fetching current NFL matchups from ESPN...")
 
     url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-    response = requests.get(url)
+    try:
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        print(f"❌ Failed to fetch data: {e}")
+        return
     if response.status_code != 200:
         print(f"❌ Failed to fetch data: {response.status_code}")
         return
@@ -55,8 +60,11 @@ def fetch_nfl_matchups():
 
         matchups.append(matchup)
 
-    with open(OUTPUT_FILE, "w") as f:
+    # Write then rename so readers never see a half-written file
+    tmp = OUTPUT_FILE + ".tmp"
+    with open(tmp, "w") as f:
         json.dump(matchups, f, indent=2)
+    os.replace(tmp, OUTPUT_FILE)
 
     print(f"✅ Saved {len(matchups)} matchups → {OUTPUT_FILE}")
 
@@ -0,0 +1,173 @@
+"""
+Persisted team_key -> franchise_id resolution table.
+
+Built at ingest time (scripts/build_scores_from_raw.py) so franchise
+attribution runs once per new Yahoo team instead of on every page view:
+
+  data/combined/franchise_resolution.csv
+      season, league_id, team_id, team_key, team, manager, franchise_id, match_rule
+  data/combined/franchise_resolution.json
+      fingerprint of the franchise map the table was built from
+
+match_rule is one of manager / alias / fuzzy / unmatched. The table is
+only rebuilt in full when franchise_map.csv/.yaml changes; otherwise only
+team_keys not seen before are resolved and appended.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+import pandas as pd
+
+from tools.franchise_resolver import FranchiseResolver
+
+DATA_DIR = "data"
+RESOLUTION_PATH = os.path.join(DATA_DIR, "combined", "franchise_resolution.csv")
+RULE_UNMATCHED = "unmatched"
+
+KEY_COLS = ["league_id", "team_id"]
+TABLE_COLS = ["season", "league_id", "team_id", "team_key", "team", "manager", "franchise_id", "match_rule"]
+
+
+def franchise_map_paths(data_dir: str = DATA_DIR):
+    """Existing franchise map files, in the order load_franchise_map prefers them."""
+    candidates = [
+        os.path.join(data_dir, "franchise_map.yaml"),
+        os.path.join(data_dir, "franchise_map.yml"),
+        os.path.join(data_dir, "franchise_map.csv"),
+    ]
+    return [p for p in candidates if os.path.exists(p)]
+
+
+def franchise_map_fingerprint(data_dir: str = DATA_DIR) -> str:
+    """Content hash of every franchise map file present (empty map -> fixed hash)."""
+    h = hashlib.sha1()
+    for path in franchise_map_paths(data_dir):
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def load_resolver(data_dir: str = DATA_DIR) -> FranchiseResolver:
+    """Build a FranchiseResolver from franchise_map.yaml (preferred) or franchise_map.csv."""
+    for path in franchise_map_paths(data_dir):
+        try:
+            if path.endswith(".csv"):
+                return FranchiseResolver.from_frame(pd.read_csv(path))
+            import yaml
+
+            with open(path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+            if isinstance(data, list):
+                data = dict(data)
+            return FranchiseResolver.from_mapping(data)
+        except Exception as e:
+            print(f"⚠️ Could not read franchise map {path}: {e}")
+    return FranchiseResolver([])
+
+
+def _state_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def _with_int_keys(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    for c in KEY_COLS:
+        out[c] = pd.to_numeric(out[c], errors="coerce").astype("Int64")
+    return out
+
+
+def load_resolution_table(path: str = RESOLUTION_PATH, data_dir: Optional[str] = DATA_DIR) -> pd.DataFrame:
+    """Read the resolution table; empty if missing or built from a different franchise map.
+
+    Pass ``data_dir=None`` to skip the staleness check.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=TABLE_COLS)
+    if data_dir is not None:
+        try:
+            with open(_state_path(path), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception:
+            state = {}
+        if state.get("map_fingerprint") != franchise_map_fingerprint(data_dir):
+            return pd.DataFrame(columns=TABLE_COLS)
+    df = pd.read_csv(path, dtype={"franchise_id": str})
+    return _with_int_keys(df)
+
+
+def build_resolution_table(
+    scores_df: pd.DataFrame,
+    data_dir: str = DATA_DIR,
+    path: str = RESOLUTION_PATH,
+    force: bool = False,
+) -> pd.DataFrame:
+    """Resolve every (season, team_key) in ``scores_df`` not already in the table and persist it.
+
+    A changed franchise map (or ``force=True``) discards the old table and
+    resolves every team again.
+    """
+    needed = {"season", "team_key", "team", "manager"} | set(KEY_COLS)
+    missing = needed - set(scores_df.columns)
+    if missing:
+        print(f"⚠️ Cannot build franchise resolution table; scores missing {sorted(missing)}")
+        return pd.DataFrame(columns=TABLE_COLS)
+
+    fingerprint = franchise_map_fingerprint(data_dir)
+    existing = pd.DataFrame(columns=TABLE_COLS) if force else load_resolution_table(path, data_dir)
+
+    # Latest team name / manager per Yahoo team (names can change mid-season)
+    sort_cols = [c for c in ["season", "week"] if c in scores_df.columns]
+    teams = (
+        _with_int_keys(scores_df.sort_values(sort_cols) if sort_cols else scores_df)
+        .dropna(subset=KEY_COLS)
+        .drop_duplicates(KEY_COLS, keep="last")[["season"] + KEY_COLS + ["team_key", "team", "manager"]]
+    )
+
+    if not existing.empty:
+        seen = existing.set_index(KEY_COLS).index
+        teams = teams[~teams.set_index(KEY_COLS).index.isin(seen)]
+
+    if teams.empty:
+        print(f"✅ Franchise resolution table up to date ({len(existing)} teams)")
+        return existing
+
+    resolver = load_resolver(data_dir)
+    resolved = resolver.resolve_frame(teams, fuzzy=True)
+    new_rows = teams.assign(
+        franchise_id=resolved["franchise_id"],
+        match_rule=resolved["match_rule"].fillna(RULE_UNMATCHED),
+    )
+
+    table = pd.concat([existing, new_rows[TABLE_COLS]], ignore_index=True) if not existing.empty else new_rows[TABLE_COLS]
+    table = table.sort_values(["season", "team_id"]).reset_index(drop=True)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table.to_csv(path, index=False)
+    with open(_state_path(path), "w", encoding="utf-8") as f:
+        json.dump({"map_fingerprint": fingerprint, "rows": len(table)}, f, indent=2)
+
+    counts = new_rows["match_rule"].value_counts().to_dict()
+    print(f"✅ Resolved {len(new_rows)} new teams {counts} → {path}")
+    return table
+
+
+def attach_franchise_ids(df: pd.DataFrame, table: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Attach franchise_id / match_rule via an integer join on (league_id, team_id).
+
+    Rows that are not in the table (or frames without the key columns) get NaN.
+    """
+    if table is None:
+        table = load_resolution_table()
+    out = df.drop(columns=["franchise_id", "match_rule"], errors="ignore")
+    if table.empty or not set(KEY_COLS).issubset(out.columns):
+        return out.assign(franchise_id=None, match_rule=None)
+
+    keys = _with_int_keys(out[KEY_COLS])
+    joined = keys.merge(table[KEY_COLS + ["franchise_id", "match_rule"]], on=KEY_COLS, how="left")
+    out["franchise_id"] = joined["franchise_id"].values
+    out["match_rule"] = joined["match_rule"].values
+    return out
@@ -0,0 +1,279 @@
+"""
+Indexed franchise resolver shared by the loaders and combine steps.
+
+The franchise map (data/franchise_map.csv or the YAML/dict form returned by
+tools.data_loader.load_franchise_map) is compiled once into:
+  - hashed exact-match dictionaries for manager names and team aliases
+  - two Aho-Corasick automatons for "manager name / alias appears in" checks
+
+Each distinct (team, manager) pair is resolved once and the result is
+broadcast back onto the input frame.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from tools.fuzzy_matcher import NgramIndex
+
+# Yahoo hides manager nicknames for some old seasons; never match on these.
+HIDDEN_MANAGERS = {"-- hidden --", "--hidden--"}
+
+RULE_MANAGER = "manager"
+RULE_ALIAS = "alias"
+RULE_FUZZY = "fuzzy"
+
+# Fuzzy fallback is only for near-identical spellings; anything looser
+# belongs in tools/suggest_franchise_matches.py for a human to review.
+FUZZY_CUTOFF = 0.85
+
+
+def _norm(value: Any) -> str:
+    """Lower-case / strip a name, treating None and NaN as empty."""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value).strip().lower()
+
+
+def _split_aliases(value: Any) -> List[str]:
+    """Split a ``;``-separated alias cell into normalized aliases."""
+    if isinstance(value, (list, tuple, set)):
+        parts = value
+    else:
+        parts = _norm(value).split(";")
+    return [a for a in (_norm(p) for p in parts) if a]
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+
+    Every pattern carries an integer priority; ``best(text)`` returns the
+    lowest priority among all patterns occurring anywhere in ``text`` (or
+    None) in a single pass over the text.
+    """
+
+    def __init__(self, patterns: Dict[str, int]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Optional[int]] = [None]
+
+        for pattern, priority in patterns.items():
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(None)
+                state = nxt
+            current = self._out[state]
+            self._out[state] = priority if current is None else min(current, priority)
+
+        # Breadth-first pass to wire failure links and fold outputs down them
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                inherited = self._out[self._fail[nxt]]
+                if inherited is not None:
+                    own = self._out[nxt]
+                    self._out[nxt] = inherited if own is None else min(own, inherited)
+
+    def __len__(self) -> int:
+        return len(self._goto) - 1
+
+    def best(self, text: str) -> Optional[int]:
+        best = None
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = out[state]
+            if hit is not None and (best is None or hit < best):
+                best = hit
+                if best == 0:
+                    break
+        return best
+
+
+class FranchiseResolver:
+    """Resolve (team, manager) pairs to franchise IDs.
+
+    Matching rules, in order:
+      1. exact manager match
+      2. exact team alias match
+      3. a franchise manager name contained in the manager, or an alias
+         contained in the team name; the earliest franchise in map order wins
+    """
+
+    def __init__(self, entries: List[Tuple[str, str, List[str]]], substring: bool = True):
+        self.franchise_ids: List[str] = []
+        self._manager_exact: Dict[str, int] = {}
+        self._alias_exact: Dict[str, int] = {}
+        manager_patterns: Dict[str, int] = {}
+        alias_patterns: Dict[str, int] = {}
+
+        for idx, (fid, manager, aliases) in enumerate(entries):
+            self.franchise_ids.append(str(fid).strip())
+            manager = _norm(manager)
+            if manager and manager not in HIDDEN_MANAGERS:
+                self._manager_exact.setdefault(manager, idx)
+                manager_patterns.setdefault(manager, idx)
+            for alias in aliases:
+                self._alias_exact.setdefault(alias, idx)
+                alias_patterns.setdefault(alias, idx)
+
+        self._manager_ac = AhoCorasick(manager_patterns if substring else {})
+        self._alias_ac = AhoCorasick(alias_patterns if substring else {})
+        self._fuzzy: Optional[Tuple[NgramIndex, NgramIndex]] = None
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_frame(cls, franchise_df: pd.DataFrame) -> "FranchiseResolver":
+        """Build from a franchise_map.csv frame (franchise_id, manager_name, aliases)."""
+        if franchise_df is None or franchise_df.empty:
+            return cls([])
+        df = franchise_df.rename(columns=lambda c: str(c).strip().lower())
+        entries = []
+        for fid, manager, aliases in zip(
+            df["franchise_id"],
+            df["manager_name"] if "manager_name" in df.columns else [""] * len(df),
+            df["aliases"] if "aliases" in df.columns else [""] * len(df),
+        ):
+            if _norm(fid):
+                entries.append((fid, manager, _split_aliases(aliases)))
+        return cls(entries)
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[Any, Any]) -> "FranchiseResolver":
+        """Build from a flat {name: franchise_id} mapping (YAML form).
+
+        A flat mapping does not say which keys are managers and which are
+        team names, so every key is matched exactly against both and no
+        substring matching is done.
+        """
+        by_fid: Dict[str, List[str]] = {}
+        for name, fid in (mapping or {}).items():
+            key = _norm(name)
+            if key and _norm(fid):
+                by_fid.setdefault(str(fid).strip(), []).append(key)
+        entries = []
+        for fid, names in by_fid.items():
+            entries.extend((fid, name, [name]) for name in names)
+        return cls(entries, substring=False)
+
+    @classmethod
+    def coerce(cls, franchise_map: Any) -> "FranchiseResolver":
+        """Accept a resolver, a franchise_map.csv frame or a flat mapping."""
+        if isinstance(franchise_map, cls):
+            return franchise_map
+        if isinstance(franchise_map, pd.DataFrame):
+            return cls.from_frame(franchise_map)
+        if isinstance(franchise_map, dict):
+            return cls.from_mapping(franchise_map)
+        return cls([])
+
+    @property
+    def empty(self) -> bool:
+        return not self.franchise_ids
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+    def resolve(self, team: Any, manager: Any) -> Tuple[Optional[str], Optional[str]]:
+        """Return (franchise_id, rule) for one pair, or (None, None)."""
+        team = _norm(team)
+        manager = _norm(manager)
+        if manager in HIDDEN_MANAGERS:
+            manager = ""
+
+        if manager and manager in self._manager_exact:
+            return self.franchise_ids[self._manager_exact[manager]], RULE_MANAGER
+        if team and team in self._alias_exact:
+            return self.franchise_ids[self._alias_exact[team]], RULE_ALIAS
+
+        by_manager = self._manager_ac.best(manager) if manager else None
+        by_alias = self._alias_ac.best(team) if team else None
+        if by_manager is None and by_alias is None:
+            return None, None
+        if by_alias is None or (by_manager is not None and by_manager <= by_alias):
+            return self.franchise_ids[by_manager], RULE_MANAGER
+        return self.franchise_ids[by_alias], RULE_ALIAS
+
+    def resolve_fuzzy(self, team: Any, manager: Any, cutoff: float = FUZZY_CUTOFF) -> Tuple[Optional[str], Optional[str]]:
+        """Closest manager / alias spelling; only used after the exact and substring rules miss."""
+        if self._fuzzy is None:
+            self._fuzzy = (
+                NgramIndex(self._manager_exact.items()),
+                NgramIndex(self._alias_exact.items()),
+            )
+        managers, aliases = self._fuzzy
+        team = _norm(team)
+        manager = _norm(manager)
+        if manager and manager not in HIDDEN_MANAGERS:
+            hit = managers.search(manager, k=1, min_score=cutoff)
+            if hit:
+                return self.franchise_ids[hit[0][0]], RULE_FUZZY
+        if team:
+            hit = aliases.search(team, k=1, min_score=cutoff)
+            if hit:
+                return self.franchise_ids[hit[0][0]], RULE_FUZZY
+        return None, None
+
+    def resolve_frame(
+        self,
+        df: pd.DataFrame,
+        team_col: str = "team",
+        manager_col: str = "manager",
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        """Resolve every row of ``df``; returns franchise_id / match_rule aligned to df.index.
+
+        Each distinct (team, manager) pair is resolved once and broadcast back.
+        With ``fuzzy=True`` pairs that miss every exact/substring rule fall
+        back to ``resolve_fuzzy``.
+        """
+        n = len(df)
+        pairs = pd.DataFrame(
+            {
+                "team": df[team_col].fillna("").astype(str) if team_col in df.columns else [""] * n,
+                "manager": df[manager_col].fillna("").astype(str) if manager_col in df.columns else [""] * n,
+            },
+            index=df.index,
+        )
+        if n == 0 or self.empty:
+            return pd.DataFrame({"franchise_id": None, "match_rule": None}, index=df.index)
+
+        uniq = pairs.drop_duplicates().reset_index(drop=True)
+        resolved = [self.resolve(t, m) for t, m in zip(uniq["team"], uniq["manager"])]
+        if fuzzy:
+            resolved = [
+                self.resolve_fuzzy(t, m) if fid is None else (fid, rule)
+                for (fid, rule), t, m in zip(resolved, uniq["team"], uniq["manager"])
+            ]
+        uniq["franchise_id"] = [fid for fid, _ in resolved]
+        uniq["match_rule"] = [rule for _, rule in resolved]
+
+        out = pairs.merge(uniq, on=["team", "manager"], how="left")
+        out.index = df.index
+        return out[["franchise_id", "match_rule"]]
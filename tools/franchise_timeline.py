@@ -0,0 +1,70 @@
+"""
+Franchise timeline engine keyed by resolved franchise_id.
+
+Season metrics are aggregated per franchise rather than per team name, so
+a franchise that renames its team every year stays one line. Teams with no
+franchise_id in the resolution table fall back to their manager nickname
+(the most stable identity Yahoo gives us), then to the team name.
+
+  franchise_timeline  one row per (franchise, season) with power score
+  franchise_legacy    recency-weighted legacy index per franchise
+"""
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+from tools.franchise_resolution import attach_franchise_ids
+from tools.franchise_resolver import HIDDEN_MANAGERS
+
+SCHEMA_VERSIONS = {"franchise_timeline": 1, "franchise_legacy": 1}
+
+RECENCY_DECAY = 0.9
+
+
+def franchise_keys(df: pd.DataFrame) -> pd.Series:
+    """franchise_id where resolved, else manager nickname (unless hidden), else team name."""
+    manager = df["manager"].fillna("").astype(str).str.strip()
+    manager = manager.where(~manager.str.lower().isin(HIDDEN_MANAGERS) & (manager != ""))
+    fid = df["franchise_id"] if "franchise_id" in df.columns else pd.Series(None, index=df.index)
+    return fid.fillna(manager).fillna(df["team"].astype(str))
+
+
+def franchise_timeline(scores: pd.DataFrame) -> pd.DataFrame:
+    df = attach_franchise_ids(played_weeks(scores))
+    df["franchise"] = franchise_keys(df)
+    df["win"] = (df["points_for"] > df["points_against"]).astype(int)
+    df = df.sort_values(["season", "week"])
+
+    tl = (df.groupby(["franchise", "season"])
+            .agg(games=("week", "count"),
+                 wins=("win", "sum"),
+                 pf=("points_for", "sum"),
+                 pa=("points_against", "sum"),
+                 avg_pf=("points_for", "mean"),
+                 team=("team", "last"),
+                 manager=("manager", "last"))
+            .reset_index())
+    tl["win_pct"] = tl["wins"] / tl["games"]
+    tl["power"] = tl["avg_pf"] * 0.6 + tl["win_pct"] * 60 + 0.4 * (tl["pf"] - tl["pa"]) / tl["games"]
+    return tl.sort_values(["franchise", "season"]).reset_index(drop=True)
+
+
+def franchise_legacy(scores: pd.DataFrame, timeline: pd.DataFrame = None) -> pd.DataFrame:
+    """Recency-weighted average power per franchise (vectorized weighted sums)."""
+    tl = franchise_timeline(scores) if timeline is None else timeline
+    if tl.empty:
+        return pd.DataFrame(columns=["rank", "franchise", "team", "manager", "seasons", "legacy_index"])
+
+    weight = np.power(RECENCY_DECAY, tl["season"].max() - tl["season"])
+    sums = (tl.assign(w=weight, wp=weight * tl["power"])
+              .groupby("franchise")
+              .agg(w=("w", "sum"), wp=("wp", "sum"), seasons=("season", "nunique"),
+                   team=("team", "last"), manager=("manager", "last")))
+    legacy = sums.assign(legacy_index=sums["wp"] / sums["w"]).reset_index()
+    legacy = legacy.sort_values("legacy_index", ascending=False).reset_index(drop=True)
+    legacy["rank"] = np.arange(1, len(legacy) + 1)
+    return legacy[["rank", "franchise", "team", "manager", "seasons", "legacy_index"]]
+
+
+BUILDERS = {"franchise_timeline": franchise_timeline, "franchise_legacy": franchise_legacy}
@@ -0,0 +1,86 @@
+"""
+Character n-gram inverted index for fuzzy name matching.
+
+Instead of scoring a query against every known name with difflib, the
+index looks up the query's trigrams, ranks names by shared-trigram Dice
+overlap, and only runs SequenceMatcher on the best few candidates.
+"""
+
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def _grams(text: str, n: int) -> List[str]:
+    padded = f"{' ' * (n - 1)}{text} "
+    return list({padded[i:i + n] for i in range(len(padded) - n + 1)})
+
+
+class NgramIndex:
+    """Inverted index over the character n-grams of a set of names.
+
+    Parameters
+    ----------
+    items:
+        (name, payload) pairs; payload is what search results report
+        (e.g. a franchise_id). Several names may share a payload.
+    n:
+        Gram size (3 = trigrams).
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, Any]], n: int = 3):
+        self.n = n
+        self.names: List[str] = []
+        self.payloads: List[Any] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        seen = set()
+        for name, payload in items:
+            name = str(name or "").strip().lower()
+            if not name or (name, payload) in seen:
+                continue
+            seen.add((name, payload))
+            idx = len(self.names)
+            self.names.append(name)
+            self.payloads.append(payload)
+            grams = _grams(name, n)
+            self._sizes.append(len(grams))
+            for g in grams:
+                self._postings[g].append(idx)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def candidates(self, query: str, limit: int = 20) -> List[int]:
+        """Indexes of the ``limit`` names with the highest trigram Dice overlap."""
+        grams = _grams(query, self.n)
+        shared: Dict[int, int] = defaultdict(int)
+        for g in grams:
+            for idx in self._postings.get(g, ()):
+                shared[idx] += 1
+        if not shared:
+            return []
+        q = len(grams)
+        ranked = sorted(shared, key=lambda i: -2.0 * shared[i] / (q + self._sizes[i]))
+        return ranked[:limit]
+
+    def search(self, query: Any, k: int = 3, limit: int = 20, min_score: float = 0.0) -> List[Tuple[Any, str, float]]:
+        """Top-``k`` payloads for ``query`` as (payload, matched_name, score).
+
+        Scores are difflib SequenceMatcher ratios, computed only for the
+        pruned candidate set; each payload is reported once with its best name.
+        """
+        query = str(query or "").strip().lower()
+        if not query:
+            return []
+        best: Dict[Any, Tuple[float, str]] = {}
+        matcher = SequenceMatcher(None, b=query)
+        for idx in self.candidates(query, limit):
+            matcher.set_seq1(self.names[idx])
+            score = matcher.ratio()
+            payload = self.payloads[idx]
+            if score >= min_score and score > best.get(payload, (-1.0, ""))[0]:
+                best[payload] = (score, self.names[idx])
+        ranked = sorted(best.items(), key=lambda kv: -kv[1][0])[:k]
+        return [(payload, name, score) for payload, (score, name) in ranked]
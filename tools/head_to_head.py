@@ -0,0 +1,180 @@
+"""
+All-time head-to-head engine across franchises.
+
+State is a set of dense F × F arrays indexed by franchise position, saved to
+data/combined/head_to_head.npz:
+  games, wins, losses, ties, points_for, points_against, playoff_meetings
+where cell [i, j] is franchise i's record against franchise j. Any pair is
+an O(1) lookup.
+
+Franchises use the same identity as the franchise timeline (resolved
+franchise_id, else manager, else team). New weeks are added with
+np.add.at on just their rows; a changed week or franchise map triggers a
+full rebuild.
+"""
+
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+from tools.franchise_resolution import attach_franchise_ids, franchise_map_fingerprint
+from tools.franchise_timeline import franchise_keys
+from tools.standings import is_flag
+
+DATA_DIR = "data"
+H2H_PATH = os.path.join(DATA_DIR, "combined", "head_to_head.npz")
+
+COUNT_ARRAYS = ["games", "wins", "losses", "ties", "playoff_meetings"]
+POINT_ARRAYS = ["points_for", "points_against"]
+
+
+def matchup_rows(scores: pd.DataFrame) -> pd.DataFrame:
+    """One row per team-week with both sides' franchise keys."""
+    df = attach_franchise_ids(played_weeks(scores))
+    df["franchise"] = franchise_keys(df)
+    if {"team_key", "opponent_key"}.issubset(df.columns):
+        own, opp = "team_key", "opponent_key"
+    else:
+        own, opp = "team", "opponent"
+
+    owners = (df[["season", own, "franchise"]]
+              .drop_duplicates(["season", own])
+              .rename(columns={own: opp, "franchise": "opp_franchise"}))
+    df = df.merge(owners, on=["season", opp], how="left").dropna(subset=["opp_franchise"])
+
+    df["playoff"] = is_flag(df["is_playoffs"]) if "is_playoffs" in df.columns else False
+    if "is_consolation" in df.columns:
+        df["playoff"] &= ~is_flag(df["is_consolation"])
+    df["week_key"] = df["season"].astype(int).astype(str) + "-" + df["week"].astype(int).astype(str)
+    return df
+
+
+def _week_sums(df: pd.DataFrame) -> Dict[str, float]:
+    sums = df.groupby("week_key")[["points_for", "points_against"]].sum().sum(axis=1)
+    return {k: round(float(v), 2) for k, v in sums.items()}
+
+
+def _empty_state(franchises=()) -> dict:
+    n = len(franchises)
+    state = {"franchises": list(franchises), "weeks": {}, "map_fingerprint": ""}
+    for name in COUNT_ARRAYS:
+        state[name] = np.zeros((n, n), dtype=np.int32)
+    for name in POINT_ARRAYS:
+        state[name] = np.zeros((n, n), dtype=np.float64)
+    return state
+
+
+def _grow(state: dict, names) -> None:
+    """Append unseen franchises, padding every array."""
+    new = [f for f in dict.fromkeys(names) if f not in set(state["franchises"])]
+    if not new:
+        return
+    state["franchises"] = state["franchises"] + new
+    for name in COUNT_ARRAYS + POINT_ARRAYS:
+        state[name] = np.pad(state[name], ((0, len(new)), (0, len(new))))
+
+
+def _accumulate(state: dict, rows: pd.DataFrame) -> None:
+    _grow(state, pd.concat([rows["franchise"], rows["opp_franchise"]]).tolist())
+    index = {f: i for i, f in enumerate(state["franchises"])}
+    i = rows["franchise"].map(index).to_numpy()
+    j = rows["opp_franchise"].map(index).to_numpy()
+    pf = rows["points_for"].to_numpy(dtype=float)
+    pa = rows["points_against"].to_numpy(dtype=float)
+
+    np.add.at(state["games"], (i, j), 1)
+    np.add.at(state["wins"], (i, j), (pf > pa).astype(np.int32))
+    np.add.at(state["losses"], (i, j), (pf < pa).astype(np.int32))
+    np.add.at(state["ties"], (i, j), (pf == pa).astype(np.int32))
+    np.add.at(state["playoff_meetings"], (i, j), rows["playoff"].to_numpy(dtype=np.int32))
+    np.add.at(state["points_for"], (i, j), pf)
+    np.add.at(state["points_against"], (i, j), pa)
+
+
+def build_head_to_head(scores: pd.DataFrame, data_dir: str = DATA_DIR) -> dict:
+    rows = matchup_rows(scores)
+    names = sorted(set(rows["franchise"]) | set(rows["opp_franchise"]))
+    state = _empty_state(names)
+    _accumulate(state, rows)
+    state["weeks"] = _week_sums(rows)
+    state["map_fingerprint"] = franchise_map_fingerprint(data_dir)
+    return state
+
+
+def save_head_to_head(state: dict, path: str = H2H_PATH) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    week_keys = sorted(state["weeks"])
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(
+        tmp,
+        franchises=np.array(state["franchises"], dtype=str),
+        week_keys=np.array(week_keys, dtype=str),
+        week_sums=np.array([state["weeks"][k] for k in week_keys], dtype=np.float64),
+        map_fingerprint=np.array(state["map_fingerprint"]),
+        **{name: state[name] for name in COUNT_ARRAYS + POINT_ARRAYS},
+    )
+    os.replace(tmp, path)
+
+
+def load_head_to_head(path: str = H2H_PATH) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            state = {name: z[name] for name in COUNT_ARRAYS + POINT_ARRAYS}
+            state["franchises"] = z["franchises"].tolist()
+            state["weeks"] = dict(zip(z["week_keys"].tolist(), z["week_sums"].tolist()))
+            state["map_fingerprint"] = str(z["map_fingerprint"])
+        return state
+    except Exception as e:
+        print(f"⚠️ Unreadable head-to-head state {path}: {e}")
+        return None
+
+
+def update_head_to_head(scores: pd.DataFrame, path: str = H2H_PATH, data_dir: str = DATA_DIR) -> dict:
+    """Add weeks not yet in the persisted matrix (full rebuild if an old week or the franchise map changed)."""
+    rows = matchup_rows(scores)
+    sums = _week_sums(rows)
+    state = load_head_to_head(path)
+
+    if state is None or state["map_fingerprint"] != franchise_map_fingerprint(data_dir):
+        state, reason = build_head_to_head(scores, data_dir), "built"
+    else:
+        changed = [w for w, v in sums.items() if w in state["weeks"] and abs(state["weeks"][w] - v) > 1e-6]
+        new_weeks = [w for w in sums if w not in state["weeks"]]
+        if changed:
+            state, reason = build_head_to_head(scores, data_dir), f"rebuilt ({len(changed)} changed weeks)"
+        elif new_weeks:
+            _accumulate(state, rows[rows["week_key"].isin(new_weeks)])
+            state["weeks"].update({w: sums[w] for w in new_weeks})
+            reason = f"added {len(new_weeks)} new weeks"
+        else:
+            print(f"✅ Head-to-head matrix up to date ({len(state['franchises'])} franchises)")
+            return state
+
+    save_head_to_head(state, path)
+    print(f"✅ Head-to-head matrix {reason}: {len(state['franchises'])} franchises → {path}")
+    return state
+
+
+def pair_record(state: dict, a: str, b: str) -> dict:
+    """Franchise ``a``'s all-time record against ``b``."""
+    index = {f: i for i, f in enumerate(state["franchises"])}
+    if a not in index or b not in index:
+        return {name: 0 for name in COUNT_ARRAYS + POINT_ARRAYS}
+    i, j = index[a], index[b]
+    return {name: state[name][i, j].item() for name in COUNT_ARRAYS + POINT_ARRAYS}
+
+
+def rivalry_table(state: dict, franchise: str) -> pd.DataFrame:
+    """``franchise``'s record against every opponent it has played."""
+    if franchise not in state["franchises"]:
+        return pd.DataFrame()
+    i = state["franchises"].index(franchise)
+    df = pd.DataFrame({"opponent": state["franchises"], **{name: state[name][i] for name in COUNT_ARRAYS + POINT_ARRAYS}})
+    df = df[df["games"] > 0].copy()
+    df["win_pct"] = (df["wins"] + 0.5 * df["ties"]) / df["games"]
+    return df.sort_values(["games", "win_pct"], ascending=[False, False]).reset_index(drop=True)
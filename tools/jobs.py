@@ -0,0 +1,312 @@
+"""
+Background job runner for long data refreshes (Yahoo fetch / history sync).
+
+Streamlit reruns the page script for every interaction, so a refresh must
+not run inside it. start_job() launches a detached runner process
+(``python -m tools.jobs run <job>``) and returns immediately; the runner
+executes the job's steps one after another and keeps everything on disk
+under data/jobs/<job>/ so every session and every page sees the same job:
+
+  lock         single-flight: created with O_EXCL, so a second click (from
+               any session) finds the job already running
+  status.json  state, current step, progress, per-step return codes/timings
+  log.txt      combined stdout/stderr of every step, streamed as written
+  cancel       flag file; the runner terminates the current step when it
+               appears
+
+A lock whose runner died (crash, reboot) is detected from the recorded pid
+and reclaimed on the next start. Jobs that share a ``group`` (every job that
+runs the pipeline) are single-flight together: while one holds its lock,
+start_job refuses the others.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+DATA_DIR = "data"
+JOBS_DIR = os.path.join(DATA_DIR, "jobs")
+
+ACTIVE_STATES = {"queued", "running", "cancelling"}
+POLL_SECONDS = 0.5
+TERMINATE_GRACE = 10
+LOCK_GRACE = 15          # seconds a brand-new lock is trusted before its status is written
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# job type -> label and ordered (step name, script argv) pairs
+JOBS: Dict[str, dict] = {
+    "fetch_latest": {
+        "label": "Fetch latest Yahoo data",
+        "steps": [("Fetch", ["fetch_yahoo_data.py"])],
+    },
+    "sync_history": {
+        "label": "Sync full Yahoo history",
+        # fetch → validate → process / build → combine → materialize, in one process
+        "steps": [("Pipeline", ["scripts/run_pipeline.py"])],
+        "group": "pipeline",
+    },
+    "refresh_current": {
+        "label": "Refresh current season",
+        # Started on a timer by scripts/refresh_scheduler.py
+        "steps": [("Pipeline", ["scripts/run_pipeline.py", "--current-season"])],
+        "group": "pipeline",
+    },
+}
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _paths(job_type: str, jobs_dir: str = JOBS_DIR) -> Dict[str, str]:
+    base = os.path.join(jobs_dir, job_type)
+    return {
+        "dir": base,
+        "lock": os.path.join(base, "lock"),
+        "status": os.path.join(base, "status.json"),
+        "log": os.path.join(base, "log.txt"),
+        "cancel": os.path.join(base, "cancel"),
+    }
+
+
+def _pid_alive(pid) -> bool:
+    try:
+        # Reap our own finished runner first so it doesn't linger as a zombie
+        if os.name == "posix" and os.waitpid(int(pid), os.WNOHANG)[0]:
+            return False
+    except (ChildProcessError, OSError, TypeError, ValueError):
+        pass
+    try:
+        os.kill(int(pid), 0)
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+
+def _write_status(job_type: str, jobs_dir: str = JOBS_DIR, **fields) -> dict:
+    p = _paths(job_type, jobs_dir)
+    status = read_status(job_type, jobs_dir, check_alive=False)
+    status.update(fields)
+    os.makedirs(p["dir"], exist_ok=True)
+    tmp = p["status"] + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(status, f, indent=2)
+    os.replace(tmp, p["status"])
+    return status
+
+
+def read_status(job_type: str, jobs_dir: str = JOBS_DIR, check_alive: bool = True) -> dict:
+    """Last known status of ``job_type`` (state "idle" if it never ran)."""
+    p = _paths(job_type, jobs_dir)
+    try:
+        with open(p["status"], "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        status = {"job": job_type, "state": "idle"}
+
+    # Runner vanished without reporting back (killed, machine restarted)
+    if check_alive and status.get("state") in ACTIVE_STATES and status.get("pid") \
+            and not _pid_alive(status["pid"]):
+        status = _write_status(job_type, jobs_dir, state="failed", finished_at=_now(),
+                               error="runner process exited unexpectedly")
+        _release(job_type, jobs_dir)
+    return status
+
+
+def is_running(job_type: str, jobs_dir: str = JOBS_DIR) -> bool:
+    return read_status(job_type, jobs_dir)["state"] in ACTIVE_STATES
+
+
+def _holds_lock(job_type: str, jobs_dir: str) -> bool:
+    lock = _paths(job_type, jobs_dir)["lock"]
+    try:
+        fresh = time.time() - os.path.getmtime(lock) < LOCK_GRACE
+    except OSError:
+        return False
+    return fresh or is_running(job_type, jobs_dir)
+
+
+def active_in_group(job_type: str, jobs_dir: str = JOBS_DIR) -> Optional[str]:
+    """Another job of ``job_type``'s group that is running right now, if any."""
+    group = JOBS[job_type].get("group")
+    for other, spec in JOBS.items():
+        if other != job_type and group and spec.get("group") == group and _holds_lock(other, jobs_dir):
+            return other
+    return None
+
+
+def _acquire(job_type: str, jobs_dir: str) -> bool:
+    p = _paths(job_type, jobs_dir)
+    os.makedirs(p["dir"], exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(p["lock"], os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Reclaim the lock only if its runner is gone (and it isn't a start in progress)
+            try:
+                fresh = time.time() - os.path.getmtime(p["lock"]) < LOCK_GRACE
+            except OSError:
+                continue
+            if fresh or is_running(job_type, jobs_dir):
+                return False
+            _release(job_type, jobs_dir)
+            continue
+        with os.fdopen(fd, "w") as f:
+            f.write(_now())
+        # Checked after taking our own lock, so two jobs of a group can never both proceed
+        if active_in_group(job_type, jobs_dir):
+            os.remove(p["lock"])
+            return False
+        return True
+    return False
+
+
+def _release(job_type: str, jobs_dir: str) -> None:
+    for key in ("lock", "cancel"):
+        try:
+            os.remove(_paths(job_type, jobs_dir)[key])
+        except FileNotFoundError:
+            pass
+
+
+def start_job(job_type: str, jobs_dir: str = JOBS_DIR) -> Tuple[bool, dict]:
+    """Launch ``job_type`` in the background; (False, status) if it is already running."""
+    if job_type not in JOBS:
+        raise ValueError(f"Unknown job type: {job_type}")
+    if not _acquire(job_type, jobs_dir):
+        busy = active_in_group(job_type, jobs_dir) or job_type
+        return False, read_status(busy, jobs_dir)
+
+    p = _paths(job_type, jobs_dir)
+    open(p["log"], "w", encoding="utf-8").close()
+    steps = JOBS[job_type]["steps"]
+    status = {
+        "job": job_type,
+        "state": "queued",
+        "queued_at": _now(),
+        "started_at": None,
+        "finished_at": None,
+        "step": 0,
+        "steps": len(steps),
+        "step_name": None,
+        "progress": 0.0,
+        "results": [],
+        "error": None,
+    }
+    with open(p["status"], "w", encoding="utf-8") as f:
+        json.dump(status, f, indent=2)
+
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "tools.jobs", "run", job_type, "--jobs-dir", os.path.abspath(jobs_dir)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            cwd=ROOT, start_new_session=True,
+        )
+    except Exception as e:
+        _release(job_type, jobs_dir)
+        return False, _write_status(job_type, jobs_dir, state="failed", error=str(e), finished_at=_now())
+    return True, _write_status(job_type, jobs_dir, pid=proc.pid)
+
+
+def cancel_job(job_type: str, jobs_dir: str = JOBS_DIR) -> bool:
+    """Ask the runner to stop; returns False if nothing is running."""
+    if not is_running(job_type, jobs_dir):
+        return False
+    open(_paths(job_type, jobs_dir)["cancel"], "w").close()
+    _write_status(job_type, jobs_dir, state="cancelling")
+    return True
+
+
+def tail_log(job_type: str, lines: int = 200, jobs_dir: str = JOBS_DIR) -> str:
+    """Last ``lines`` lines of the job log (reads only the end of the file)."""
+    path = _paths(job_type, jobs_dir)["log"]
+    if not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 200 * lines))
+        data = f.read().decode("utf-8", errors="replace")
+    return "\n".join(data.splitlines()[-lines:])
+
+
+def _run_step(argv: List[str], log, cancel_path: str) -> Tuple[Optional[int], bool]:
+    """Run one step with output streamed to ``log``; (returncode, cancelled)."""
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    proc = subprocess.Popen([sys.executable, "-u", *argv], stdout=log, stderr=subprocess.STDOUT,
+                            stdin=subprocess.DEVNULL, env=env, cwd=ROOT)
+    while proc.poll() is None:
+        if os.path.exists(cancel_path):
+            proc.terminate()
+            try:
+                proc.wait(timeout=TERMINATE_GRACE)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            return proc.returncode, True
+        time.sleep(POLL_SECONDS)
+    return proc.returncode, False
+
+
+def run_job(job_type: str, jobs_dir: str = JOBS_DIR) -> dict:
+    """Runner body: execute every step, recording progress. Called in the detached process."""
+    p = _paths(job_type, jobs_dir)
+    steps = JOBS[job_type]["steps"]
+    results = []
+    state, error = "succeeded", None
+    _write_status(job_type, jobs_dir, state="running", pid=os.getpid(), started_at=_now())
+
+    try:
+        with open(p["log"], "a", encoding="utf-8", buffering=1) as log:
+            for i, (name, argv) in enumerate(steps, start=1):
+                _write_status(job_type, jobs_dir, step=i, step_name=name, progress=(i - 1) / len(steps))
+                log.write(f"\n=== [{i}/{len(steps)}] {name}: {' '.join(argv)} ===\n")
+                log.flush()
+                t0 = time.time()
+                code, cancelled = _run_step(argv, log, p["cancel"])
+                results.append({"step": name, "returncode": code, "seconds": round(time.time() - t0, 1)})
+                _write_status(job_type, jobs_dir, results=results)
+                if cancelled:
+                    state = "cancelled"
+                    log.write(f"\n⛔ Cancelled during {name}\n")
+                    break
+                if code != 0:
+                    state, error = "failed", f"{name} exited with code {code}"
+                    log.write(f"\n❌ {error}\n")
+                    break
+    except Exception as e:
+        state, error = "failed", str(e)
+    finally:
+        done = {"progress": 1.0} if state == "succeeded" else {}
+        status = _write_status(job_type, jobs_dir, state=state, error=error, finished_at=_now(), **done)
+        _release(job_type, jobs_dir)
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background data jobs")
+    parser.add_argument("action", choices=["run", "start", "status", "cancel", "log"])
+    parser.add_argument("job", choices=sorted(JOBS))
+    parser.add_argument("--jobs-dir", default=JOBS_DIR)
+    args = parser.parse_args()
+
+    if args.action == "run":
+        run_job(args.job, args.jobs_dir)
+    elif args.action == "start":
+        started, status = start_job(args.job, args.jobs_dir)
+        print("✅ Started" if started else f"⚠️ Already {status['state']}", f"(pid {status.get('pid')})")
+    elif args.action == "cancel":
+        print("⛔ Cancel requested" if cancel_job(args.job, args.jobs_dir) else "Nothing running")
+    elif args.action == "log":
+        print(tail_log(args.job, jobs_dir=args.jobs_dir))
+    else:
+        print(json.dumps(read_status(args.job, args.jobs_dir), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Incrementally maintained all-time record leaderboards.
+
+Boards are bounded top-K lists persisted to data/combined/leaderboards.json:
+  highest_team_week   highest points_for in a team-week
+  lowest_team_week    lowest points_for in a played team-week
+  biggest_blowout     largest winning margin (one row per game)
+  closest_game        smallest margin (one row per game)
+  highest_combined    highest combined score (one row per game)
+
+When new weeks are ingested only those weeks' candidates are merged into
+each board with a K-bounded heap. The state also keeps a checksum per
+ingested week; if an already-ingested week changes (a live week re-fetched)
+the boards are rebuilt from the full scores instead.
+"""
+
+import heapq
+import json
+import os
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from tools.aggregates import played_weeks
+
+DATA_DIR = "data"
+LEADERBOARD_PATH = os.path.join(DATA_DIR, "combined", "leaderboards.json")
+TOP_K = 25
+
+ENTRY_COLS = ["season", "week", "team", "manager", "opponent", "points_for", "points_against", "margin", "combined"]
+
+# board -> (per-game only?, sort column, largest first?)
+BOARDS = {
+    "highest_team_week": (False, "points_for", True),
+    "lowest_team_week": (False, "points_for", False),
+    "biggest_blowout": (True, "margin", True),
+    "closest_game": (True, "margin", False),
+    "highest_combined": (True, "combined", True),
+}
+
+
+def _entries(scores: pd.DataFrame) -> pd.DataFrame:
+    df = played_weeks(scores)
+    df = df.assign(
+        margin=(df["points_for"] - df["points_against"]).round(2),
+        combined=(df["points_for"] + df["points_against"]).round(2),
+    )
+    for c in ENTRY_COLS:
+        if c not in df.columns:
+            df[c] = None
+    return df
+
+
+def _games(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per game, from the winner's side (ties: the lower team_key/team)."""
+    key = "team_key" if "team_key" in df.columns else "team"
+    opp = "opponent_key" if key == "team_key" and "opponent_key" in df.columns else "opponent"
+    winner = (df["margin"] > 0) | ((df["margin"] == 0) & (df[key].astype(str) < df[opp].astype(str)))
+    return df[winner]
+
+
+def _week_key(season, week) -> str:
+    return f"{int(season)}-{int(week)}"
+
+
+def _week_checksums(df: pd.DataFrame) -> Dict[str, float]:
+    sums = df.groupby(["season", "week"])[["points_for", "points_against"]].sum().sum(axis=1)
+    return {_week_key(s, w): round(float(v), 2) for (s, w), v in sums.items()}
+
+
+def _candidates(df: pd.DataFrame, k: int) -> Dict[str, List[dict]]:
+    """Top-k rows of a batch of team-weeks for every board (partial sort, no full sort)."""
+    games = _games(df)
+    out = {}
+    for board, (per_game, col, largest) in BOARDS.items():
+        src = games if per_game else df
+        if board == "closest_game":
+            src = src.assign(_abs=src["margin"].abs())
+            top = src.nsmallest(k, "_abs")
+        else:
+            top = src.nlargest(k, col) if largest else src.nsmallest(k, col)
+        out[board] = top[ENTRY_COLS].to_dict("records")
+    return out
+
+
+def _sort_key(board: str):
+    _, col, largest = BOARDS[board]
+    if board == "closest_game":
+        return lambda e: -abs(e["margin"])
+    return (lambda e: e[col]) if largest else (lambda e: -e[col])
+
+
+def _merge(boards: Dict[str, List[dict]], new: Dict[str, List[dict]], k: int) -> Dict[str, List[dict]]:
+    """Keep the k best of old + new entries per board (heap-bounded, O(K log K))."""
+    return {
+        board: heapq.nlargest(k, boards.get(board, []) + new.get(board, []), key=_sort_key(board))
+        for board in BOARDS
+    }
+
+
+def _clean(entries: List[dict]) -> List[dict]:
+    out = []
+    for e in entries:
+        row = {}
+        for c in ENTRY_COLS:
+            v = e.get(c)
+            if c in ("season", "week") and v is not None:
+                v = int(v)
+            elif isinstance(v, float) and pd.isna(v):
+                v = None
+            elif hasattr(v, "item"):
+                v = v.item()
+            row[c] = v
+        out.append(row)
+    return out
+
+
+def build_leaderboards(scores: pd.DataFrame, k: int = TOP_K) -> dict:
+    """Leaderboard state built from scratch."""
+    df = _entries(scores)
+    boards = _merge({}, _candidates(df, k), k)
+    return {"k": k, "weeks": _week_checksums(df), "boards": {b: _clean(v) for b, v in boards.items()}}
+
+
+def load_leaderboards(path: str = LEADERBOARD_PATH) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Unreadable leaderboards {path}: {e}")
+        return None
+
+
+def update_leaderboards(scores: pd.DataFrame, path: str = LEADERBOARD_PATH, k: int = TOP_K) -> dict:
+    """Merge weeks not yet ingested into the persisted boards (full rebuild if an old week changed)."""
+    df = _entries(scores)
+    checksums = _week_checksums(df)
+    state = load_leaderboards(path)
+
+    if state is None or state.get("k") != k:
+        state, reason = build_leaderboards(scores, k), "built"
+    else:
+        seen = state.get("weeks", {})
+        changed = [w for w, v in checksums.items() if w in seen and seen[w] != v]
+        new_weeks = [w for w in checksums if w not in seen]
+        if changed:
+            state, reason = build_leaderboards(scores, k), f"rebuilt ({len(changed)} changed weeks)"
+        elif new_weeks:
+            keys = df["season"].astype(int).astype(str) + "-" + df["week"].astype(int).astype(str)
+            batch = df[keys.isin(new_weeks)]
+            boards = _merge(state["boards"], _candidates(batch, k), k)
+            state = {"k": k, "weeks": {**seen, **{w: checksums[w] for w in new_weeks}},
+                     "boards": {b: _clean(v) for b, v in boards.items()}}
+            reason = f"merged {len(new_weeks)} new weeks"
+        else:
+            print(f"✅ Leaderboards up to date ({len(seen)} weeks)")
+            return state
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+    print(f"✅ Leaderboards {reason} → {path}")
+    return state
+
+
+def leaderboard_frame(state: Optional[dict], board: str, n: Optional[int] = None) -> pd.DataFrame:
+    """One board as a DataFrame, best first."""
+    if not state or board not in state.get("boards", {}):
+        return pd.DataFrame(columns=ENTRY_COLS)
+    df = pd.DataFrame(state["boards"][board], columns=ENTRY_COLS)
+    return df.head(n) if n else df
@@ -0,0 +1,198 @@
+"""
+Optimal lineup and bench-points engine.
+
+Input is one row per rostered player-week with actual_points,
+selected_position and eligible_mask (a slot bitmask, see
+tools/roster_codes.py). Every team-week is solved at once:
+rows are sorted by points within each team-week, then each starting slot
+is filled in turn with a masked groupby-cumcount (the top ``count``
+eligible players not already used). Dedicated slots go first and flex
+slots (W/R/T, ...) last, which is optimal when each player fits one
+dedicated slot and the layout has one kind of flex slot (every season of
+this league).
+
+Team-weeks with a player eligible at two dedicated slots (QB/TE, WR/TE,
+...) are re-solved exactly by trying each dedicated slot (or none) for
+those few players and greedy-filling the rest. A started player is always
+treated as eligible for the slot they started in, so the real lineup is
+feasible and optimal_points >= actual_points.
+
+Slot counts come from what managers actually started in each season
+(layouts changed over the years), falling back to roster_positions in
+data/debug_settings.json.
+"""
+
+import json
+import os
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tools.roster_codes import SLOT_BITS, can_fill, compact_rosters
+
+DATA_DIR = "data"
+BENCH_SLOTS = {"BN", "IR", "IR+", "NA"}
+
+GROUP_COLS = ["season", "week", "team_key"]
+
+
+def load_roster_slots(data_dir: str = DATA_DIR) -> Dict[str, int]:
+    """Starting slots and counts from the league settings payload."""
+    path = os.path.join(data_dir, "debug_settings.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            settings = json.load(f)["fantasy_content"]["league"][1]["settings"][0]
+        return {
+            rp["roster_position"]["position"]: int(rp["roster_position"]["count"])
+            for rp in settings["roster_positions"]
+            if int(rp["roster_position"].get("is_starting_position", 0))
+        }
+    except Exception as e:
+        print(f"⚠️ Could not read roster positions from {path}: {e}")
+        return {}
+
+
+def observed_slots(rosters: pd.DataFrame) -> Dict[int, Dict[str, int]]:
+    """Most common starting-slot counts per season, from selected_position."""
+    starters = rosters[~rosters["selected_position"].isin(BENCH_SLOTS) & rosters["selected_position"].notna()]
+    counts = starters.groupby(GROUP_COLS + ["selected_position"], observed=True).size().rename("n").reset_index()
+    mode = counts.groupby(["season", "selected_position"], observed=True)["n"].agg(lambda s: int(s.mode().iloc[0]))
+    return {int(season): g.droplevel(0).to_dict() for season, g in mode.groupby(level=0)}
+
+
+def _slot_order(slots: Dict[str, int]):
+    """Dedicated slots first, then flex slots (names containing '/'), each as (slot, count)."""
+    return sorted(slots.items(), key=lambda kv: ("/" in kv[0], kv[0]))
+
+
+def _is_flex(slot: str) -> bool:
+    return "/" in slot
+
+
+def _fill(points, masks, layout, multi, forced) -> Tuple[float, List[Optional[str]]]:
+    """Greedy fill with ``forced`` {player: dedicated slot}; other multi-eligible players only take flex."""
+    chosen: List[Optional[str]] = [None] * len(points)
+    open_ = dict(layout)
+    for j, slot in forced.items():
+        chosen[j] = slot
+        open_[slot] -= 1
+        if open_[slot] < 0:
+            return -np.inf, chosen
+    for slot, _ in layout:
+        bit, flex = SLOT_BITS.get(slot, 0), _is_flex(slot)
+        for j in range(len(points)):
+            if not open_[slot]:
+                break
+            if chosen[j] is None and points[j] > 0 and masks[j] & bit and (flex or j not in multi):
+                chosen[j] = slot
+                open_[slot] -= 1
+    return sum(p for p, c in zip(points, chosen) if c is not None), chosen
+
+
+def solve_team_week(points: np.ndarray, masks: np.ndarray, layout) -> List[Optional[str]]:
+    """Best lineup for one team-week (points sorted high to low): the slot each player fills, None = bench.
+
+    Players eligible at two or more dedicated slots are rare, so every
+    choice of dedicated slot (or none) for them is tried; with those fixed
+    the greedy fill is optimal for layouts with one kind of flex slot.
+    """
+    masks = [int(m) for m in masks]
+    dedicated = [slot for slot, _ in layout if not _is_flex(slot)]
+    options = {j: [slot for slot in dedicated if m & SLOT_BITS.get(slot, 0)] for j, m in enumerate(masks)}
+    multi = {j: opts for j, opts in options.items() if len(opts) >= 2 and points[j] > 0}
+
+    best_total, best = -np.inf, [None] * len(points)
+    for combo in product(*[opts + [None] for opts in multi.values()]):
+        forced = {j: slot for j, slot in zip(multi, combo) if slot is not None}
+        total, chosen = _fill(points, masks, layout, multi, forced)
+        if total > best_total + 1e-9:
+            best_total, best = total, chosen
+    return best
+
+
+def optimal_lineups(rosters: pd.DataFrame, slots: Optional[Dict[str, int]] = None) -> pd.DataFrame:
+    """Per team-week actual, optimal and bench points.
+
+    ``slots`` forces one layout for every season; by default each season
+    uses its observed layout.
+    """
+    if "eligible_mask" not in rosters.columns and "eligible_positions" not in rosters.columns:
+        raise ValueError("rosters need eligible_mask (re-run scripts/process_historical_data.py)")
+
+    df = compact_rosters(rosters.rename(columns={"year": "season"}))
+    df["actual_points"] = pd.to_numeric(df["actual_points"], errors="coerce").fillna(0.0)
+    df = df.sort_values(GROUP_COLS + ["actual_points"], ascending=[True, True, True, False]).reset_index(drop=True)
+    df["started"] = ~df["selected_position"].isin(BENCH_SLOTS) & df["selected_position"].notna()
+
+    # A starter can always fill the slot he was started in (eligibility can change later)
+    started_bit = df["selected_position"].astype(object).map(SLOT_BITS).fillna(0).astype(np.uint16)
+    masks = (df["eligible_mask"].to_numpy(np.uint16) | np.where(df["started"], started_bit, 0)).astype(np.uint16)
+    points = df["actual_points"].to_numpy(float)
+
+    layouts = {} if slots else observed_slots(df)
+    default = slots or load_roster_slots()
+    season_layout = df["season"].map(lambda s: tuple(_slot_order(layouts.get(int(s), default))))
+
+    used = np.zeros(len(df), dtype=bool)
+    optimal_slot = np.full(len(df), None, dtype=object)
+    for layout, part in df.groupby(season_layout, sort=False):
+        idx = part.index.to_numpy()
+        keys = [part[c] for c in GROUP_COLS]
+        for slot, count in layout:
+            open_ = can_fill(masks[idx], slot) & ~used[idx] & (points[idx] > 0)
+            rank = pd.Series(open_, index=idx).groupby(keys).cumsum().to_numpy()
+            pick = open_ & (rank <= count)
+            used[idx[pick]] = True
+            optimal_slot[idx[pick]] = slot
+
+        # Re-solve team-weeks with a player eligible at two dedicated slots
+        dedicated = [slot for slot, _ in layout if not _is_flex(slot)]
+        exact = sum(can_fill(masks[idx], slot).astype(int) for slot in dedicated) >= 2
+        if not np.any(exact):
+            continue
+        tw = pd.Series(exact, index=idx).groupby(keys).transform("any").to_numpy()
+        for rows in pd.Series(idx[tw]).groupby([k[tw].to_numpy() for k in keys]).apply(list):
+            rows = np.asarray(rows)
+            chosen = solve_team_week(points[rows], masks[rows], layout)
+            optimal_slot[rows] = chosen
+            used[rows] = [c is not None for c in chosen]
+
+    df["optimal_slot"] = optimal_slot
+    df["starter_pts"] = np.where(df["started"], df["actual_points"], 0.0)
+    df["bench_pts"] = np.where(df["started"], 0.0, df["actual_points"])
+    df["optimal_pts"] = np.where(used, df["actual_points"], 0.0)
+
+    out = df.groupby(GROUP_COLS).agg(
+        actual_points=("starter_pts", "sum"),
+        optimal_points=("optimal_pts", "sum"),
+        bench_points=("bench_pts", "sum"),
+        players=("player_id", "count"),
+    ).reset_index()
+    short = out["optimal_points"] < out["actual_points"] - 0.01
+    assert not short.any(), f"optimal lineup below the started lineup in {int(short.sum())} team-weeks"
+    out["points_left"] = (out["optimal_points"] - out["actual_points"]).round(2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["efficiency"] = (out["actual_points"] / out["optimal_points"]).round(4)
+    for c in ["actual_points", "optimal_points", "bench_points"]:
+        out[c] = out[c].round(2)
+
+    names = [c for c in ["team", "manager"] if c in df.columns]
+    if names:
+        out = out.merge(df.drop_duplicates(GROUP_COLS)[GROUP_COLS + names], on=GROUP_COLS, how="left")
+    return out
+
+
+def lineup_efficiency(lineups: pd.DataFrame) -> pd.DataFrame:
+    """Season totals per team: points left on the bench and lineup efficiency."""
+    keys = ["season", "team_key"] + [c for c in ["team", "manager"] if c in lineups.columns]
+    out = lineups.groupby(keys, dropna=False).agg(
+        weeks=("week", "count"),
+        actual_points=("actual_points", "sum"),
+        optimal_points=("optimal_points", "sum"),
+        points_left=("points_left", "sum"),
+        perfect_weeks=("points_left", lambda s: int((s <= 0.01).sum())),
+    ).reset_index()
+    out["efficiency"] = (out["actual_points"] / out["optimal_points"]).round(4)
+    return out.sort_values(["season", "efficiency"], ascending=[True, False]).reset_index(drop=True)
@@ -2,6 +2,10 @@
 import os
 import pandas as pd
 
+from tools.franchise_resolution import attach_franchise_ids
+from tools.franchise_resolver import FranchiseResolver
+from tools.roster_codes import compact_rosters
+
 DATA_DIR = "data"
 
 def load_scores_all():
@@ -29,7 +33,8 @@ def load_scores_all():
     out["points_for"] = pd.to_numeric(out["points_for"], errors="coerce").fillna(0.0)
     out["points_against"] = pd.to_numeric(out["points_against"], errors="coerce").fillna(0.0)
     out["projected_points"] = pd.to_numeric(out["projected_points"], errors="coerce")
-    return out
+    # franchise_id from the ingest-time resolution table (cheap integer join)
+    return attach_franchise_ids(out).drop(columns=["match_rule"])
 
 def load_player_stats_all():
     """Load all player_stats_*.csv and return one cleaned dataframe."""
@@ -56,6 +61,40 @@ def load_player_stats_all():
     out["projected_points"] = pd.to_numeric(out["projected_points"], errors="coerce")
     return out
 
+def load_rosters_all():
+    """all_rosters.csv with compact dtypes (int32 ids, categoricals, eligible_mask); empty df if missing."""
+    p = os.path.join(DATA_DIR, "combined", "all_rosters.csv")
+    if not os.path.exists(p):
+        return pd.DataFrame()
+    return compact_rosters(pd.read_csv(p))
+
+def load_player_points_all():
+    """Roster rows joined with weekly player points (scripts/fetch_player_points.py).
+
+    Same column names as load_player_stats_all so player pages can use either.
+    """
+    rosters_path = os.path.join(DATA_DIR, "combined", "all_rosters.csv")
+    points_path = os.path.join(DATA_DIR, "combined", "all_player_points.csv")
+    if not (os.path.exists(rosters_path) and os.path.exists(points_path)):
+        return pd.DataFrame()
+
+    rosters = load_rosters_all()
+    points = pd.read_csv(points_path).drop_duplicates(["year", "week", "player_key"], keep="last")
+    points["player_id"] = pd.to_numeric(points["player_id"], errors="coerce").fillna(0).astype("int32")
+    points["game"] = points["league_key"].astype(str).str.split(".").str[0]
+    rosters["game"] = rosters["team_key"].astype(str).str.split(".").str[0]
+    out = rosters.merge(points[["year", "week", "game", "player_id", "points"]],
+                        on=["year", "week", "game", "player_id"], how="inner")
+
+    scores_path = os.path.join(DATA_DIR, "combined", "all_scores.csv")
+    if os.path.exists(scores_path):
+        teams = pd.read_csv(scores_path, usecols=["season", "week", "team_key", "team", "manager"])
+        out = out.merge(teams.rename(columns={"season": "year"}), on=["year", "week", "team_key"], how="left")
+
+    out = out.rename(columns={"year": "season", "display_position": "position", "points": "actual_points"})
+    out["actual_points"] = pd.to_numeric(out["actual_points"], errors="coerce").fillna(0.0)
+    return out.drop(columns=["game"])
+
 def load_franchise_map():
     """Return franchise map if present; empty df otherwise."""
     p = os.path.join(DATA_DIR, "franchise_map.csv")
@@ -67,33 +106,21 @@ def load_franchise_map():
 
 def attach_franchise(df_scores, franchise_map):
     """
-    Attach franchise_id to scores using simple matching rules:
-    - exact manager match, else
-    - team name appears in any aliases (case-insensitive)
+    Attach franchise_id to scores.
+    - rows with a Yahoo (league_id, team_id) in the ingest-time resolution
+      table (data/combined/franchise_resolution.csv) get it via an integer join
+    - anything else goes through the shared FranchiseResolver:
+      exact manager, exact team alias, then manager name / alias contained
+      in the row (first franchise in map order wins)
+    `franchise_map` may be a franchise_map.csv frame, a flat {name: id} mapping
+    or a prebuilt resolver.
     """
-    if df_scores.empty or franchise_map.empty:
+    if df_scores.empty:
         return df_scores.assign(franchise_id=None)
 
-    # 1) exact manager match
-    left = df_scores.copy()
-    left["manager_l"] = left["manager"].fillna("").str.lower().str.strip()
-    fm = franchise_map.copy()
-    fm["manager_l"] = fm["manager_name"].fillna("").str.lower().str.strip()
-    merged = left.merge(fm[["franchise_id","manager_l"]], on="manager_l", how="left")
-
-    # 2) fill missing by alias contains team
-    mask = merged["franchise_id"].isna()
-    if mask.any():
-        sub = merged[mask].copy()
-        sub["team_l"] = sub["team"].fillna("").str.lower().str.strip()
-        fm2 = franchise_map.copy()
-        fm2["aliases_l"] = fm2["aliases"].fillna("").str.lower()
-        # simple contains (fast); if you need fuzzy, run the suggest tool we made earlier
-        def match_alias(team):
-            for _, r in fm2.iterrows():
-                if team and r["aliases_l"] and team in r["aliases_l"]:
-                    return r["franchise_id"]
-            return None
-        merged.loc[mask, "franchise_id"] = sub["team_l"].map(match_alias)
-
-    return merged.drop(columns=["manager_l"], errors="ignore")
\ No newline at end of file
+    out = attach_franchise_ids(df_scores)
+    pending = out["match_rule"].isna()
+    resolver = FranchiseResolver.coerce(franchise_map)
+    if pending.any() and not resolver.empty:
+        out.loc[pending, "franchise_id"] = resolver.resolve_frame(out[pending])["franchise_id"]
+    return out.drop(columns=["match_rule"])
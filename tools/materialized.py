@@ -0,0 +1,122 @@
+"""
+Versioned store for materialized (precomputed) tables.
+
+Tables live in data/materialized/<name>.csv next to a manifest.json that
+records, per table:
+  - version         bumped on every rebuild (handy as a cache key)
+  - schema_version  bumped in code when a table's columns/meaning change
+  - source          fingerprint of the inputs it was built from
+  - rows, built_at
+
+Readers pass the schema_version they expect; a missing table or one
+built with another schema reads back as an empty DataFrame so pages can
+fall back to computing from raw scores.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+DATA_DIR = "data"
+MATERIALIZED_DIR = os.path.join(DATA_DIR, "materialized")
+MANIFEST_NAME = "manifest.json"
+
+
+def source_fingerprint(paths: Iterable[str]) -> str:
+    """Content hash of the given input files (missing files hash as absent)."""
+    h = hashlib.sha1()
+    for path in sorted(paths):
+        h.update(path.encode("utf-8"))
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        else:
+            h.update(b"<missing>")
+    return h.hexdigest()
+
+
+def load_manifest(out_dir: str = MATERIALIZED_DIR) -> Dict[str, dict]:
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Unreadable materialized manifest {path}: {e}")
+        return {}
+
+
+def _save_manifest(manifest: Dict[str, dict], out_dir: str) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    tmp = os.path.join(out_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, os.path.join(out_dir, MANIFEST_NAME))
+
+
+def table_path(name: str, out_dir: str = MATERIALIZED_DIR) -> str:
+    return os.path.join(out_dir, f"{name}.csv")
+
+
+def table_version(name: str, out_dir: str = MATERIALIZED_DIR) -> int:
+    """Current build number of a table (0 if never built)."""
+    return int(load_manifest(out_dir).get(name, {}).get("version", 0))
+
+
+def is_fresh(name: str, schema_version: int, source: str, out_dir: str = MATERIALIZED_DIR) -> bool:
+    """True if the table exists and was built from ``source`` with this schema."""
+    entry = load_manifest(out_dir).get(name)
+    return (
+        entry is not None
+        and entry.get("schema_version") == schema_version
+        and entry.get("source") == source
+        and os.path.exists(table_path(name, out_dir))
+    )
+
+
+def write_table(
+    name: str,
+    df: pd.DataFrame,
+    schema_version: int,
+    source: str,
+    out_dir: str = MATERIALIZED_DIR,
+) -> int:
+    """Write a table and bump its manifest entry; returns the new version."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = table_path(name, out_dir)
+    tmp = path + ".tmp"
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+    manifest = load_manifest(out_dir)
+    version = int(manifest.get(name, {}).get("version", 0)) + 1
+    manifest[name] = {
+        "version": version,
+        "schema_version": schema_version,
+        "source": source,
+        "rows": int(len(df)),
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    _save_manifest(manifest, out_dir)
+    return version
+
+
+def read_table(name: str, schema_version: Optional[int] = None, out_dir: str = MATERIALIZED_DIR) -> pd.DataFrame:
+    """Read a materialized table; empty if missing or built with another schema."""
+    path = table_path(name, out_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    if schema_version is not None:
+        entry = load_manifest(out_dir).get(name, {})
+        if entry.get("schema_version") != schema_version:
+            return pd.DataFrame()
+    try:
+        return pd.read_csv(path)
+    except Exception as e:
+        print(f"⚠️ Error reading materialized table {path}: {e}")
+        return pd.DataFrame()
@@ -0,0 +1,106 @@
+"""
+Rolling-window and streak engine for momentum metrics.
+
+One vectorized pass over every team-week of every season produces:
+  - momentum       per (season, week, team): rolling mean PF, EWMA form,
+                   current W/L streak and current "beat the league median" streak
+  - streak_records longest win / loss / scoring streaks per team-season and
+                   per franchise (franchise streaks carry across seasons)
+"""
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+from tools.franchise_resolution import attach_franchise_ids
+from tools.franchise_timeline import franchise_keys
+
+# streak_records v2: franchises fall back like franchise_timeline (manager, then team)
+SCHEMA_VERSIONS = {"momentum": 1, "streak_records": 2}
+
+ROLLING_WEEKS = 3
+EWM_SPAN = 4
+
+
+def _run_lengths(df: pd.DataFrame, keys, flag_col: str) -> pd.Series:
+    """Length of the current run of identical ``flag_col`` values within ``keys`` groups."""
+    changed = df[flag_col] != df.groupby(keys, sort=False)[flag_col].shift()
+    run_id = changed.cumsum()
+    return df.groupby(run_id, sort=False).cumcount() + 1
+
+
+def _prepare(scores: pd.DataFrame) -> pd.DataFrame:
+    df = played_weeks(scores)
+    key = "team_key" if "team_key" in df.columns else "team"
+    df = df.assign(team_key=df[key])
+    df = attach_franchise_ids(df)
+    # Same identity as Franchise History, so unmapped franchises still span seasons
+    df["franchise"] = franchise_keys(df).astype(str)
+
+    pf = df["points_for"].to_numpy()
+    pa = df["points_against"].to_numpy()
+    df["result"] = np.select([pf > pa, pf < pa], ["W", "L"], "T")
+    median = df.groupby(["season", "week"])["points_for"].transform("median")
+    df["above_median"] = df["points_for"] > median
+    return df
+
+
+def momentum(scores: pd.DataFrame) -> pd.DataFrame:
+    """Per team-week momentum metrics, computed within each team-season."""
+    df = _prepare(scores).sort_values(["season", "team_key", "week"]).reset_index(drop=True)
+    keys = ["season", "team_key"]
+    g = df.groupby(keys, sort=False)["points_for"]
+
+    df[f"pf_ma{ROLLING_WEEKS}"] = (
+        g.rolling(ROLLING_WEEKS, min_periods=1).mean().reset_index(level=[0, 1], drop=True)
+    )
+    df["pf_ewm"] = g.ewm(span=EWM_SPAN).mean().reset_index(level=[0, 1], drop=True)
+
+    run = _run_lengths(df, keys, "result")
+    df["win_streak"] = np.where(df["result"] == "W", run, np.where(df["result"] == "L", -run, 0))
+    scoring_run = _run_lengths(df, keys, "above_median")
+    df["scoring_streak"] = np.where(df["above_median"], scoring_run, 0)
+
+    cols = [c for c in ["season", "week", "team_key", "team", "manager", "franchise_id"] if c in df.columns]
+    cols += ["points_for", f"pf_ma{ROLLING_WEEKS}", "pf_ewm", "result", "win_streak", "above_median", "scoring_streak"]
+    out = df[cols].copy()
+    out[[f"pf_ma{ROLLING_WEEKS}", "pf_ewm"]] = out[[f"pf_ma{ROLLING_WEEKS}", "pf_ewm"]].round(2)
+    return out
+
+
+def _longest(df: pd.DataFrame, keys, scope: str) -> pd.DataFrame:
+    """Longest W, L and above-median runs per ``keys`` group."""
+    parts = []
+    for col, value, label in [
+        ("result", "W", "longest_win_streak"),
+        ("result", "L", "longest_loss_streak"),
+        ("above_median", True, "longest_scoring_streak"),
+    ]:
+        run = _run_lengths(df, keys, col)
+        best = run.where(df[col] == value, 0).groupby([df[k] for k in keys]).max().rename(label)
+        parts.append(best)
+    out = pd.concat(parts, axis=1).reset_index()
+    return out.assign(scope=scope)
+
+
+def streak_records(scores: pd.DataFrame) -> pd.DataFrame:
+    """Longest streaks per team-season and per franchise (across all seasons)."""
+    df = _prepare(scores)
+
+    season_df = df.sort_values(["season", "team_key", "week"]).reset_index(drop=True)
+    per_season = _longest(season_df, ["season", "team_key"], "season")
+    names = season_df.groupby(["season", "team_key"])[["team", "manager"]].last().reset_index()
+    per_season = per_season.merge(names, on=["season", "team_key"], how="left")
+    per_season["franchise"] = per_season["team_key"]
+
+    all_time_df = df.sort_values(["franchise", "season", "week"]).reset_index(drop=True)
+    all_time = _longest(all_time_df, ["franchise"], "all_time")
+    latest = all_time_df.groupby("franchise")[["team", "manager"]].last().reset_index()
+    all_time = all_time.merge(latest, on="franchise", how="left")
+
+    cols = ["scope", "season", "franchise", "team_key", "team", "manager",
+            "longest_win_streak", "longest_loss_streak", "longest_scoring_streak"]
+    return pd.concat([per_season, all_time], ignore_index=True).reindex(columns=cols)
+
+
+BUILDERS = {"momentum": momentum, "streak_records": streak_records}
@@ -0,0 +1,48 @@
+"""
+Sorted-array percentile index for "how rare is this score" lookups.
+
+Values are sorted once; every query is a binary search (np.searchsorted),
+so a single lookup is O(log n) and a batch of m lookups is O(m log n).
+Build one per metric, e.g. from the team_week_z table:
+
+    idx = PercentileIndex.from_table(z_table, "z_season")
+    idx.percentile(2.5)     # share of team-weeks at or below z = 2.5
+    idx.rank(2.5)           # 1 = best all time
+"""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[float, np.ndarray, pd.Series, list]
+
+
+class PercentileIndex:
+    def __init__(self, values: ArrayLike):
+        arr = np.asarray(values, dtype=float)
+        self.values = np.sort(arr[~np.isnan(arr)])
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, column: str) -> "PercentileIndex":
+        if table.empty or column not in table.columns:
+            return cls([])
+        return cls(pd.to_numeric(table[column], errors="coerce").to_numpy())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def percentile(self, x: ArrayLike):
+        """Fraction of values <= x (0..1)."""
+        if not len(self.values):
+            return np.full(np.shape(x), np.nan) if np.ndim(x) else np.nan
+        return np.searchsorted(self.values, x, side="right") / len(self.values)
+
+    def rank(self, x: ArrayLike):
+        """1-based rank from the top: 1 + number of values strictly greater than x."""
+        return len(self.values) - np.searchsorted(self.values, x, side="right") + 1
+
+    def rarity(self, x: ArrayLike):
+        """'1 in N' frequency of a value at least this high."""
+        above = len(self.values) - np.searchsorted(self.values, x, side="left")
+        return len(self.values) / np.maximum(above, 1)
@@ -0,0 +1,180 @@
+"""
+Player dimension and career index keyed by player_id.
+
+Every roster row (all_rosters.csv, optionally joined with weekly points
+from all_player_points.csv) is sorted by (player_id, season, week) and
+stored column-wise, with an offsets array so one player's full history is
+the single slice ``rows[offsets[i]:offsets[i + 1]]``. The player dimension
+(name, position, seasons, teams, weeks started / benched, points) is one
+row per player in the same order, so lookups are a binary search over the
+sorted player ids:
+
+    idx = PlayerIndex.load()
+    idx.history(30123)       # every week the player was rostered
+    idx.players              # dimension table, one row per player
+
+Persisted to data/combined/player_index.npz at ingest time.
+"""
+
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = "data"
+INDEX_PATH = os.path.join(DATA_DIR, "combined", "player_index.npz")
+
+BENCH_SLOTS = {"BN", "IR", "IR+", "NA"}
+
+# Per-row arrays (one entry per player-week) and per-player dimension arrays
+ROW_COLS = ["season", "week", "team_key", "slot", "started", "points"]
+DIM_COLS = ["player_id", "name", "position", "first_season", "last_season", "seasons",
+            "teams", "weeks", "weeks_started", "weeks_benched", "points", "points_started"]
+
+
+def _codes(values: pd.Series):
+    codes, vocab = pd.factorize(values.fillna("").astype(str), sort=True)
+    return codes.astype(np.int32), vocab.to_numpy(dtype=str)
+
+
+class PlayerIndex:
+    def __init__(self, arrays: dict):
+        self.arrays = arrays
+        self.player_ids = arrays["player_id"]
+        self.offsets = arrays["offsets"]
+
+    # --- build / persist ---
+    @classmethod
+    def build(cls, rosters: pd.DataFrame, points: Optional[pd.DataFrame] = None) -> "PlayerIndex":
+        """Index all_rosters rows; ``points`` is all_player_points.csv (optional)."""
+        df = rosters.dropna(subset=["player_id"]).copy()
+        df["player_id"] = df["player_id"].astype(np.int64)
+        df["points"] = np.nan
+        if points is not None and not points.empty:
+            pts = points.drop_duplicates(["year", "week", "player_key"], keep="last")
+            pts = pd.DataFrame({
+                "year": pts["year"].astype(np.int64),
+                "week": pts["week"].astype(np.int64),
+                "game": pts["league_key"].astype(str).str.split(".").str[0],
+                "player_id": pd.to_numeric(pts["player_id"], errors="coerce").fillna(-1).astype(np.int64),
+                "points": pd.to_numeric(pts["points"], errors="coerce"),
+            })
+            df["game"] = df["team_key"].astype(str).str.split(".").str[0]
+            df = df.drop(columns="points").merge(pts, on=["year", "week", "game", "player_id"], how="left")
+
+        df = df.sort_values(["player_id", "year", "week"], kind="stable").reset_index(drop=True)
+        sel = df["selected_position"].astype(object)
+        df["started"] = sel.notna() & ~sel.isin(BENCH_SLOTS)
+
+        player_ids, starts = np.unique(df["player_id"].to_numpy(), return_index=True)
+        offsets = np.append(starts, len(df)).astype(np.int64)
+        team_codes, team_vocab = _codes(df["team_key"])
+        slot_codes, slot_vocab = _codes(sel)
+
+        last = df.groupby("player_id", sort=True).tail(1).set_index("player_id")
+        g = df.groupby("player_id", sort=True)
+        started_pts = df["points"].where(df["started"])
+        dim = pd.DataFrame({
+            "name": last["player_name"].astype(str),
+            "position": last["display_position"].astype(str),
+            "first_season": g["year"].min(),
+            "last_season": g["year"].max(),
+            "seasons": g["year"].nunique(),
+            "teams": g["team_key"].nunique(),
+            "weeks": g.size(),
+            "weeks_started": g["started"].sum(),
+            "points": g["points"].sum(min_count=1),
+            "points_started": started_pts.groupby(df["player_id"]).sum(min_count=1),
+        }).reindex(player_ids)
+        dim["weeks_benched"] = dim["weeks"] - dim["weeks_started"]
+
+        arrays = {
+            "player_id": player_ids.astype(np.int32),
+            "offsets": offsets,
+            "season": df["year"].to_numpy(np.int16),
+            "week": df["week"].to_numpy(np.int8),
+            "team": team_codes,
+            "team_vocab": team_vocab,
+            "slot": slot_codes,
+            "slot_vocab": slot_vocab,
+            "started": df["started"].to_numpy(bool),
+            "points": df["points"].to_numpy(np.float32),
+        }
+        for c in DIM_COLS[1:]:
+            arrays[f"dim_{c}"] = dim[c].to_numpy(dtype=str if c in ("name", "position") else np.float64)
+        return cls(arrays)
+
+    def save(self, path: str = INDEX_PATH) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, **self.arrays)
+        os.replace(tmp, path)
+        print(f"✅ Player index: {len(self):,} players, {len(self.arrays['season']):,} player-weeks → {path}")
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH) -> Optional["PlayerIndex"]:
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as z:
+            return cls({k: z[k] for k in z.files})
+
+    # --- queries ---
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def position_of(self, player_id: int) -> int:
+        """Row of ``player_id`` in the dimension (-1 if unknown)."""
+        i = int(np.searchsorted(self.player_ids, player_id))
+        return i if i < len(self.player_ids) and self.player_ids[i] == player_id else -1
+
+    @property
+    def players(self) -> pd.DataFrame:
+        """Player dimension, one row per player_id."""
+        out = pd.DataFrame({"player_id": self.player_ids})
+        for c in DIM_COLS[1:]:
+            out[c] = self.arrays[f"dim_{c}"]
+        for c in ["first_season", "last_season", "seasons", "teams", "weeks", "weeks_started", "weeks_benched"]:
+            out[c] = out[c].astype(int)
+        return out
+
+    def history(self, player_id: int) -> pd.DataFrame:
+        """Every rostered week for one player (a single slice of the index)."""
+        i = self.position_of(player_id)
+        if i < 0:
+            return pd.DataFrame(columns=ROW_COLS)
+        a, b = self.offsets[i], self.offsets[i + 1]
+        arr = self.arrays
+        return pd.DataFrame({
+            "season": arr["season"][a:b].astype(int),
+            "week": arr["week"][a:b].astype(int),
+            "team_key": arr["team_vocab"][arr["team"][a:b]],
+            "slot": arr["slot_vocab"][arr["slot"][a:b]],
+            "started": arr["started"][a:b],
+            "points": arr["points"][a:b].astype(float),
+        })
+
+    def seasons(self, player_id: int) -> pd.DataFrame:
+        """Per season / team summary of one player's history."""
+        h = self.history(player_id)
+        if h.empty:
+            return h
+        return h.groupby(["season", "team_key"]).agg(
+            weeks=("week", "count"),
+            weeks_started=("started", "sum"),
+            points=("points", lambda s: s.sum(min_count=1)),
+        ).reset_index()
+
+
+def build_player_index(data_dir: str = DATA_DIR, path: Optional[str] = None) -> Optional[PlayerIndex]:
+    """Rebuild the index from data/combined (rosters plus points when fetched) and persist it."""
+    combined = os.path.join(data_dir, "combined")
+    rosters_path = os.path.join(combined, "all_rosters.csv")
+    if not os.path.exists(rosters_path):
+        print(f"⚠️ No rosters at {rosters_path}; skipping player index.")
+        return None
+    points_path = os.path.join(combined, "all_player_points.csv")
+    points = pd.read_csv(points_path) if os.path.exists(points_path) else None
+    idx = PlayerIndex.build(pd.read_csv(rosters_path), points)
+    idx.save(path or os.path.join(combined, "player_index.npz"))
+    return idx
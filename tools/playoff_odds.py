@@ -0,0 +1,214 @@
+"""
+Monte Carlo playoff odds for a season in progress.
+
+Each team's weekly score is modelled as a normal distribution fitted to its
+played weeks (mean shrunk toward the league mean early in the season). The
+remaining regular-season schedule from scores_<season>.csv is simulated
+n_sims times as one NumPy batch, teams are seeded by wins then points for,
+and the playoff bracket from the league settings (data/debug_settings.json)
+is played out with reseeding: byes for the top seeds, then highest seed vs
+lowest seed every round.
+
+Large runs can be split across a process pool (``workers``); every chunk
+gets an independent child seed so results are reproducible.
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+from tools.standings import is_flag
+
+DATA_DIR = "data"
+
+N_SIMS = 20000
+PRIOR_WEEKS = 3          # weight of the league mean when fitting each team's mean
+MIN_STD = 10.0
+
+DEFAULT_SETTINGS = {"season": None, "playoff_start_week": 15, "num_playoff_teams": 6, "end_week": 17}
+
+
+def load_playoff_settings(data_dir: str = DATA_DIR) -> dict:
+    """Playoff format from the Yahoo league settings payload, with defaults for missing keys."""
+    settings = dict(DEFAULT_SETTINGS)
+    path = os.path.join(data_dir, "debug_settings.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            league = json.load(f)["fantasy_content"]["league"]
+        meta, raw = league[0], league[1]["settings"][0]
+        settings["season"] = int(meta["season"]) if meta.get("season") else None
+        settings["end_week"] = int(meta.get("end_week", settings["end_week"]))
+        settings["playoff_start_week"] = int(raw.get("playoff_start_week", settings["playoff_start_week"]))
+        settings["num_playoff_teams"] = int(raw.get("num_playoff_teams", settings["num_playoff_teams"]))
+    except Exception as e:
+        print(f"⚠️ Could not read playoff settings from {path}: {e}; using defaults")
+
+    teams = settings["num_playoff_teams"]
+    bracket = 1 << max(teams - 1, 0).bit_length()
+    settings["num_byes"] = bracket - teams
+    return settings
+
+
+def season_in_progress(scores: pd.DataFrame, settings: dict) -> bool:
+    """True until every week through the league's end_week has been played."""
+    df = scores[scores["week"] <= settings["end_week"]]
+    if df.empty:
+        return False
+    played = played_weeks(df)
+    return len(played) < len(df) or played.empty or played["week"].max() < settings["end_week"]
+
+
+def _team_index(df: pd.DataFrame):
+    own, opp = ("team_key", "opponent_key") if "opponent_key" in df.columns else ("team", "opponent")
+    teams = sorted(df[own].astype(str).unique())
+    return own, opp, teams, {t: i for i, t in enumerate(teams)}
+
+
+def season_state(scores: pd.DataFrame, settings: dict) -> dict:
+    """Current wins/PF, fitted score distributions and the remaining schedule as index arrays."""
+    df = scores.copy()
+    if "is_playoffs" in df.columns:
+        df = df[~is_flag(df["is_playoffs"])]
+    df = df[df["week"] < settings["playoff_start_week"]]
+    own, opp, teams, idx = _team_index(df)
+    n = len(teams)
+
+    played = played_weeks(df)
+    t = played[own].astype(str).map(idx).to_numpy()
+    pf = played["points_for"].to_numpy(dtype=float)
+    pa = played["points_against"].to_numpy(dtype=float)
+    wins = np.bincount(t, weights=(pf > pa) + 0.5 * (pf == pa), minlength=n)
+    points = np.bincount(t, weights=pf, minlength=n)
+    games = np.bincount(t, minlength=n)
+
+    league_mean = pf.mean() if len(pf) else 100.0
+    league_std = pf.std() if len(pf) > 1 else 25.0
+    mean = (points + PRIOR_WEEKS * league_mean) / (games + PRIOR_WEEKS)
+    sq = np.bincount(t, weights=(pf - mean[t]) ** 2, minlength=n)
+    std = np.sqrt((sq + PRIOR_WEEKS * league_std ** 2) / (games + PRIOR_WEEKS))
+
+    remaining = df.drop(played.index)
+    remaining = remaining[(remaining[own].astype(str) < remaining[opp].astype(str))
+                          & remaining[opp].astype(str).isin(idx)]
+    names = df.sort_values("week").groupby(own)[["team", "manager"]].last() if own == "team_key" else None
+    return {
+        "teams": teams,
+        "names": names,
+        "wins": wins,
+        "points": points,
+        "mean": mean,
+        "std": np.maximum(std, MIN_STD),
+        "home": remaining[own].astype(str).map(idx).to_numpy(),
+        "away": remaining[opp].astype(str).map(idx).to_numpy(),
+    }
+
+
+def _simulate_chunk(state: dict, settings: dict, n_sims: int, seed) -> dict:
+    """Outcome counts for ``n_sims`` simulated seasons."""
+    rng = np.random.default_rng(seed)
+    n = len(state["teams"])
+    mean, std = state["mean"], state["std"]
+    home, away = state["home"], state["away"]
+
+    # Regular season: (sims, games) scores for both sides
+    hs = rng.normal(mean[home], std[home], size=(n_sims, len(home)))
+    as_ = rng.normal(mean[away], std[away], size=(n_sims, len(away)))
+    wins = np.tile(state["wins"], (n_sims, 1))
+    points = np.tile(state["points"], (n_sims, 1))
+    rows = np.arange(n_sims)[:, None]
+    np.add.at(wins, (rows, home), (hs > as_).astype(float))
+    np.add.at(wins, (rows, away), (as_ > hs).astype(float))
+    np.add.at(points, (rows, home), hs)
+    np.add.at(points, (rows, away), as_)
+
+    # Seeds: wins, then points for
+    seed_order = np.lexsort((-points, -wins), axis=1)
+    n_playoff = min(settings["num_playoff_teams"], n)
+    n_byes = min(settings["num_byes"], n_playoff)
+    seeds = seed_order[:, :n_playoff]
+
+    # Playoffs with reseeding, tracked as seed numbers (0 = top seed)
+    alive = np.tile(np.arange(n_playoff), (n_sims, 1))
+    byes, playing = alive[:, :n_byes], alive[:, n_byes:]
+    finalists = None
+    while byes.shape[1] + playing.shape[1] > 1:
+        k = playing.shape[1] // 2
+        if playing.shape[1] + byes.shape[1] == 2:
+            finalists = np.concatenate([byes, playing], axis=1)
+        hi, lo = playing[:, :k], playing[:, ::-1][:, :k]
+        hi_team = np.take_along_axis(seeds, hi, axis=1)
+        lo_team = np.take_along_axis(seeds, lo, axis=1)
+        hi_score = rng.normal(mean[hi_team], std[hi_team])
+        lo_score = rng.normal(mean[lo_team], std[lo_team])
+        winners = np.where(hi_score >= lo_score, hi, lo)
+        playing = np.sort(np.concatenate([byes, winners], axis=1), axis=1)
+        byes = playing[:, :0]
+    champion = np.take_along_axis(seeds, playing, axis=1)[:, 0]
+
+    def count(team_idx):
+        return np.bincount(team_idx.ravel(), minlength=n)
+
+    return {
+        "sims": n_sims,
+        "wins": wins.sum(axis=0),
+        "seed": np.bincount(seed_order.ravel(), weights=np.tile(np.arange(1, n + 1), n_sims), minlength=n),
+        "playoffs": count(seeds),
+        "bye": count(seeds[:, :n_byes]),
+        "final": count(np.take_along_axis(seeds, finalists, axis=1)) if finalists is not None else np.zeros(n),
+        "title": count(champion),
+    }
+
+
+def simulate_playoff_odds(scores: pd.DataFrame, settings: Optional[dict] = None, n_sims: int = N_SIMS,
+                          workers: Optional[int] = None, seed: Optional[int] = None) -> pd.DataFrame:
+    """Playoff, bye, final and title probabilities per team."""
+    settings = settings or load_playoff_settings()
+    state = season_state(scores, settings)
+    if not state["teams"]:
+        return pd.DataFrame()
+
+    workers = max(1, workers or 1)
+    sizes = [n_sims // workers + (1 if i < n_sims % workers else 0) for i in range(workers)]
+    children = np.random.SeedSequence(seed).spawn(workers)
+    if workers == 1:
+        parts = [_simulate_chunk(state, settings, sizes[0], children[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, [state] * workers, [settings] * workers, sizes, children))
+
+    total = {k: sum(p[k] for p in parts) for k in parts[0]}
+    sims = total.pop("sims")
+    out = pd.DataFrame({"team_key": state["teams"]})
+    if state["names"] is not None:
+        out = out.join(state["names"], on="team_key")
+    else:
+        out = out.rename(columns={"team_key": "team"})
+    out["current_wins"] = state["wins"]
+    out["proj_wins"] = (total["wins"] / sims).round(2)
+    out["avg_seed"] = (total["seed"] / sims).round(2)
+    for k in ["playoffs", "bye", "final", "title"]:
+        out[f"{k}_pct"] = (total[k] / sims).round(4)
+    return out.sort_values(["title_pct", "playoffs_pct"], ascending=False).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate playoff odds for a season in progress")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--sims", type=int, default=N_SIMS)
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    scores = pd.read_csv(os.path.join(DATA_DIR, f"scores_{args.season}.csv"))
+    odds = simulate_playoff_odds(scores, n_sims=args.sims, workers=args.workers, seed=args.seed)
+    print(odds.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
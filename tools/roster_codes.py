@@ -0,0 +1,79 @@
+"""
+Compact encodings for roster rows.
+
+Eligible positions are stored as a bitmask over a fixed slot set (one bit
+per Yahoo roster slot), so "can this player fill W/R/T?" is a single
+``mask & bit`` over an array instead of parsing a list per row. The slot
+order is fixed here rather than read from the league settings so a mask
+written for one season still means the same thing in every other.
+
+``compact_rosters`` applies the in-memory dtypes used by the loaders:
+int32 player_id / week / year, uint16 masks and categoricals for the
+repeated position, status and NFL team strings.
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Bit i <-> SLOTS[i]; only ever append, never reorder
+SLOTS = ("QB", "WR", "RB", "TE", "W/R/T", "W/R", "W/T", "Q/W/R/T", "K", "DEF",
+         "D", "DB", "DL", "LB", "BN", "IR")
+SLOT_BITS = {slot: 1 << i for i, slot in enumerate(SLOTS)}
+PRIMARY_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+
+CATEGORICAL_COLS = ["display_position", "selected_position", "status", "nfl_team"]
+
+
+def eligible_mask(positions: Iterable[str]) -> int:
+    """Bitmask for a list of eligible positions (unknown positions are ignored)."""
+    mask = 0
+    for pos in positions:
+        mask |= SLOT_BITS.get(str(pos), 0)
+    return mask
+
+
+def mask_from_strings(eligible: pd.Series) -> np.ndarray:
+    """Masks for comma-separated eligible_positions strings (older all_rosters.csv files)."""
+    uniques, codes = np.unique(eligible.fillna("").astype(str).to_numpy(), return_inverse=True)
+    lookup = np.array([eligible_mask(u.split(",")) if u else 0 for u in uniques], dtype=np.uint16)
+    return lookup[codes]
+
+
+def positions_of(mask: int) -> list:
+    """Slot names set in ``mask``."""
+    return [slot for slot, bit in SLOT_BITS.items() if int(mask) & bit]
+
+
+def can_fill(masks, slot: str) -> np.ndarray:
+    """Boolean array: which rows are eligible for ``slot``."""
+    return (np.asarray(masks, dtype=np.uint16) & SLOT_BITS.get(slot, 0)) != 0
+
+
+def primary_position(masks) -> np.ndarray:
+    """First of QB/RB/WR/TE/K/DEF set in each mask ("" when none is)."""
+    masks = np.asarray(masks, dtype=np.uint16)
+    out = np.full(len(masks), "", dtype=object)
+    for pos in reversed(PRIMARY_POSITIONS):
+        out[(masks & SLOT_BITS[pos]) != 0] = pos
+    return out
+
+
+def compact_rosters(df: pd.DataFrame) -> pd.DataFrame:
+    """Roster rows with compact dtypes (adds eligible_mask from eligible_positions if missing)."""
+    out = df.copy()
+    if "eligible_mask" not in out.columns and "eligible_positions" in out.columns:
+        out["eligible_mask"] = mask_from_strings(out["eligible_positions"])
+        out = out.drop(columns="eligible_positions")
+    if "eligible_mask" in out.columns:
+        out["eligible_mask"] = pd.to_numeric(out["eligible_mask"], errors="coerce").fillna(0).astype(np.uint16)
+
+    out = out.dropna(subset=[c for c in ["player_id"] if c in out.columns])
+    for c in ["player_id", "week", "year", "season"]:
+        if c in out.columns:
+            out[c] = pd.to_numeric(out[c], errors="coerce").fillna(0).astype(np.int32)
+    for c in CATEGORICAL_COLS:
+        if c in out.columns:
+            out[c] = out[c].astype("category")
+    return out
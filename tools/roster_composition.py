@@ -0,0 +1,68 @@
+"""
+Roster composition cube: player counts per (season, week, team, position, slot).
+
+Built once from all_rosters.csv by scripts/materialize_aggregates.py, so the
+Team Stats page reads one team-week slice per card instead of filtering and
+value_counting the roster for every team on every rerun, and the same cube
+answers cross-season questions ("are managers rostering more RBs than they
+used to?") with a single groupby.
+
+position is the player's primary position from eligible_mask (see
+tools/roster_codes.py); rosters written before masks existed fall back to
+the selected slot, or K / DEF from the position type. slot is the
+selected_position (QB, W/R/T, BN, ...).
+"""
+
+import numpy as np
+import pandas as pd
+
+from tools.roster_codes import PRIMARY_POSITIONS, compact_rosters, primary_position
+
+SCHEMA_VERSIONS = {"roster_composition": 1}
+
+CUBE_KEYS = ["season", "week", "team_key", "position", "slot"]
+BENCH_SLOTS = {"BN", "IR", "IR+", "NA"}
+TYPE_POSITIONS = {"K": "K", "DT": "DEF"}
+
+
+def player_positions(df: pd.DataFrame) -> np.ndarray:
+    """Primary position per roster row (see module docstring for the fallbacks)."""
+    pos = primary_position(df["eligible_mask"]) if "eligible_mask" in df.columns else np.full(len(df), "", dtype=object)
+    slot = df["selected_position"].astype(object).to_numpy()
+    missing = pos == ""
+    pos[missing] = np.where(np.isin(slot[missing], PRIMARY_POSITIONS), slot[missing],
+                            pd.Series(df["display_position"].astype(object).to_numpy()[missing])
+                            .map(TYPE_POSITIONS).fillna("Other").to_numpy())
+    return pos
+
+
+def composition_cube(rosters: pd.DataFrame) -> pd.DataFrame:
+    """Long-format cube, one row per non-empty (season, week, team, position, slot) cell."""
+    df = compact_rosters(rosters.rename(columns={"year": "season"}))
+    df["position"] = player_positions(df)
+    df["slot"] = df["selected_position"].astype(object).fillna("BN")
+    cube = df.groupby(CUBE_KEYS, sort=True).size().rename("players").reset_index()
+    cube["starter"] = ~cube["slot"].isin(BENCH_SLOTS)
+    return cube
+
+
+def team_week(cube: pd.DataFrame, season: int, week: int) -> pd.DataFrame:
+    """Players per position for every team in one week (rows: team_key, columns: position)."""
+    part = cube[(cube["season"] == season) & (cube["week"] == week)]
+    return part.pivot_table(index="team_key", columns="position", values="players",
+                            aggfunc="sum", fill_value=0)
+
+
+def position_trends(cube: pd.DataFrame) -> pd.DataFrame:
+    """Average players per team-week by season and position, rostered and started."""
+    team_weeks = cube.groupby("season")[["week", "team_key"]].apply(
+        lambda g: len(g.drop_duplicates())).rename("team_weeks")
+    out = cube.assign(started=np.where(cube["starter"], cube["players"], 0)).groupby(
+        ["season", "position"])[["players", "started"]].sum().reset_index()
+    out = out.merge(team_weeks, on="season")
+    out["rostered_per_team"] = (out["players"] / out["team_weeks"]).round(2)
+    out["started_per_team"] = (out["started"] / out["team_weeks"]).round(2)
+    return out[["season", "position", "rostered_per_team", "started_per_team"]]
+
+
+BUILDERS = {"roster_composition": composition_cube}
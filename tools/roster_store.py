@@ -0,0 +1,191 @@
+"""
+Delta-encoded weekly roster storage.
+
+A team's roster barely changes from one week to the next, so instead of a
+full week_N.json per team per week, each team-season is stored as one
+roster_store.json next to (or in place of) those files:
+
+    {"version": 1,
+     "base_week": 1,
+     "base": [<player>, ...],                       # full week-1 roster
+     "deltas": {"2": {"drop": [player_id, ...],     # left the roster
+                      "put": [<player>, ...],       # new or changed records
+                      "order": [player_id, ...]},   # only if order changed
+                ...}}
+
+Each delta is relative to the previous stored week, so a week is rebuilt by
+replaying deltas from the base. Player records are the dicts yahoo_fantasy_api
+returns from Team.roster(); unchanged players cost nothing after the base.
+
+Legacy week_*.json files are still read for weeks the store does not hold
+(the store always has the latest fetch), so packing old data is optional:
+
+    python -m tools.roster_store            # pack data/raw/api/*/rosters
+    python -m tools.roster_store --remove   # ... and delete the week files
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+STORE_NAME = "roster_store.json"
+STORE_VERSION = 1
+
+Roster = List[dict]
+
+
+def _pid(player: dict):
+    return player.get("player_id")
+
+
+def _delta(prev: Roster, cur: Roster) -> dict:
+    before = {_pid(p): p for p in prev}
+    now_ids = [_pid(p) for p in cur]
+    now = set(now_ids)
+    delta = {}
+
+    drop = [pid for pid in before if pid not in now]
+    put = [p for p in cur if before.get(_pid(p)) != p]
+    if drop:
+        delta["drop"] = drop
+    if put:
+        delta["put"] = put
+
+    # Replaying keeps surviving players in place and appends new ones;
+    # only spell the order out when Yahoo returned something else
+    replayed = [pid for pid in before if pid in now] + [_pid(p) for p in put if _pid(p) not in before]
+    if replayed != now_ids:
+        delta["order"] = now_ids
+    return delta
+
+
+def _apply(prev: Roster, delta: dict) -> Roster:
+    players = {_pid(p): p for p in prev}
+    for pid in delta.get("drop", []):
+        players.pop(pid, None)
+    for p in delta.get("put", []):
+        players[_pid(p)] = p
+    order = delta.get("order")
+    if order is not None:
+        return [players[pid] for pid in order]
+    return list(players.values())
+
+
+def encode_weeks(weeks: Dict[int, Roster]) -> dict:
+    """Store dict for ``{week: roster}`` (base = earliest week)."""
+    if not weeks:
+        return {"version": STORE_VERSION, "base_week": None, "base": [], "deltas": {}}
+    ordered = sorted(weeks)
+    store = {"version": STORE_VERSION, "base_week": ordered[0], "base": weeks[ordered[0]], "deltas": {}}
+    for prev_w, w in zip(ordered, ordered[1:]):
+        store["deltas"][str(w)] = _delta(weeks[prev_w], weeks[w])
+    return store
+
+
+def iter_weeks(store: dict) -> Iterator[Tuple[int, Roster]]:
+    """(week, roster) for every stored week, in order, replaying deltas once."""
+    if store.get("base_week") is None:
+        return
+    roster = store["base"]
+    yield int(store["base_week"]), roster
+    for w in sorted(store.get("deltas", {}), key=int):
+        roster = _apply(roster, store["deltas"][w])
+        yield int(w), roster
+
+
+def decode_weeks(store: dict) -> Dict[int, Roster]:
+    return dict(iter_weeks(store))
+
+
+def read_week(store: dict, week: int) -> Roster:
+    """Roster for a single week (KeyError if it was never stored)."""
+    for w, roster in iter_weeks(store):
+        if w == week:
+            return roster
+    raise KeyError(week)
+
+
+def load_store(path: Path) -> dict:
+    if not path.exists():
+        return encode_weeks({})
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_store(path: Path, weeks: Dict[int, Roster]) -> dict:
+    """Encode ``weeks`` and replace the store atomically."""
+    store = encode_weeks(weeks)
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(store, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return store
+
+
+def _legacy_weeks(team_dir: Path) -> Dict[int, Roster]:
+    weeks = {}
+    for week_file in team_dir.glob("week_*.json"):
+        try:
+            week = int(week_file.stem.split("_")[-1])
+        except ValueError:
+            continue
+        with week_file.open("r", encoding="utf-8") as f:
+            players = json.load(f)
+        if isinstance(players, list):
+            weeks[week] = players
+    return weeks
+
+
+def load_team_weeks(team_dir: Path) -> Dict[int, Roster]:
+    """Every stored week for one team-season: the delta store plus loose files for other weeks."""
+    weeks = _legacy_weeks(team_dir)
+    # save_team_weeks only writes the store, so a re-fetched week must win over its old file
+    weeks.update(decode_weeks(load_store(team_dir / STORE_NAME)))
+    return dict(sorted(weeks.items()))
+
+
+def save_team_weeks(team_dir: Path, new_weeks: Dict[int, Roster]) -> dict:
+    """Merge freshly fetched weeks into the team's store."""
+    team_dir.mkdir(parents=True, exist_ok=True)
+    weeks = decode_weeks(load_store(team_dir / STORE_NAME))
+    weeks.update(new_weeks)
+    return write_store(team_dir / STORE_NAME, weeks)
+
+
+def pack_team_dir(team_dir: Path, remove: bool = False) -> Tuple[int, int]:
+    """Fold loose week_*.json files into the store; returns (bytes before, bytes after)."""
+    loose = sorted(team_dir.glob("week_*.json"))
+    store_path = team_dir / STORE_NAME
+    before = sum(p.stat().st_size for p in loose) + (store_path.stat().st_size if store_path.exists() else 0)
+    weeks = load_team_weeks(team_dir)
+    write_store(store_path, weeks)
+    if remove:
+        for p in loose:
+            p.unlink()
+    return before, store_path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack weekly roster files into delta stores")
+    parser.add_argument("--base", default="data/raw/api")
+    parser.add_argument("--remove", action="store_true", help="Delete week_*.json once packed")
+    args = parser.parse_args()
+
+    total_before = total_after = 0
+    for team_dir in sorted(Path(args.base).glob("*/rosters/*")):
+        if not team_dir.is_dir():
+            continue
+        before, after = pack_team_dir(team_dir, remove=args.remove)
+        total_before += before
+        total_after += after
+    if total_before:
+        print(f"✅ Packed rosters: {total_before / 1024:,.0f} KB → {total_after / 1024:,.0f} KB "
+              f"({total_after / total_before:.0%})")
+    else:
+        print("No roster files found.")
+
+
+if __name__ == "__main__":
+    main()
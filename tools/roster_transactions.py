@@ -0,0 +1,168 @@
+"""
+Roster transaction inference and tenure from weekly roster snapshots.
+
+Consecutive weeks of all_rosters.csv are diffed per league-week with set
+operations on int64 (team, player_id) keys: players present last week but
+not this week were dropped, and players present this week but not last
+week were added. A player who leaves team A for team B in the same week
+that some other player goes from B to A is recorded as a trade on both
+sides; everything else is a plain add/drop.
+
+Events are kept in data/combined/roster_events.csv, with a hash of every
+diffed week's (team, player) set in a .json sidecar, so each run only diffs
+weeks that are new or whose roster (or the week before it) changed since —
+a re-fetched week replaces its earlier events instead of being skipped.
+
+Tenure spans (consecutive weeks a player stayed on one team) are a
+vectorized run-length pass over the roster rows.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = "data"
+EVENTS_PATH = os.path.join(DATA_DIR, "combined", "roster_events.csv")
+
+EVENT_COLS = ["season", "week", "league_key", "team_key", "player_id", "player_name", "event", "counterparty"]
+
+_TEAM_SHIFT = 10_000_000  # player ids stay well below this
+
+
+def _state_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def _load_state(path: str) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(_state_path(path), "r", encoding="utf-8") as f:
+            return json.load(f).get("week_hashes", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _week_hash(week_df: pd.DataFrame) -> str:
+    keys = sorted(zip(week_df["team_key"].astype(str), week_df["player_id"]))
+    return hashlib.sha1(";".join(f"{t}:{p}" for t, p in keys).encode("utf-8")).hexdigest()
+
+
+def _prepare(rosters: pd.DataFrame) -> pd.DataFrame:
+    df = rosters.rename(columns={"year": "season"}).dropna(subset=["player_id", "week"]).copy()
+    df["player_id"] = df["player_id"].astype(np.int64)
+    df["week"] = df["week"].astype(int)
+    df["league_key"] = df["team_key"].astype(str).str.split(".t.").str[0]
+    return df
+
+
+def diff_week(prev: pd.DataFrame, cur: pd.DataFrame) -> pd.DataFrame:
+    """Add / drop / trade events between two weeks of the same league."""
+    teams = pd.Index(sorted(set(prev["team_key"]) | set(cur["team_key"])))
+    prev_keys = teams.get_indexer(prev["team_key"]).astype(np.int64) * _TEAM_SHIFT + prev["player_id"].to_numpy()
+    cur_keys = teams.get_indexer(cur["team_key"]).astype(np.int64) * _TEAM_SHIFT + cur["player_id"].to_numpy()
+
+    dropped = np.setdiff1d(prev_keys, cur_keys)
+    added = np.setdiff1d(cur_keys, prev_keys)
+    drops = pd.DataFrame({"team_key": teams[dropped // _TEAM_SHIFT], "player_id": dropped % _TEAM_SHIFT})
+    adds = pd.DataFrame({"team_key": teams[added // _TEAM_SHIFT], "player_id": added % _TEAM_SHIFT})
+
+    # Player moved A -> B this week; a trade if some player also moved B -> A
+    moves = drops.merge(adds, on="player_id", suffixes=("_from", "_to"))
+    pairs = set(zip(moves["team_key_from"], moves["team_key_to"]))
+    reciprocal = np.array([(b, a) in pairs for a, b in zip(moves["team_key_from"], moves["team_key_to"])], dtype=bool)
+    moves = moves.loc[reciprocal]
+    traded = set(moves["player_id"])
+
+    events = pd.concat([
+        drops.assign(event=np.where(drops["player_id"].isin(traded), "trade_out", "drop")),
+        adds.assign(event=np.where(adds["player_id"].isin(traded), "trade_in", "add")),
+    ], ignore_index=True)
+    counter = pd.concat([
+        moves[["player_id", "team_key_from", "team_key_to"]].rename(columns={"team_key_from": "team_key", "team_key_to": "counterparty"}),
+        moves[["player_id", "team_key_to", "team_key_from"]].rename(columns={"team_key_to": "team_key", "team_key_from": "counterparty"}),
+    ])
+    events = events.merge(counter, on=["team_key", "player_id"], how="left")
+    events.loc[~events["event"].str.startswith("trade"), "counterparty"] = None
+
+    names = pd.concat([prev, cur]).drop_duplicates("player_id", keep="last").set_index("player_id")["player_name"]
+    events["player_name"] = events["player_id"].map(names)
+    return events
+
+
+def update_roster_events(rosters: pd.DataFrame, path: str = EVENTS_PATH, force: bool = False) -> pd.DataFrame:
+    """Diff roster weeks that are new or changed since the last run and store their events."""
+    df = _prepare(rosters)
+    seen = {} if force or not os.path.exists(path) else _load_state(path)
+    hashes: Dict[str, Dict[str, str]] = {}
+    new_parts, redone = [], set()
+
+    for (season, league_key), g in df.groupby(["season", "league_key"], sort=True):
+        by_week = {w: part for w, part in g.groupby("week")}
+        weeks = sorted(by_week)
+        key = str(int(season))
+        old = seen.get(key, {})
+        cur = hashes.setdefault(key, {})
+        cur.update({str(w): _week_hash(by_week[w]) for w in weeks})
+        changed = {w for w in weeks if old.get(str(w)) != cur[str(w)]}
+        for prev_w, w in zip(weeks, weeks[1:]):
+            if w not in changed and prev_w not in changed:
+                continue
+            if str(w) in old:
+                redone.add((int(season), int(w)))
+            ev = diff_week(by_week[prev_w], by_week[w])
+            new_parts.append(ev.assign(season=int(season), week=int(w), league_key=league_key))
+
+    new = pd.concat(new_parts, ignore_index=True).reindex(columns=EVENT_COLS) if new_parts \
+        else pd.DataFrame(columns=EVENT_COLS)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if force or not os.path.exists(path):
+        new.to_csv(path, index=False)
+    elif redone:
+        # A re-fetched week: replace its earlier events rather than appending duplicates
+        events = load_roster_events(path)
+        stale = pd.Series(list(zip(events["season"], events["week"])), index=events.index).isin(redone)
+        pd.concat([events[~stale], new], ignore_index=True).reindex(columns=EVENT_COLS) \
+            .sort_values(["season", "week"], kind="stable").to_csv(path, index=False)
+    elif not new.empty:
+        new.to_csv(path, mode="a", header=False, index=False)
+    with open(_state_path(path), "w", encoding="utf-8") as f:
+        json.dump({"week_hashes": hashes}, f)
+
+    print(f"✅ Roster events: {len(new):,} new ({', '.join(f'{k}={v}' for k, v in new['event'].value_counts().items()) or 'none'}) → {path}")
+    return new
+
+
+def load_roster_events(path: str = EVENTS_PATH) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=EVENT_COLS)
+    return pd.read_csv(path)
+
+
+def tenure_spans(rosters: pd.DataFrame) -> pd.DataFrame:
+    """Runs of consecutive weeks each player spent on each team (run-length over weeks)."""
+    df = _prepare(rosters).sort_values(["season", "team_key", "player_id", "week"]).reset_index(drop=True)
+    same = (df["season"].eq(df["season"].shift()) & df["team_key"].eq(df["team_key"].shift())
+            & df["player_id"].eq(df["player_id"].shift()) & df["week"].sub(df["week"].shift()).eq(1))
+    df["span"] = (~same).cumsum()
+
+    started = df["selected_position"].notna() & ~df["selected_position"].isin(["BN", "IR", "IR+", "NA"]) \
+        if "selected_position" in df.columns else False
+    spans = df.assign(started=started).groupby("span").agg(
+        season=("season", "first"),
+        team_key=("team_key", "first"),
+        player_id=("player_id", "first"),
+        player_name=("player_name", "last"),
+        start_week=("week", "min"),
+        end_week=("week", "max"),
+        weeks=("week", "count"),
+        weeks_started=("started", "sum"),
+    ).reset_index(drop=True)
+
+    season_first = df.groupby("season")["week"].min()
+    season_last = df.groupby("season")["week"].max()
+    spans["acquired"] = np.where(spans["start_week"].eq(spans["season"].map(season_first)), "draft", "in-season")
+    spans["through_season_end"] = spans["end_week"].eq(spans["season"].map(season_last))
+    return spans.sort_values(["season", "team_key", "start_week", "player_name"]).reset_index(drop=True)
@@ -0,0 +1,129 @@
+"""
+Schedule-swap luck simulator.
+
+For each season the regular-season scores become an N × W matrix and the
+schedule an N × W matrix of opponent indexes. Team i's record under team
+j's schedule is evaluated for every (i, j) pair at once with NumPy
+broadcasting over an N × N × W array: i faces whoever j faced that week,
+or j itself in the week j faced i.
+
+  schedule_luck  per (season, team): actual wins vs. the average over
+                 every other schedule, best/worst case, and how hard the
+                 team's own schedule was for everyone else
+  season_swap_wins  the full team × schedule wins matrix for one season
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+from tools.standings import is_flag
+
+SCHEMA_VERSIONS = {"schedule_luck": 1}
+
+
+def _regular_season(scores: pd.DataFrame) -> pd.DataFrame:
+    df = played_weeks(scores)
+    if "is_playoffs" in df.columns:
+        df = df[~is_flag(df["is_playoffs"])]
+    return df
+
+
+def schedule_matrices(season_df: pd.DataFrame) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """(team keys, N × W scores, N × W opponent indexes; -1 where no game)."""
+    own, opp = ("team_key", "opponent_key") if "opponent_key" in season_df.columns else ("team", "opponent")
+    teams = sorted(season_df[own].astype(str).unique())
+    weeks = sorted(season_df["week"].unique())
+    t_idx = {t: i for i, t in enumerate(teams)}
+    w_idx = {w: i for i, w in enumerate(weeks)}
+
+    rows = season_df[own].astype(str).map(t_idx).to_numpy()
+    cols = season_df["week"].map(w_idx).to_numpy()
+    opps = season_df[opp].astype(str).map(t_idx).fillna(-1).astype(int).to_numpy()
+
+    scores = np.full((len(teams), len(weeks)), np.nan)
+    opponents = np.full((len(teams), len(weeks)), -1, dtype=int)
+    scores[rows, cols] = season_df["points_for"].to_numpy(dtype=float)
+    opponents[rows, cols] = opps
+    return teams, scores, opponents
+
+
+def schedule_swap_wins(scores: np.ndarray, opponents: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Wins and games for team i playing team j's schedule, as N × N arrays."""
+    n, w = scores.shape
+    i = np.arange(n)[:, None, None]
+    j = np.arange(n)[None, :, None]
+    opp = np.broadcast_to(opponents[None, :, :], (n, n, w))
+    opp = np.where(opp == i, j, opp)                       # the week j met i, i meets j
+
+    valid = (opp >= 0) & (opp != i)
+    week = np.broadcast_to(np.arange(w)[None, None, :], (n, n, w))
+    own = np.broadcast_to(scores[:, None, :], (n, n, w))
+    theirs = scores[np.clip(opp, 0, None), week]
+    valid &= ~np.isnan(own) & ~np.isnan(theirs)
+
+    wins = np.where(valid, (own > theirs) + 0.5 * (own == theirs), 0.0).sum(axis=2)
+    return wins, valid.sum(axis=2)
+
+
+def season_swap_wins(scores: pd.DataFrame, season) -> pd.DataFrame:
+    """Team × schedule wins matrix for one season's played regular-season weeks, labelled by team name."""
+    df = _regular_season(scores)
+    df = df[df["season"] == season] if "season" in df.columns else df
+    teams, s, o = schedule_matrices(df)
+    if len(teams) < 2:
+        return pd.DataFrame()
+    wins, _ = schedule_swap_wins(s, o)
+    if "opponent_key" in df.columns:
+        names = df.sort_values("week").groupby(df["team_key"].astype(str))["team"].last()
+        teams = [names.get(t, t) for t in teams]
+    return pd.DataFrame(wins, index=teams, columns=teams)
+
+
+def schedule_luck(scores: pd.DataFrame) -> pd.DataFrame:
+    df = _regular_season(scores)
+    own = "team_key" if "opponent_key" in df.columns else "team"
+    parts = []
+    for season, season_df in df.groupby("season", sort=True):
+        teams, s, o = schedule_matrices(season_df)
+        n = len(teams)
+        if n < 2:
+            continue
+        wins, games = schedule_swap_wins(s, o)
+        actual = np.diag(wins)
+        off = ~np.eye(n, dtype=bool)
+        other = np.where(off, wins, np.nan)
+
+        expected = np.nanmean(other, axis=1)
+        # How many wins other teams gain (+) or lose (-) with this team's schedule
+        ease = np.nanmean(np.where(off, wins - actual[:, None], np.nan), axis=0)
+        parts.append(pd.DataFrame({
+            "season": season,
+            own: teams,
+            "games": np.diag(games),
+            "actual_wins": actual,
+            "expected_wins": expected.round(3),
+            "best_wins": np.nanmax(other, axis=1),
+            "worst_wins": np.nanmin(other, axis=1),
+            "pct_schedules_worse": (np.where(off, wins < actual[:, None], False).sum(axis=1) / (n - 1)).round(3),
+            "sos_luck": (actual - expected).round(3),
+            "schedule_ease": ease.round(3),
+        }))
+
+    cols = ["season", own, "team", "manager", "games", "actual_wins", "expected_wins", "best_wins",
+            "worst_wins", "pct_schedules_worse", "sos_luck", "schedule_ease"]
+    if not parts:
+        return pd.DataFrame(columns=cols)
+    out = pd.concat(parts, ignore_index=True)
+    if own == "team_key":
+        names = df.sort_values("week").groupby(["season", "team_key"])[["team", "manager"]].last().reset_index()
+        out = out.merge(names, on=["season", "team_key"], how="left")
+    elif "manager" in df.columns:
+        names = df.sort_values("week").groupby(["season", "team"])["manager"].last().reset_index()
+        out = out.merge(names, on=["season", "team"], how="left")
+    return out.reindex(columns=cols)
+
+
+BUILDERS = {"schedule_luck": schedule_luck}
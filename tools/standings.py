@@ -0,0 +1,69 @@
+"""
+As-of standings cube: cumulative W/L/T, PF, PA, rank and streak for every
+(season, week, team), built with grouped cumulative sums over all seasons.
+
+Regular-season weeks only; every team plays every regular-season week, so
+"standings as of week N" is a single filter on the cube.
+"""
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+
+SCHEMA_VERSIONS = {"standings_cube": 1}
+
+
+def is_flag(series: pd.Series) -> pd.Series:
+    """Boolean view of a True/False/1/0 column that may have been read back as strings."""
+    return series.astype(str).str.strip().str.lower().isin(["true", "1"])
+
+
+def standings_cube(scores: pd.DataFrame) -> pd.DataFrame:
+    df = played_weeks(scores)
+    if "is_playoffs" in df.columns:
+        df = df[~is_flag(df["is_playoffs"])]
+    key = "team_key" if "team_key" in df.columns else "team"
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.sort_values(["season", key, "week"]).reset_index(drop=True)
+    pf = df["points_for"].to_numpy()
+    pa = df["points_against"].to_numpy()
+    df["wins"] = (pf > pa).astype(int)
+    df["losses"] = (pf < pa).astype(int)
+    df["ties"] = (pf == pa).astype(int)
+    df["result"] = np.select([pf > pa, pf < pa], ["W", "L"], "T")
+
+    g = df.groupby(["season", key], sort=False)
+    cum = g[["wins", "losses", "ties", "points_for", "points_against"]].cumsum()
+    df[["wins", "losses", "ties"]] = cum[["wins", "losses", "ties"]]
+    df["pf"] = cum["points_for"].round(2)
+    df["pa"] = cum["points_against"].round(2)
+    df["games"] = g.cumcount() + 1
+    df["win_pct"] = (df["wins"] + 0.5 * df["ties"]) / df["games"]
+
+    # Streak = length of the current run of identical results within team-season
+    new_run = (df["result"] != g["result"].shift()).cumsum()
+    df["streak_len"] = df.groupby(new_run).cumcount() + 1
+    df["streak"] = df["result"] + df["streak_len"].astype(str)
+
+    # Rank within (season, week): win% first, then points for
+    df = df.sort_values(["season", "week", "win_pct", "pf"], ascending=[True, True, False, False])
+    df["rank"] = df.groupby(["season", "week"]).cumcount() + 1
+
+    cols = [c for c in ["season", "week", "team_key", "team", "manager"] if c in df.columns]
+    cols += ["games", "wins", "losses", "ties", "win_pct", "pf", "pa", "rank", "streak", "streak_len"]
+    return df[cols].reset_index(drop=True)
+
+
+def standings_as_of(cube: pd.DataFrame, season: int, week: int) -> pd.DataFrame:
+    """Standings for ``season`` after ``week`` (clamped to the last regular-season week)."""
+    sub = cube[cube["season"] == season]
+    if sub.empty:
+        return sub
+    week = min(int(week), int(sub["week"].max()))
+    return sub[sub["week"] == week].sort_values("rank").reset_index(drop=True)
+
+
+BUILDERS = {"standings_cube": standings_cube}
@@ -1,103 +1,217 @@
 """
 Suggest likely franchise matches for unmatched team/manager names
 across all scores/player_stats data.
+
+Names are looked up through character-trigram indexes (tools/fuzzy_matcher.py)
+over franchise manager names and aliases, so each name is only scored with
+difflib against a handful of pruned candidates instead of every alias.
+
+Usage:
+    python tools/suggest_franchise_matches.py [--top-k 3] [--min-score 0.55]
+    python tools/suggest_franchise_matches.py --benchmark
 """
 
-import pandas as pd
-import os, glob
+import argparse
+import glob
+import os
+import sys
+import time
 from difflib import SequenceMatcher
 
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.fuzzy_matcher import NgramIndex
+
 DATA_DIR = "data"
 COMBINED_DIR = os.path.join(DATA_DIR, "combined")
 MAP_PATH = os.path.join(DATA_DIR, "franchise_map.csv")
+OUT_PATH = os.path.join(DATA_DIR, "franchise_suggestions.csv")
+
 
 # -------------------------------
 # Load combined data
 # -------------------------------
-score_files = glob.glob(os.path.join(DATA_DIR, "scores_*.csv"))
-stats_files = glob.glob(os.path.join(DATA_DIR, "player_stats_*.csv"))
+def load_names():
+    """All unique team/manager combinations across per-season and combined files."""
+    files = (
+        glob.glob(os.path.join(DATA_DIR, "scores_*.csv"))
+        + glob.glob(os.path.join(DATA_DIR, "player_stats_*.csv"))
+        + glob.glob(os.path.join(COMBINED_DIR, "all_scores.csv"))
+    )
+
+    frames = []
+    for f in files:
+        try:
+            df = pd.read_csv(f)
+        except Exception as e:
+            print(f"⚠️ Could not read {f}: {e}")
+            continue
+        df = df.rename(columns={"team_name": "team", "manager_name": "manager"})
+        for c in ["team", "manager"]:
+            if c not in df.columns:
+                df[c] = ""
+        frames.append(df[["team", "manager"]])
 
-frames = []
-for f in score_files + stats_files:
-    try:
-        df = pd.read_csv(f)
-        frames.append(df)
-    except Exception as e:
-        print(f"⚠️ Could not read {f}: {e}")
+    if not frames:
+        raise SystemExit("❌ No data found. Run fetch_all_years.py first.")
 
-if not frames:
-    raise SystemExit("❌ No data found. Run fetch_all_years.py first.")
+    all_data = pd.concat(frames, ignore_index=True)
+    print(f"[Data] Loaded {len(all_data)} rows from {len(frames)} files.")
+
+    teams = all_data.fillna("").astype(str).apply(lambda s: s.str.strip())
+    teams = teams.drop_duplicates().reset_index(drop=True)
+    teams = teams[(teams["team"] != "") | (teams["manager"] != "")]
+    print(f"[Scan] Found {len(teams)} unique team/manager combos to check.")
+    return teams
 
-all_data = pd.concat(frames, ignore_index=True)
-print(f"[Data] Loaded {len(all_data)} rows from {len(frames)} files.")
 
 # -------------------------------
 # Load known franchise map
 # -------------------------------
-if not os.path.exists(MAP_PATH):
-    raise SystemExit("❌ franchise_map.csv not found.")
-franchises = pd.read_csv(MAP_PATH)
-franchises["manager_name"] = franchises["manager_name"].fillna("").str.lower()
-franchises["aliases"] = franchises["aliases"].fillna("").str.lower()
+def load_franchises():
+    if not os.path.exists(MAP_PATH):
+        raise SystemExit("❌ franchise_map.csv not found.")
+    franchises = pd.read_csv(MAP_PATH)
+    franchises["manager_name"] = franchises["manager_name"].fillna("").str.lower()
+    franchises["aliases"] = franchises["aliases"].fillna("").str.lower()
+    return franchises
+
+
+def _aliases(cell):
+    return [a.strip() for a in cell.split(";") if a.strip()]
+
+
+def build_indexes(franchises):
+    """Trigram indexes over franchise manager names and aliases (payload = franchise_id)."""
+    managers = NgramIndex(zip(franchises["manager_name"], franchises["franchise_id"]))
+    aliases = NgramIndex(
+        (alias, fid)
+        for fid, cell in zip(franchises["franchise_id"], franchises["aliases"])
+        for alias in _aliases(cell)
+    )
+    return managers, aliases
+
 
 # -------------------------------
-# Get all unique team/manager names
+# Suggest matches
 # -------------------------------
-teams = (
-    all_data[["team", "manager"]]
-    .drop_duplicates()
-    .reset_index(drop=True)
-)
-teams["team"] = teams["team"].fillna("").str.strip()
-teams["manager"] = teams["manager"].fillna("").str.strip()
-teams = teams[(teams["team"] != "") | (teams["manager"] != "")]
-print(f"[Scan] Found {len(teams)} unique team/manager combos to check.")
+def suggest(teams, franchises, top_k=3, min_score=0.55):
+    """Top-k franchise suggestions per team/manager combo, with scores."""
+    managers, aliases = build_indexes(franchises)
+    suggestions = []
+
+    for team, manager in zip(teams["team"], teams["manager"]):
+        best = {}
+        for index, name, kind in ((managers, manager, "manager"), (aliases, team, "alias")):
+            for fid, matched, score in index.search(name, k=top_k, min_score=min_score):
+                if score > best.get(fid, (0.0,))[0]:
+                    best[fid] = (score, matched, kind)
+
+        ranked = sorted(best.items(), key=lambda kv: -kv[1][0])[:top_k]
+        for rank, (fid, (score, matched, kind)) in enumerate(ranked, start=1):
+            suggestions.append({
+                "team": team,
+                "manager": manager,
+                "rank": rank,
+                "suggested_franchise": fid,
+                "confidence": round(score, 2),
+                "matched_on": kind,
+                "matched_name": matched,
+            })
+
+    return pd.DataFrame(suggestions)
+
 
 # -------------------------------
-# Helper: fuzzy score
+# Benchmark vs. brute force
 # -------------------------------
 def similar(a, b):
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
-# -------------------------------
-# Suggest matches
-# -------------------------------
-suggestions = []
-
-for _, row in teams.iterrows():
-    team = row["team"]
-    manager = row["manager"]
-    best_score = 0
-    best_franchise = None
-
-    for _, f in franchises.iterrows():
-        name_score = similar(manager, f["manager_name"])
-        alias_score = max(
-            [similar(team, a.strip()) for a in f["aliases"].split(";") if a.strip()],
-            default=0
-        )
-        total_score = max(name_score, alias_score)
-
-        if total_score > best_score:
-            best_score = total_score
-            best_franchise = f["franchise_id"]
-
-    if best_score > 0.55:  # adjust threshold as needed
-        suggestions.append({
-            "team": team,
-            "manager": manager,
-            "suggested_franchise": best_franchise,
-            "confidence": round(best_score, 2)
+
+def brute_force_best(teams, franchises):
+    """The original O(names × franchises × aliases) scan; kept for benchmarking."""
+    best_rows = []
+    for team, manager in zip(teams["team"], teams["manager"]):
+        best_score, best_franchise = 0, None
+        for fid, manager_name, cell in zip(franchises["franchise_id"], franchises["manager_name"], franchises["aliases"]):
+            name_score = similar(manager, manager_name)
+            alias_score = max([similar(team, a) for a in _aliases(cell)], default=0)
+            total_score = max(name_score, alias_score)
+            if total_score > best_score:
+                best_score, best_franchise = total_score, fid
+        best_rows.append((best_franchise, best_score))
+    return best_rows
+
+
+def benchmark(teams, franchises, min_score=0.55):
+    print(f"\n⏱️ Benchmark: {len(teams)} names × {len(franchises)} franchises")
+
+    start = time.perf_counter()
+    brute = brute_force_best(teams, franchises)
+    brute_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = suggest(teams, franchises, top_k=1, min_score=0.0)
+    indexed_s = time.perf_counter() - start
+
+    top1 = {}
+    if not indexed.empty:
+        top1 = {(t, m): (fid, c) for t, m, fid, c in
+                zip(indexed["team"], indexed["manager"], indexed["suggested_franchise"], indexed["confidence"])}
+
+    agree = compared = 0
+    for (team, manager), (fid, score) in zip(zip(teams["team"], teams["manager"]), brute):
+        if score <= min_score:
+            continue
+        compared += 1
+        hit = top1.get((team, manager))
+        if hit is not None and (hit[0] == fid or abs(hit[1] - round(score, 2)) < 1e-9):
+            agree += 1
+
+    print(f"   brute force : {brute_s:8.3f}s")
+    print(f"   trigram idx : {indexed_s:8.3f}s  ({brute_s / max(indexed_s, 1e-9):.1f}× faster)")
+    print(f"   top-1 agreement above {min_score}: {agree}/{compared}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-k", type=int, default=3, help="Suggestions to keep per name")
+    parser.add_argument("--min-score", type=float, default=0.55, help="Minimum similarity to report")
+    parser.add_argument("--benchmark", action="store_true", help="Time the trigram index against the brute-force scan")
+    args = parser.parse_args()
+
+    teams = load_names()
+
+    if args.benchmark and not os.path.exists(MAP_PATH):
+        # No map yet: benchmark against the historical names themselves
+        print("ℹ️ franchise_map.csv not found — benchmarking against the historical name set.")
+        franchises = pd.DataFrame({
+            "franchise_id": [f"{t} / {m}" for t, m in zip(teams["team"], teams["manager"])],
+            "manager_name": teams["manager"].str.lower().values,
+            "aliases": teams["team"].str.lower().values,
         })
+        benchmark(teams, franchises, args.min_score)
+        return
 
-# -------------------------------
-# Output results
-# -------------------------------
-if suggestions:
-    out_df = pd.DataFrame(suggestions).sort_values("confidence", ascending=False)
-    out_path = os.path.join(DATA_DIR, "franchise_suggestions.csv")
-    out_df.to_csv(out_path, index=False)
-    print(f"\n✅ Suggestions exported to {out_path}")
-    print(f"Top matches:\n{out_df.head(10)}")
-else:
-    print("🎉 All teams/managers matched or no close matches found.")
\ No newline at end of file
+    franchises = load_franchises()
+    if args.benchmark:
+        benchmark(teams, franchises, args.min_score)
+        return
+
+    # -------------------------------
+    # Output results
+    # -------------------------------
+    out_df = suggest(teams, franchises, top_k=args.top_k, min_score=args.min_score)
+    if not out_df.empty:
+        out_df = out_df.sort_values(["confidence", "rank"], ascending=[False, True])
+        out_df.to_csv(OUT_PATH, index=False)
+        print(f"\n✅ Suggestions exported to {OUT_PATH}")
+        print(f"Top matches:\n{out_df[out_df['rank'] == 1].head(10)}")
+    else:
+        print("🎉 All teams/managers matched or no close matches found.")
+
+
+if __name__ == "__main__":
+    main()
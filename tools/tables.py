@@ -0,0 +1,34 @@
+"""
+Registry of every materialized table: name -> builder / schema version.
+
+scripts/materialize_aggregates.py builds BUILDERS from the combined scores
+and ROSTER_BUILDERS from data/combined/all_rosters.csv, and
+tools.data_loader.load_materialized checks reads against the schema versions.
+FRANCHISE_TABLES also read the franchise resolution table, so their
+freshness depends on it as well as on the scores.
+"""
+
+from tools import aggregates, franchise_timeline, momentum, roster_composition, schedule_luck, standings
+
+BUILDERS = {
+    **aggregates.BUILDERS,
+    **standings.BUILDERS,
+    **momentum.BUILDERS,
+    **franchise_timeline.BUILDERS,
+    **schedule_luck.BUILDERS,
+}
+
+FRANCHISE_TABLES = set(momentum.BUILDERS) | set(franchise_timeline.BUILDERS)
+
+ROSTER_BUILDERS = {
+    **roster_composition.BUILDERS,
+}
+
+SCHEMA_VERSIONS = {
+    **aggregates.SCHEMA_VERSIONS,
+    **standings.SCHEMA_VERSIONS,
+    **momentum.SCHEMA_VERSIONS,
+    **franchise_timeline.SCHEMA_VERSIONS,
+    **schedule_luck.SCHEMA_VERSIONS,
+    **roster_composition.SCHEMA_VERSIONS,
+}
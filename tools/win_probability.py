@@ -0,0 +1,102 @@
+"""
+Live win probability for the current week's matchups.
+
+Each side's final score is modelled as normal around its expected final:
+  mean  = max(projected, actual so far)
+  sd    = sigma * sqrt(share of the projection still to be scored)
+where sigma is the historical standard deviation of (final - projected)
+over completed weeks. P(win) is the normal CDF of the mean difference over
+the combined sd, evaluated for every matchup at once.
+
+When a scores file has no projected_points (older syncs) the team's
+season average stands in for the projection and sigma falls back to the
+spread of team scores around their season averages.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.aggregates import played_weeks
+
+DEFAULT_SIGMA = 22.0
+MIN_REMAINING = 0.1      # never fully certain before Yahoo marks the matchup final
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.vectorize(math.erf)(np.asarray(x, dtype=float) / math.sqrt(2.0)))
+
+
+def _projections(df: pd.DataFrame) -> pd.Series:
+    if "projected_points" in df.columns:
+        proj = pd.to_numeric(df["projected_points"], errors="coerce")
+        if proj.gt(0).any():
+            return proj
+    return pd.Series(np.nan, index=df.index)
+
+
+def projection_error_sd(scores: pd.DataFrame) -> float:
+    """Historical sd of final score around the projection (or around the team's season mean)."""
+    df = played_weeks(scores)
+    if "matchup_status" in df.columns:
+        df = df[df["matchup_status"].fillna("postevent") == "postevent"]
+    proj = _projections(df)
+    done = proj.gt(0)
+    if done.sum() > 30:
+        return float((df.loc[done, "points_for"] - proj[done]).std())
+
+    key = "team_key" if "team_key" in df.columns else "team"
+    resid = df["points_for"] - df.groupby(["season", key])["points_for"].transform("mean")
+    return float(resid.std()) if len(resid) > 30 else DEFAULT_SIGMA
+
+
+def current_week(scores: pd.DataFrame) -> Optional[int]:
+    """First week that is not final yet, else the last week."""
+    if scores.empty:
+        return None
+    if "matchup_status" in scores.columns:
+        live = scores.loc[scores["matchup_status"].fillna("") != "postevent", "week"]
+    else:
+        unplayed = (pd.to_numeric(scores["points_for"], errors="coerce").fillna(0) == 0) & \
+                   (pd.to_numeric(scores["points_against"], errors="coerce").fillna(0) == 0)
+        live = scores.loc[unplayed, "week"]
+    return int(live.min()) if not live.empty else int(scores["week"].max())
+
+
+def win_probabilities(scores: pd.DataFrame, sigma: float = DEFAULT_SIGMA,
+                      week: Optional[int] = None) -> pd.DataFrame:
+    """One row per team in ``week`` (default: the current week) with its live win probability."""
+    week = current_week(scores) if week is None else week
+    if week is None:
+        return pd.DataFrame()
+    own, opp = ("team_key", "opponent_key") if "opponent_key" in scores.columns else ("team", "opponent")
+
+    df = scores[scores["week"] == week].copy()
+    actual = pd.to_numeric(df["points_for"], errors="coerce").fillna(0.0)
+    proj = _projections(df)
+    season_avg = played_weeks(scores[scores["week"] < week]).groupby(own)["points_for"].mean()
+    proj = proj.where(proj.gt(0), df[own].map(season_avg)).fillna(actual)
+
+    final = df["matchup_status"].eq("postevent").to_numpy() if "matchup_status" in df.columns \
+        else np.zeros(len(df), dtype=bool)
+    remaining = np.clip((proj - actual) / proj.where(proj > 0, 1.0), MIN_REMAINING, 1.0).to_numpy()
+    df["expected_final"] = np.maximum(proj.to_numpy(), actual.to_numpy())
+    df["sd"] = np.where(final, 0.0, sigma * np.sqrt(remaining))
+    df.loc[final, "expected_final"] = actual[final]
+
+    side = df.set_index(df[own].astype(str))[["expected_final", "sd"]]
+    opp_side = side.reindex(df[opp].astype(str))
+    diff = df["expected_final"].to_numpy() - opp_side["expected_final"].to_numpy()
+    spread = np.sqrt(df["sd"].to_numpy() ** 2 + opp_side["sd"].to_numpy() ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prob = np.where(spread > 0, _norm_cdf(diff / np.where(spread > 0, spread, 1.0)),
+                        np.where(diff > 0, 1.0, np.where(diff < 0, 0.0, 0.5)))
+
+    df["projected_points"] = proj.round(2)
+    df["expected_final"] = df["expected_final"].round(2)
+    df["win_prob"] = np.round(prob, 4)
+    cols = [c for c in dict.fromkeys(["week", own, opp, "team", "manager", "opponent", "points_for", "projected_points",
+                        "expected_final", "win_prob", "matchup_status"]) if c in df.columns]
+    return df[cols].reset_index(drop=True)